@@ -30,7 +30,8 @@ from modules import (
     PeerConnectionManager, RoomManager, get_db_manager, get_redis_manager,
     DatabaseLogHandler
 )
-from modules.agent import remove_agent
+from modules.agent import remove_agent, run_agent_eviction_loop, replay_transcript_wal
+from modules.database import get_faq_service, close_embeddings
 from routes import (
     health_router, consultation_router, agent_router, logs_router, auth_router,
     signaling_router, init_signaling_managers,
@@ -131,7 +132,7 @@ async def lifespan(app: FastAPI):
         None: 앱이 실행되는 동안 제어를 반환
 
     Note:
-        - 시작: DB 초기화, 로그 핸들러 시작, 서버 시작
+        - 시작: DB 초기화, 로그 핸들러 시작, FAQ 워밍업, 서버 시작
         - 종료: 로그 핸들러 정지, DB 연결 종료, 피어 연결 정리
     """
     global db_log_handler
@@ -154,6 +155,9 @@ async def lifespan(app: FastAPI):
         logging.getLogger().addHandler(db_log_handler)
         await db_log_handler.start()
         logger.info("데이터베이스 로그 핸들러 시작됨")
+
+        # 비정상 종료로 남은 전사 WAL 재적재
+        await replay_transcript_wal()
     else:
         logger.warning("데이터베이스 사용 불가, DB 로깅 없이 실행")
 
@@ -164,16 +168,30 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("Redis 사용 불가, Redis 없이 실행")
 
+    # FAQ 서비스 워밍업 (첫 요청에서 로드 비용을 치르지 않도록)
+    if await get_faq_service().initialize():
+        logger.info("FAQ 서비스 워밍업 완료")
+    else:
+        logger.warning("FAQ 서비스 워밍업 실패, 첫 검색 시 재시도")
+
+    # 유휴 에이전트 주기적 정리
+    agent_eviction_task = asyncio.create_task(run_agent_eviction_loop())
+
     yield
 
     # 서버 종료
     logger.info("서버 종료 중...")
 
+    agent_eviction_task.cancel()
+
     # 데이터베이스 로그 핸들러 정지
     if db_log_handler:
         await db_log_handler.stop()
         logger.info("데이터베이스 로그 핸들러 정지됨")
 
+    # 임베딩 HTTP 커넥션 풀 종료
+    await close_embeddings()
+
     # Redis 연결 종료
     if redis_manager.is_initialized:
         await redis_manager.close()
@@ -249,6 +267,7 @@ async def test_scenario(request: ScenarioTestRequest):
         dict: 각 발화에 대한 에이전트 응답 리스트
     """
     from modules.agent.graph import create_agent_graph
+    from modules.agent.utils.states import Utterance
     from langchain_openai import ChatOpenAI
 
     # LLM 초기화
@@ -286,11 +305,13 @@ async def test_scenario(request: ScenarioTestRequest):
 
         # 대화 기록에 추가
         role = "고객" if speaker == "고객" else "상담사"
-        state["conversation_history"].append({
-            "role": role,
-            "content": text,
-            "timestamp": i
-        })
+        state["conversation_history"].append(Utterance(
+            speaker_id="customer" if role == "고객" else "agent",
+            speaker_name=role,
+            text=text,
+            timestamp=i,
+            is_customer=role == "고객",
+        ))
 
         # 고객 발화일 때만 에이전트 실행
         if speaker == "고객":
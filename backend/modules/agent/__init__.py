@@ -5,12 +5,15 @@ LangGraph 기반 실시간 대화 요약 에이전트를 제공합니다.
 Classes:
     RoomAgent: 방별 에이전트 인스턴스
     ConversationState: 대화 상태 타입
+    Utterance: 대화 이력의 단일 발화
     ContextSchema: 런타임 컨텍스트 스키마
 
 Functions:
     create_agent_graph: LangGraph 에이전트 그래프 생성
     get_or_create_agent: 방별 에이전트 인스턴스 관리
+    get_agent: 기존 에이전트 조회 (LRU 갱신)
     remove_agent: 에이전트 제거
+    evict_idle_agents: 유휴 에이전트 정리
     get_all_agents: 모든 활성 에이전트 조회
 
 Config:
@@ -40,6 +43,7 @@ from .graph import create_agent_graph
 from .utils import (
     ConversationState,
     ContextSchema,
+    Utterance,
 )
 
 # Nodes
@@ -52,6 +56,8 @@ from .utils import (
     create_rag_policy_node,
     create_faq_search_node,
     with_timing,
+    cache_per_llm,
+    route_after_intent,
     # RAG 관련
     rag_policy_search,
     CustomerContext,
@@ -80,6 +86,7 @@ from .utils import (
     get_llm_cache,
     clear_llm_cache,
     get_cache_stats,
+    cached_tokens_handler,
 )
 
 # Schemas
@@ -107,8 +114,11 @@ from .utils import (
 # Manager
 from .manager import (
     RoomAgent,
+    get_agent,
     get_or_create_agent,
     remove_agent,
+    evict_idle_agents,
+    run_agent_eviction_loop,
     room_agents,
 )
 
@@ -118,12 +128,16 @@ from .repository import RoomAgentRepository
 # ContextManager
 from .context_manager import RoomAgentContextManager
 
+# Transcript WAL
+from .transcript_wal import TranscriptWAL, replay_transcript_wal
+
 __all__ = [
     # Graph
     "create_agent_graph",
     # States
     "ConversationState",
     "ContextSchema",
+    "Utterance",
     # Nodes
     "create_summarize_node",
     "create_intent_node",
@@ -133,6 +147,8 @@ __all__ = [
     "create_rag_policy_node",
     "create_faq_search_node",
     "with_timing",
+    "cache_per_llm",
+    "route_after_intent",
     # RAG
     "rag_policy_search",
     "CustomerContext",
@@ -144,12 +160,18 @@ __all__ = [
     # Manager
     "RoomAgent",
     "get_or_create_agent",
+    "get_agent",
     "remove_agent",
+    "evict_idle_agents",
+    "run_agent_eviction_loop",
     "room_agents",
     # Repository
     "RoomAgentRepository",
     # ContextManager
     "RoomAgentContextManager",
+    # Transcript WAL
+    "TranscriptWAL",
+    "replay_transcript_wal",
     # Config
     "llm_config",
     "summary_llm_config",
@@ -164,6 +186,7 @@ __all__ = [
     "get_llm_cache",
     "clear_llm_cache",
     "get_cache_stats",
+    "cached_tokens_handler",
     # Schemas
     "AgentBaseModel",
     "SummaryResult",
@@ -9,9 +9,17 @@ Caching Strategy:
     - 동일한 고객 정보에 대해 동일한 문자열 생성 보장
 """
 
+import hashlib
+import json
 import logging
 from typing import Dict, Any, Optional, List
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # 기본 시스템 메시지 (모든 에이전트 공통)
@@ -46,6 +54,8 @@ class RoomAgentContextManager:
         self._base_system_message = base_system_message or DEFAULT_BASE_SYSTEM_MESSAGE
         self.static_system_prefix = self._base_system_message
         self.system_message = self._base_system_message
+        # 마지막으로 적용한 고객 컨텍스트의 해시 (동일 정보 재설정 시 재생성 생략)
+        self._customer_context_key: Optional[bytes] = None
 
         logger.debug(
             f"[ContextManager] 초기화 완료 - room={room_name}, "
@@ -60,6 +70,7 @@ class RoomAgentContextManager:
         """
         self.static_system_prefix = self._base_system_message
         self.system_message = self._base_system_message
+        self._customer_context_key = None
         logger.debug(f"[ContextManager] 컨텍스트 초기화: {self.room_name}")
 
     def set_customer_context(
@@ -85,6 +96,12 @@ class RoomAgentContextManager:
             logger.warning(f"[ContextManager] 기본 시스템 메시지 없음: {self.room_name}")
             return
 
+        # 컨텍스트에 반영되는 입력(고객 정보 + 최근 3건 이력)이 같으면 그대로 유지
+        context_key = self._customer_context_hash(customer_info, consultation_history)
+        if context_key == self._customer_context_key:
+            logger.debug(f"[ContextManager] 고객 컨텍스트 변경 없음, 유지: {self.room_name}")
+            return
+
         customer_context = self._generate_customer_context(
             customer_info,
             consultation_history
@@ -93,12 +110,35 @@ class RoomAgentContextManager:
         # 정적 접두사 업데이트 (OpenAI Implicit Caching 대상)
         self.static_system_prefix = self._base_system_message + customer_context
         self.system_message = self.static_system_prefix
+        self._customer_context_key = context_key
 
         logger.info(
             f"[ContextManager] 고객 컨텍스트 설정: {self.room_name} - "
             f"{customer_info.get('customer_name')} ({len(self.static_system_prefix)}자)"
         )
 
+    @staticmethod
+    def _customer_context_hash(
+        customer_info: Dict[str, Any],
+        consultation_history: List[Dict[str, Any]]
+    ) -> bytes:
+        """고객 컨텍스트 입력의 안정적인 해시를 계산합니다 (키 순서 무관).
+
+        orjson이 설치되어 있으면 bytes를 바로 직렬화하고, 없으면 표준 json을 사용합니다.
+        """
+        data = [customer_info, (consultation_history or [])[:3]]
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(
+                data,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            )
+        else:
+            payload = json.dumps(
+                data, sort_keys=True, ensure_ascii=False, default=str
+            ).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
     def _generate_customer_context(
         self,
         customer_info: Dict[str, Any],
@@ -5,9 +5,9 @@
       |
       +---> summarize ---------> END
       |
-      +---> intent --> rag_policy ---> END  (정책 RAG 검색)
-      |
-      +---> faq_search --------> END  (FAQ 검색 - STT 직후 바로 실행)
+      +---> intent --(Send)--> rag_policy ---> END  (정책 RAG 검색)
+      |                 \
+      |                  +-(Send)--> faq_search ---> END  (FAQ 검색, 의도 기반 게이트)
       |
       +---> sentiment ---------> END
       |
@@ -30,6 +30,8 @@ from .utils import (
     ContextSchema,
     # Node creators
     with_timing,
+    cache_per_llm,
+    route_after_intent,
     create_summarize_node,
     create_intent_node,
     create_sentiment_node,
@@ -42,9 +44,12 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+@cache_per_llm(maxsize=4)
 def create_agent_graph(llm: BaseChatModel) -> StateGraph:
     """실시간 상담 지원 에이전트 그래프 생성.
 
+    동일한 LLM 인스턴스로 다시 호출하면 컴파일된 그래프를 재사용합니다.
+
     Args:
         llm: LangChain 호환 LLM 인스턴스
 
@@ -56,9 +61,9 @@ def create_agent_graph(llm: BaseChatModel) -> StateGraph:
           |
           +---> summarize ---------> END
           |
-          +---> intent --> rag_policy ---> END  (정책 RAG 검색)
-          |
-          +---> faq_search --------> END  (FAQ 검색 - STT 직후 바로 실행)
+          +---> intent --(Send)--> rag_policy ---> END  (정책 RAG 검색)
+          |                 \
+          |                  +-(Send)--> faq_search ---> END  (FAQ 검색, 의도 기반 게이트)
           |
           +---> sentiment ---------> END
           |
@@ -66,10 +71,19 @@ def create_agent_graph(llm: BaseChatModel) -> StateGraph:
           |
           +---> risk --------------> END
 
+    병렬 실행:
+        - START에서 분기한 5개 노드는 같은 super-step에서 동시에 실행되므로
+          턴 지연은 노드 지연의 합이 아니라 최댓값 (+ intent 이후 rag_policy/faq_search)
+        - 별도의 dispatch/join 노드는 두지 않음 (END로의 팬인이 join 역할)
+
     FAQ 검색 최적화:
-        - faq_search: START에서 바로 분기 (STT 응답 직후 실행)
-        - rag_policy: intent 분석 후 실행 (의도 기반 정책 검색)
-        - FAQ는 intent와 독립적으로 병렬 실행되어 빠른 응답 제공
+        - faq_search: intent 분석 후 Send로 디스패치 (부정 의도면 임베딩 호출 없이 스킵,
+          화이트리스트 의도면 키워드 스캔 생략)
+        - intent는 구조화 출력을 스트리밍하며 라벨이 확정되면 intent_label_preliminary를
+          custom 스트림으로 내보내고 FAQ 검색을 미리 시작 -> faq_search는 그 결과를 await
+          (FAQ 임베딩/검색 지연이 intent LLM의 나머지 생성 시간과 겹침)
+        - rag_policy: intent 분석 후 항상 Send로 디스패치 (의도 결과가 없으면 노드 내부에서
+          스킵하고 last_rag_index만 진행)
     """
 
     graph = StateGraph(
@@ -95,16 +109,15 @@ def create_agent_graph(llm: BaseChatModel) -> StateGraph:
     graph.add_node("rag_policy", rag_policy_node)
     graph.add_node("faq_search", faq_search_node)
 
-    # START에서 병렬 팬아웃 (faq_search도 START에서 바로 분기)
+    # START에서 병렬 팬아웃
     graph.add_edge(START, "summarize")
     graph.add_edge(START, "intent")
     graph.add_edge(START, "sentiment")
     graph.add_edge(START, "draft_reply")
     graph.add_edge(START, "risk")
-    graph.add_edge(START, "faq_search")  # STT 직후 바로 FAQ 검색
 
-    # intent -> rag_policy (의도 분석 후 정책 RAG 검색)
-    graph.add_edge("intent", "rag_policy")
+    # intent -> rag_policy / faq_search (의도 분석 후 Send API로 디스패치)
+    graph.add_conditional_edges("intent", route_after_intent, ["rag_policy", "faq_search"])
 
     # 각 노드에서 END로 "팬인"
     graph.add_edge("summarize", END)
@@ -115,5 +128,5 @@ def create_agent_graph(llm: BaseChatModel) -> StateGraph:
     graph.add_edge("faq_search", END)
 
     compiled_graph = graph.compile()
-    logger.info("[에이전트] 그래프 생성 완료 (faq_search: START에서 바로 실행)")
+    logger.info("[에이전트] 그래프 생성 완료 (rag_policy/faq_search: intent 이후 Send)")
     return compiled_graph
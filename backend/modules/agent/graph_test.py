@@ -17,9 +17,9 @@ LangGraph Server에서 직접 로드 가능 (절대 import 사용).
       |
       +---> summarize ---------> END
       |
-      +---> intent --> rag_policy ---> END
-      |
-      +---> faq_search --------> END
+      +---> intent --(Send)--> rag_policy ---> END
+      |                 \
+      |                  +-(Send)--> faq_search ---> END
       |
       +---> sentiment ---------> END
       |
@@ -47,6 +47,8 @@ from langchain_core.tools import tool
 from modules.agent.utils.states import ConversationState, ContextSchema
 from modules.agent.utils.nodes import (
     with_timing,
+    cache_per_llm,
+    route_after_intent,
     create_summarize_node,
     create_intent_node,
     create_sentiment_node,
@@ -110,10 +112,17 @@ def get_customer_info(customer_id: str) -> str:
 TEST_TOOLS = [search_policy, search_faq, get_customer_info]
 
 
+@cache_per_llm(maxsize=4)
+def _bind_test_tools(llm: BaseChatModel):
+    """TEST_TOOLS를 바인딩한 LLM을 반환합니다 (LLM별 캐싱)."""
+    return llm.bind_tools(TEST_TOOLS)
+
+
 # =============================================================================
 # Graph Factory Functions
 # =============================================================================
 
+@cache_per_llm(maxsize=4)
 def create_test_graph(llm: BaseChatModel) -> StateGraph:
     """테스트용 에이전트 그래프 생성 (graph.py와 동일한 구조).
 
@@ -152,10 +161,9 @@ def create_test_graph(llm: BaseChatModel) -> StateGraph:
     graph.add_edge(START, "sentiment")
     graph.add_edge(START, "draft_reply")
     graph.add_edge(START, "risk")
-    graph.add_edge(START, "faq_search")
 
-    # intent -> rag_policy
-    graph.add_edge("intent", "rag_policy")
+    # intent -> rag_policy / faq_search (Send API)
+    graph.add_conditional_edges("intent", route_after_intent, ["rag_policy", "faq_search"])
 
     # 각 노드에서 END로 팬인
     graph.add_edge("summarize", END)
@@ -170,6 +178,7 @@ def create_test_graph(llm: BaseChatModel) -> StateGraph:
     return compiled_graph
 
 
+@cache_per_llm(maxsize=4)
 def create_tool_calling_graph(llm: BaseChatModel) -> StateGraph:
     """Tool Calling 테스트용 그래프.
 
@@ -183,8 +192,8 @@ def create_tool_calling_graph(llm: BaseChatModel) -> StateGraph:
     Returns:
         컴파일된 StateGraph
     """
-    # LLM에 도구 바인딩
-    llm_with_tools = llm.bind_tools(TEST_TOOLS)
+    # LLM에 도구 바인딩 (LLM별 1회)
+    llm_with_tools = _bind_test_tools(llm)
 
     def agent_node(state: ConversationState):
         """에이전트 노드 - LLM 호출 및 tool call 결정."""
@@ -228,6 +237,7 @@ def create_tool_calling_graph(llm: BaseChatModel) -> StateGraph:
     return compiled_graph
 
 
+@cache_per_llm(maxsize=4)
 def create_sequential_graph(llm: BaseChatModel) -> StateGraph:
     """순차 실행 테스트용 그래프.
 
@@ -13,7 +13,7 @@
     - 상담 세션/전사/에이전트 결과 DB 저장 (Repository 패턴)
 
 Architecture:
-    - room_agents: {room_name: RoomAgent}
+    - room_agents: {room_name: RoomAgent} (LRU 순서, 상한/유휴 시간 초과 시 정리)
     - RoomAgent: 방 하나당 1개 인스턴스, State 유지
     - RoomAgentRepository: DB 영속성 계층 (SRP 분리)
     - llm: 모든 에이전트가 공유하는 LLM 인스턴스 (성능 최적화)
@@ -29,23 +29,31 @@ Example:
     >>> result = await agent.on_new_transcript("고객", "김철수", "환불하고 싶어요")
     >>> print(result)  # {"current_summary": '{"summary": "...", ...}', "last_summarized_index": 1}
 """
+import asyncio
 import logging
+import threading
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 from .graph import create_agent_graph
 from .repository import RoomAgentRepository
 from .context_manager import RoomAgentContextManager
+from .utils.nodes import RECENT_CUSTOMER_MAXLEN
 from .utils import (
     ConversationState,
+    Utterance,
     FINAL_SUMMARY_SYSTEM_PROMPT,
     FinalConsultationSummary,
     llm_config,
     summary_llm_config,
     setup_global_llm_cache,
     get_cache_stats,
+    cache_per_llm,
+    cached_tokens_handler,
 )
+from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain.chat_models import init_chat_model
 
@@ -56,6 +64,51 @@ _cache_setup_done = False
 
 
 
+# 모든 RoomAgent가 공유하는 LLM 인스턴스 (최초 사용 시 초기화)
+_shared_llm: Optional[BaseChatModel] = None
+_shared_summary_llm: Optional[BaseChatModel] = None
+_llm_lock = threading.Lock()
+
+
+def _get_shared_llms() -> Tuple[Optional[BaseChatModel], Optional[BaseChatModel]]:
+    """공유 LLM과 요약 LLM을 반환합니다 (최초 호출 시 한 번만 초기화).
+
+    초기화에 실패한 LLM은 None으로 남겨두고 다음 호출에서 다시 시도합니다.
+
+    Returns:
+        (기본 LLM, 최종 요약 LLM) 튜플
+    """
+    global _shared_llm, _shared_summary_llm
+
+    if _shared_llm is not None and _shared_summary_llm is not None:
+        return _shared_llm, _shared_summary_llm
+
+    with _llm_lock:
+        if _shared_llm is None:
+            logger.info("[에이전트] LLM 초기화 중: %s", llm_config.MODEL)
+            try:
+                _shared_llm = init_chat_model(
+                    llm_config.MODEL,
+                    temperature=llm_config.TEMPERATURE,
+                    reasoning_effort=llm_config.REASONING_EFFORT or "minimal"
+                )
+            except Exception as e:
+                logger.error("[에이전트] LLM 초기화 실패: %s", e)
+
+        if _shared_summary_llm is None:
+            try:
+                logger.debug("[에이전트] 요약 LLM 초기화 중: %s", summary_llm_config.MODEL)
+                _shared_summary_llm = init_chat_model(
+                    summary_llm_config.MODEL,
+                    temperature=summary_llm_config.TEMPERATURE,
+                )
+                logger.info("[에이전트] 요약 LLM 초기화 성공")
+            except Exception as e:
+                logger.error("[에이전트] 요약 LLM 초기화 실패: %s", e)
+
+    return _shared_llm, _shared_summary_llm
+
+
 def _ensure_cache_setup():
     """전역 LLM 캐시가 설정되어 있는지 확인하고, 필요시 설정합니다."""
     global _cache_setup_done
@@ -63,11 +116,94 @@ def _ensure_cache_setup():
         _cache_setup_done = True
         if setup_global_llm_cache():
             stats = get_cache_stats()
-            logger.info(f"[캐시] LLM 캐시 설정 완료: {stats}")
+            logger.info("[캐시] LLM 캐시 설정 완료: %s", stats)
         else:
             logger.info("[캐시] LLM 캐시 비활성화 또는 설정 실패")
 
 
+# 최종 요약 고정 메시지 (모듈 로드 시 1회 생성, 시스템 프롬프트 바이트 고정)
+_FINAL_SUMMARY_SYSTEM_MESSAGE = SystemMessage(content=FINAL_SUMMARY_SYSTEM_PROMPT)
+_FINAL_SUMMARY_HUMAN_PREFIX = "## 전체 상담 대화\n\n"
+
+# LLM 호출 공통 설정 (OpenAI cached_tokens 집계 콜백)
+_LLM_RUN_CONFIG = {"callbacks": [cached_tokens_handler]}
+
+
+@cache_per_llm(maxsize=2)
+def _create_final_summary_llm(llm):
+    """최종 요약용 Structured Output LLM을 LLM 인스턴스당 한 번만 생성합니다."""
+    return llm.with_structured_output(FinalConsultationSummary)
+
+
+# 그래프 state에 원문으로 유지할 최대 발화 수
+# (이전 발화는 summarize 노드의 current_summary에 누적 요약되어 있음)
+MAX_HISTORY_TURNS = 50
+
+# 어떤 노드의 인덱스가 진행되지 않아도 (예: 요약 LLM 연속 실패) 넘지 않는 절대 상한
+# 초과분은 강제로 제거하고, 아직 요약되지 않은 발화는 pending_summary_text로 넘겨
+# 다음 summarize 실행에서 요약에 합침
+MAX_HISTORY_TURNS_HARD = MAX_HISTORY_TURNS * 4
+
+# pending_summary_text 최대 길이 (초과 시 오래된 앞부분부터 잘라냄)
+MAX_PENDING_SUMMARY_CHARS = 8000
+
+# conversation_history 위치를 가리키는 인덱스 필드 (이력 압축 시 함께 이동)
+_HISTORY_INDEX_KEYS = (
+    "last_summarized_index",
+    "last_intent_index",
+    "last_sentiment_index",
+    "last_draft_index",
+    "last_risk_index",
+    "last_rag_index",
+    "last_faq_index",
+)
+
+# 압축 시 위치만 함께 이동하고 압축 범위 계산에는 쓰지 않는 인덱스 필드
+_HISTORY_MARKER_KEYS = ("faq_trigger_index",)
+
+# 초기 상태 템플릿 (불변 값만 보관, 가변 필드는 _initial_state에서 새로 생성)
+_INITIAL_STATE_TEMPLATE: Dict[str, Any] = {
+    "current_summary": "",
+    "last_summarized_index": 0,
+    "customer_info": None,
+    "intent_result": None,
+    "sentiment_result": None,
+    "draft_replies": None,
+    "risk_result": None,
+    "rag_policy_result": None,
+    "faq_result": None,
+    "faq_trigger": False,
+    "faq_category": None,
+    "faq_trigger_index": -1,
+    "has_new_customer_turn": False,
+    "last_intent_index": 0,
+    "last_sentiment_index": 0,
+    "last_draft_index": 0,
+    "last_risk_index": 0,
+    "last_rag_index": 0,
+    "last_faq_index": 0,
+    "last_rag_intent": "",
+    "last_faq_query": "",
+    "pending_summary_text": "",
+}
+
+
+def _initial_state(room_name: str) -> ConversationState:
+    """방의 초기 ConversationState를 생성합니다.
+
+    가변 필드(list/dict/deque)는 방마다 새 객체를 만들어 공유 참조를 방지합니다.
+    """
+    return {
+        **_INITIAL_STATE_TEMPLATE,
+        "room_name": room_name,
+        "conversation_history": [],
+        "summary_result": {},
+        "messages": [],  # MessagesState 필수 필드
+        "consultation_history": [],
+        "recent_customer_utts": deque(maxlen=RECENT_CUSTOMER_MAXLEN),
+    }
+
+
 class RoomAgent:
     """방 하나당 하나의 에이전트 인스턴스.
 
@@ -82,6 +218,26 @@ class RoomAgent:
         save_to_db (bool): DB 저장 활성화 여부
     """
 
+    # 방마다 인스턴스가 생성되므로 인스턴스 __dict__ 없이 슬롯으로 속성 보관
+    __slots__ = (
+        "room_name",
+        "save_to_db",
+        "_context_manager",
+        "_repository",
+        "llm",
+        "llm_available",
+        "summary_llm",
+        "graph",
+        "state",
+        "_formatted_lines",
+        "_graph_runs",
+        "_last_graph_run_at",
+    )
+
+    # 그래프 실행 생략 기준: 요약 이후 새 발화 글자 수 / 직전 실행 이후 경과 시간(초)
+    MIN_SUMMARY_CHARS = 10
+    MIN_SUMMARY_INTERVAL = 2.0
+
     def __init__(self, room_name: str, save_to_db: bool = True):
         """RoomAgent 초기화.
 
@@ -95,72 +251,31 @@ class RoomAgent:
         self.room_name = room_name
         self.save_to_db = save_to_db
 
-        # ContextManager: LLM 컨텍스트 관리 계층 분리
-        self.context_manager = RoomAgentContextManager(room_name)
-
-        # Repository: DB 영속성 계층 분리
-        self.repository = RoomAgentRepository(room_name, save_to_db)
-
-        # LLM 인스턴스 초기화
-        logger.info(f"[에이전트] LLM 초기화 중: {llm_config.MODEL}")
-        try:
-            self.llm = init_chat_model(
-                llm_config.MODEL,
-                temperature=llm_config.TEMPERATURE,
-                reasoning_effort=llm_config.REASONING_EFFORT or "minimal"
-            )
-            self.llm_available = True
-        except Exception as e:
-            logger.error(f"[에이전트] LLM 초기화 실패: {e}")
-            self.llm = None
-            self.llm_available = False
+        # ContextManager/Repository: 첫 사용 시 생성 (입장 직후 나가는 방은 생성하지 않음)
+        self._context_manager: Optional[RoomAgentContextManager] = None
+        self._repository: Optional[RoomAgentRepository] = None
 
-        # 최종 요약 전용 LLM 초기화
-        try:
-            logger.debug(f"[에이전트] 요약 LLM 초기화 중: {summary_llm_config.MODEL}")
-            self.summary_llm = init_chat_model(
-                summary_llm_config.MODEL,
-                temperature=summary_llm_config.TEMPERATURE,
-            )
-            logger.info("[에이전트] 요약 LLM 초기화 성공")
-        except Exception as e:
-            logger.error(f"[에이전트] 요약 LLM 초기화 실패: {e}")
-            self.summary_llm = None
+        # 모든 방이 공유하는 LLM 인스턴스 (HTTP 커넥션 풀 재사용)
+        self.llm, self.summary_llm = _get_shared_llms()
+        self.llm_available = self.llm is not None
 
         # LangGraph 그래프 생성
         if self.llm_available:
             self.graph = create_agent_graph(self.llm)
         else:
             self.graph = None
-            logger.warning(f"[에이전트] RoomAgent 생성됨 (LLM 없음): {room_name}")
-
-        self.state: ConversationState = {
-            "room_name": room_name,
-            "conversation_history": [],
-            "current_summary": "",
-            "last_summarized_index": 0,
-            "summary_result": {},
-            "messages": [],
-            "customer_info": None,
-            "consultation_history": [],
-            "intent_result": None,
-            "sentiment_result": None,
-            "draft_replies": None,
-            "risk_result": None,
-            "rag_policy_result": None,
-            "faq_result": None,
-            "has_new_customer_turn": False,
-            "last_intent_index": 0,
-            "last_sentiment_index": 0,
-            "last_draft_index": 0,
-            "last_risk_index": 0,
-            "last_rag_index": 0,
-            "last_faq_index": 0,
-            "last_rag_intent": "",
-            "last_faq_query": "",
-        }
+            logger.warning("[에이전트] RoomAgent 생성됨 (LLM 없음): %s", room_name)
+
+        self.state: ConversationState = _initial_state(room_name)
 
-        logger.info(f"[에이전트] RoomAgent 생성: {room_name}")
+        # 최종 요약용 대화 텍스트 라인 (전사 수신 시 증분 추가, 이력 압축과 무관하게 전체 보존)
+        self._formatted_lines: List[str] = []
+        # 실행 중인 그래프 수 (이력 압축 가능 여부 판단)
+        self._graph_runs = 0
+        # 직전 그래프 실행 시작 시각 (monotonic)
+        self._last_graph_run_at = 0.0
+
+        logger.info("[에이전트] RoomAgent 생성: %s", room_name)
 
     async def on_new_transcript(
         self,
@@ -172,6 +287,7 @@ class RoomAgent:
         on_update=None,
         turn_id: Optional[str] = None,
         is_customer: bool = False,
+        on_delta=None,
     ) -> Dict[str, Any]:
         """새로운 transcript를 받아 에이전트를 실행합니다 (비스트리밍).
 
@@ -184,6 +300,8 @@ class RoomAgent:
             on_update (Callable): 그래프 노드별 업데이트 콜백 (stream_mode="updates"에서 사용)
             turn_id (str | None): 이 요약 실행을 식별하기 위한 ID (없으면 자동 생성)
             is_customer (bool): 고객 발화 여부 (True면 의도 분석 노드 활성화)
+            on_delta (Callable): LLM 토큰 델타 콜백 (지정 시 stream_mode="messages" 추가)
+                {"turn_id": str, "node": str, "delta": str} 형태로 호출됨
 
         Returns:
             Dict[str, Any]: {"summary_result": dict, "last_summarized_index": int}
@@ -197,129 +315,163 @@ class RoomAgent:
         if timestamp is None:
             timestamp = time.time()
 
+        # 최근 고객 발화 버퍼 갱신 (검색 노드가 이력을 역순회하지 않도록)
+        if is_customer or speaker_name.startswith("고객"):
+            self.state["recent_customer_utts"].append(
+                (len(self.state["conversation_history"]), text)
+            )
+
         # State에 새 transcript 추가 (is_customer 플래그 포함)
-        self.state["conversation_history"].append({
-            "speaker_id": speaker_id,
-            "speaker_name": speaker_name,
-            "text": text,
-            "timestamp": timestamp,
-            "is_customer": is_customer,
-        })
+        self.state["conversation_history"].append(Utterance(
+            speaker_id=speaker_id,
+            speaker_name=speaker_name,
+            text=text,
+            timestamp=timestamp,
+            is_customer=is_customer,
+        ))
+        self._formatted_lines.append(f"[{speaker_id or 'unknown'}] {speaker_name}: {text}")
 
         # 고객 발화인 경우 플래그 설정
         if is_customer:
             self.state["has_new_customer_turn"] = True
 
-        logger.info(
-            f"[에이전트] 새 전사: {self.room_name} - "
-            f"{speaker_name}: {text[:50]}..."
-        )
-        logger.info(f"[에이전트] 대화 이력 수: {len(self.state['conversation_history'])}")
+        logger.info("[에이전트] 새 전사: %s - %s: %.50s...", self.room_name, speaker_name, text)
+        logger.info("[에이전트] 대화 이력 수: %d", len(self.state["conversation_history"]))
 
-        # DB에 전사 저장 (Repository 위임)
-        await self.repository.save_transcript(
+        # DB에 전사 저장 (Repository 위임, 대기열에 추가 후 백그라운드에서 일괄 저장)
+        self.repository.save_transcript(
             speaker_type="customer" if is_customer else "agent",
             speaker_name=speaker_name,
             text=text,
-            timestamp=datetime.fromtimestamp(timestamp)
+            timestamp=timestamp
         )
 
         # 요약 생략 요청 시 히스토리만 기록
         if not run_summary:
-            return {
-                "summary_result": self.state.get("summary_result", {}),
-                "current_summary": self.state.get("current_summary", ""),
-                "last_summarized_index": self.state.get("last_summarized_index", 0),
-                "intent_result": self.state.get("intent_result", None),
-                "sentiment_result": self.state.get("sentiment_result", None),
-                "draft_replies": self.state.get("draft_replies", None),
-                "risk_result": self.state.get("risk_result", None),
-                "rag_policy_result": self.state.get("rag_policy_result", None),
-                "faq_result": self.state.get("faq_result", None),
-            }
+            return self._current_results()
+
+        # 상담사의 짧은 발화("네", "음...")가 직전 실행 직후 들어오면 그래프 실행 생략
+        if not is_customer and self._is_low_signal_turn():
+            logger.debug("[에이전트] 변화량 적은 발화, 그래프 실행 생략: %s", self.room_name)
+            return self._current_results()
 
         # LLM 없으면 요약 생성 스킵 (transcript는 이미 추가됨)
         if not self.llm_available:
-            logger.warning(f"[에이전트] LLM 없음: {self.room_name}")
+            logger.warning("[에이전트] LLM 없음: %s", self.room_name)
             return {"error": {"message": "LLM not available"}}
 
-        # LangGraph 스트리밍 실행 (stream_mode="updates"로 노드별 업데이트 전달)
-        logger.info(f"[에이전트] 그래프 스트리밍 시작: {self.room_name}")
-        stream_turn_id = turn_id or f"{self.room_name}-{int(time.time() * 1000)}"
+        # LangGraph 스트리밍 실행 (updates: 노드별 업데이트, custom: 노드 내부 부분 결과)
+        logger.info("[에이전트] 그래프 스트리밍 시작: %s", self.room_name)
+        stream_turn_id = turn_id or f"{self.room_name}-{time.time_ns() // 1_000_000}"
 
         try:
             latest_updates: Dict[str, Any] = {}
+            merge_update = latest_updates.update
+            has_callback = callable(on_update)
 
             # Runtime Context를 context= 파라미터로 전달 (ContextManager 위임)
             # LangGraph는 context_schema에 맞는 dict를 context=로 전달받아
             # 각 노드의 runtime.context에 주입함
-            async for update in self.graph.astream(
-                {**self.state},
-                stream_mode="updates",
-                context=self.context_manager.get_graph_context(),
-            ):
-                if not update:
-                    continue
-
-                for node_name, payload in update.items():
-                    if not payload:
+            # 토큰 스트리밍은 구독자가 있을 때만 활성화 (토큰당 콜백 비용 회피)
+            stream_modes = ["updates", "custom"]
+            if callable(on_delta):
+                stream_modes.append("messages")
+
+            self._graph_runs += 1
+            self._last_graph_run_at = time.monotonic()
+            try:
+                # 체크포인터 없이 실행하므로 입력 state는 채널에 키 단위 참조로만 기록됨
+                # (대화 이력 복사/직렬화 없음) -> 매 턴 dict 사본을 만들지 않고 그대로 전달
+                async for mode, update in self.graph.astream(
+                    self.state,
+                    stream_mode=stream_modes,
+                    context=self.context_manager.get_graph_context(),
+                    config=_LLM_RUN_CONFIG,
+                ):
+                    if not update:
+                        continue
+
+                    # "messages" 스트림: (메시지 청크, 메타데이터) 튜플 -> 토큰 델타 전달
+                    if mode == "messages":
+                        chunk, metadata = update
+                        delta = chunk.content if isinstance(chunk.content, str) else ""
+                        if delta:
+                            await on_delta({
+                                "turn_id": stream_turn_id,
+                                "node": metadata.get("langgraph_node", ""),
+                                "delta": delta,
+                            })
+                        continue
+
+                    # 콜백이 없으면 노드 이름이 필요 없으므로 상태 병합만 수행
+                    if not has_callback:
+                        if mode == "updates":
+                            for payload in update.values():
+                                if payload:
+                                    merge_update(payload)
                         continue
 
-                    # 실시간 콜백으로 WebSocket 브로드캐스트
-                    if callable(on_update):
+                    for node_name, payload in update.items():
+                        if not payload:
+                            continue
+
+                        # 실시간 콜백으로 WebSocket 브로드캐스트
                         await on_update({
                             "turn_id": stream_turn_id,
                             "node": node_name,
                             "data": payload,
                         })
 
-                    # 마지막 결과 저장 (노드별 최신값)
-                    latest_updates.update(payload)
+                        # 마지막 결과 저장 (노드별 최신값, 부분 결과는 상태에 반영하지 않음)
+                        if mode == "updates":
+                            merge_update(payload)
+            finally:
+                self._graph_runs -= 1
 
-            # 그래프 실행 후 상태 적용
+            # 그래프 실행 후 상태 적용 (결과/인덱스/쿼리 모두 한 번에 병합,
+            # 갱신되지 않은 필드는 이전 값 유지)
+            state = self.state
             if latest_updates:
-                self.state.update(latest_updates)
-
-            summary_result = latest_updates.get("summary_result", self.state.get("summary_result", {}))
-            current_summary = latest_updates.get("current_summary", self.state.get("current_summary", ""))
-            last_summarized_index = latest_updates.get("last_summarized_index", self.state.get("last_summarized_index", 0))
-
-            intent_result = latest_updates.get("intent_result", self.state.get("intent_result"))
-            sentiment_result = latest_updates.get("sentiment_result", self.state.get("sentiment_result"))
-            draft_replies = latest_updates.get("draft_replies", self.state.get("draft_replies"))
-            risk_result = latest_updates.get("risk_result", self.state.get("risk_result"))
-            rag_policy_result = latest_updates.get("rag_policy_result", self.state.get("rag_policy_result"))
-            faq_result = latest_updates.get("faq_result", self.state.get("faq_result"))
-
-            # State 업데이트 (보존 필드 포함)
-            self.state["summary_result"] = summary_result
-            self.state["current_summary"] = current_summary
-            self.state["last_summarized_index"] = last_summarized_index
-            self.state["intent_result"] = intent_result
-            self.state["sentiment_result"] = sentiment_result
-            self.state["draft_replies"] = draft_replies
-            self.state["risk_result"] = risk_result
-            self.state["rag_policy_result"] = rag_policy_result
-            self.state["faq_result"] = faq_result
+                state.update(latest_updates)
 
             # 그래프 실행 완료 후 고객 발화 플래그 리셋
-            self.state["has_new_customer_turn"] = False
-
-            # 인덱스 및 쿼리 업데이트 (그래프에서 반환한 값 사용)
-            for idx_key in ["last_intent_index", "last_sentiment_index", "last_draft_index", "last_risk_index", "last_rag_index", "last_faq_index", "last_rag_intent", "last_faq_query"]:
-                if idx_key in latest_updates:
-                    self.state[idx_key] = latest_updates[idx_key]
-
-            logger.info(f"[에이전트] 요약 생성: {current_summary[:100]}...")
-            logger.info(f"[에이전트] 요약 인덱스: {last_summarized_index}")
-            logger.info(f"[에이전트] 의도: {intent_result}, 감정: {sentiment_result}, 위험: {risk_result}")
-            if rag_policy_result:
-                logger.info(f"[RAG] 정책 결과: {len(rag_policy_result.get('recommendations', []))}개 추천")
-            if faq_result:
-                logger.info(f"[FAQ] 결과: {len(faq_result.get('faqs', []))}개, 캐시={faq_result.get('cache_hit')}")
-
-            # DB에 에이전트 결과 저장 (Repository 위임)
-            await self.repository.save_agent_results(
+            state["has_new_customer_turn"] = False
+
+            state_get = state.get
+            summary_result = state_get("summary_result", {})
+            current_summary = state_get("current_summary", "")
+            last_summarized_index = state_get("last_summarized_index", 0)
+            intent_result = state_get("intent_result")
+            sentiment_result = state_get("sentiment_result")
+            draft_replies = state_get("draft_replies")
+            risk_result = state_get("risk_result")
+            rag_policy_result = state_get("rag_policy_result")
+            faq_result = state_get("faq_result")
+
+            # 실행 중인 그래프가 없을 때만 이력 압축 (실행 중 인덱스가 어긋나지 않도록)
+            if not self._graph_runs:
+                self._compact_history()
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[에이전트] 요약 생성: %.100s...", current_summary)
+                logger.info("[에이전트] 요약 인덱스: %s", last_summarized_index)
+                logger.info(
+                    "[에이전트] 의도: %s, 감정: %s, 위험: %s",
+                    intent_result, sentiment_result, risk_result,
+                )
+                if rag_policy_result:
+                    logger.info(
+                        "[RAG] 정책 결과: %d개 추천",
+                        len(rag_policy_result.get("recommendations", [])),
+                    )
+                if faq_result:
+                    logger.info(
+                        "[FAQ] 결과: %d개, 캐시=%s",
+                        len(faq_result.get("faqs", [])), faq_result.get("cache_hit"),
+                    )
+
+            # DB에 에이전트 결과 저장 (Repository 위임, 백그라운드 저장이라 기다리지 않음)
+            self.repository.save_agent_results(
                 turn_id=stream_turn_id,
                 intent_result=intent_result,
                 sentiment_result=sentiment_result,
@@ -342,9 +494,92 @@ class RoomAgent:
             }
 
         except Exception as e:
-            logger.error(f"[에이전트] 실행 오류: {e}", exc_info=True)
+            logger.error("[에이전트] 실행 오류: %s", e, exc_info=True)
             return {"error": {"message": str(e)}}
-    
+
+    def _current_results(self) -> Dict[str, Any]:
+        """그래프를 실행하지 않을 때 반환할 현재 상태의 결과 필드."""
+        state_get = self.state.get
+        return {
+            "summary_result": state_get("summary_result", {}),
+            "current_summary": state_get("current_summary", ""),
+            "last_summarized_index": state_get("last_summarized_index", 0),
+            "intent_result": state_get("intent_result", None),
+            "sentiment_result": state_get("sentiment_result", None),
+            "draft_replies": state_get("draft_replies", None),
+            "risk_result": state_get("risk_result", None),
+            "rag_policy_result": state_get("rag_policy_result", None),
+            "faq_result": state_get("faq_result", None),
+        }
+
+    def _is_low_signal_turn(self) -> bool:
+        """요약 이후 새 발화량이 적고 직전 그래프 실행과 간격이 짧은지 확인합니다."""
+        if time.monotonic() - self._last_graph_run_at >= self.MIN_SUMMARY_INTERVAL:
+            return False
+
+        history = self.state["conversation_history"]
+        pending_chars = 0
+        for entry in islice(history, self.state.get("last_summarized_index", 0), None):
+            pending_chars += len(entry.text.strip())
+            if pending_chars >= self.MIN_SUMMARY_CHARS:
+                return False
+        return True
+
+    def _compact_history(self) -> None:
+        """모든 노드가 처리하고 요약까지 끝난 오래된 발화를 state에서 제거합니다.
+
+        최근 MAX_HISTORY_TURNS개 발화만 원문으로 유지하고, 제거한 수만큼
+        인덱스 필드와 최근 고객 발화 버퍼의 위치를 앞당깁니다.
+
+        인덱스가 진행되지 않아 MAX_HISTORY_TURNS_HARD를 넘으면 강제로 제거합니다.
+        이때 요약되지 않은 발화는 pending_summary_text에 쌓아 다음 요약에 합치고,
+        처리하지 못한 노드의 인덱스는 0으로 맞춥니다.
+        """
+        state = self.state
+        history = state["conversation_history"]
+        overflow = len(history) - MAX_HISTORY_TURNS
+        if overflow <= 0:
+            return
+
+        # 아직 어떤 노드라도 처리하지 않은 발화는 제거하지 않음
+        drop = min(overflow, *(state.get(key, 0) for key in _HISTORY_INDEX_KEYS))
+        if len(history) > MAX_HISTORY_TURNS_HARD:
+            drop = overflow
+            last_summarized_index = state.get("last_summarized_index", 0)
+            if last_summarized_index < drop:
+                # 요약 전에 제거되는 발화는 텍스트로 보존 (다음 summarize에서 요약에 합침)
+                unsummarized = "\n".join(
+                    f"{entry.speaker_name}: {entry.text}"
+                    for entry in history[last_summarized_index:drop]
+                )
+                pending = state.get("pending_summary_text", "")
+                pending = f"{pending}\n{unsummarized}" if pending else unsummarized
+                state["pending_summary_text"] = pending[-MAX_PENDING_SUMMARY_CHARS:]
+            logger.warning(
+                "[에이전트] 대화 이력 상한 초과, 강제 압축: %s - %d개 발화 (요약 대기 %d개)",
+                self.room_name, drop, max(drop - last_summarized_index, 0),
+            )
+        if drop <= 0:
+            return
+
+        # 새 리스트로 교체 (이전 그래프 입력이 참조하던 리스트는 변경하지 않음)
+        state["conversation_history"] = history[drop:]
+        for key in _HISTORY_INDEX_KEYS:
+            state[key] = max(state.get(key, 0) - drop, 0)
+        for key in _HISTORY_MARKER_KEYS:
+            state[key] = state.get(key, -1) - drop
+
+        recent = state["recent_customer_utts"]
+        shifted = [(idx - drop, text) for idx, text in recent if idx >= drop]
+        recent.clear()
+        recent.extend(shifted)
+
+        logger.debug("[에이전트] 대화 이력 압축: %s - %d개 발화 제거", self.room_name, drop)
+
+    @property
+    def transcript_count(self) -> int:
+        """세션 전체 발화 수 (이력 압축과 무관)."""
+        return len(self._formatted_lines)
 
     def reset(self):
         """에이전트 상태를 초기화합니다.
@@ -352,41 +587,49 @@ class RoomAgent:
         Note:
             방이 종료되거나 새로운 세션을 시작할 때 사용
         """
-        logger.info(f"[에이전트] 상태 초기화: {self.room_name}")
-        self.state = {
-            "room_name": self.room_name,
-            "conversation_history": [],
-            "current_summary": "",
-            "last_summarized_index": 0,
-            "summary_result": {},
-            "messages": [],  # MessagesState 필수 필드
-            "customer_info": None,
-            "consultation_history": [],
-            "intent_result": None,
-            "sentiment_result": None,
-            "draft_replies": None,
-            "risk_result": None,
-            "rag_policy_result": None,
-            "faq_result": None,
-            "has_new_customer_turn": False,
-            "last_intent_index": 0,
-            "last_sentiment_index": 0,
-            "last_draft_index": 0,
-            "last_risk_index": 0,
-            "last_rag_index": 0,
-            "last_faq_index": 0,
-            "last_rag_intent": "",
-            "last_faq_query": "",
-        }
+        logger.info("[에이전트] 상태 초기화: %s", self.room_name)
+        self.state = _initial_state(self.room_name)
+        self._formatted_lines = []
+        self._graph_runs = 0
+        self._last_graph_run_at = 0.0
         # ContextManager 초기화 (시스템 메시지 리셋)
-        self.context_manager.reset()
+        if self._context_manager is not None:
+            self._context_manager.reset()
         # Repository 초기화 (세션 정보 포함)
-        self.repository.reset()
+        if self._repository is not None:
+            self._repository.reset()
+
+    def close(self):
+        """에이전트가 보유한 상태와 리소스를 즉시 해제합니다 (에이전트 제거 시 호출).
+
+        대화 이력/컨텍스트를 비워 남아 있는 태스크 참조가 있어도 큰 상태가 GC 전까지
+        유지되지 않도록 합니다. 저장 대기 중인 전사는 flush 루프가 저장과 fsync를 마친 뒤
+        WAL을 닫으며, 유휴 flush 루프만 즉시 취소됩니다.
+        """
+        self.reset()
+        if self._repository is not None:
+            self._repository.close()
+
+    @property
+    def context_manager(self) -> RoomAgentContextManager:
+        """LLM 컨텍스트 관리 계층 (첫 사용 시 생성)."""
+        if self._context_manager is None:
+            self._context_manager = RoomAgentContextManager(self.room_name)
+        return self._context_manager
+
+    @property
+    def repository(self) -> RoomAgentRepository:
+        """DB 영속성 계층 (첫 사용 시 생성)."""
+        if self._repository is None:
+            self._repository = RoomAgentRepository(self.room_name, self.save_to_db)
+        return self._repository
 
     @property
     def session_id(self) -> Optional[UUID]:
-        """현재 세션 ID (Repository 위임)."""
-        return self.repository.session_id
+        """현재 세션 ID (Repository 위임, Repository가 없으면 None)."""
+        if self._repository is None:
+            return None
+        return self._repository.session_id
 
     @session_id.setter
     def session_id(self, value: Optional[UUID]):
@@ -443,47 +686,43 @@ class RoomAgent:
             logger.warning("[에이전트] 최종 요약 LLM 없음")
             return {}
 
-        conversation_history = self.state.get("conversation_history", [])
-        if not conversation_history:
+        if not self._formatted_lines:
             logger.warning("[에이전트] 대화 이력 없음, 최종 요약 불가")
             return {}
 
-        # 대화 내역을 텍스트로 변환
-        conversation_text = "\n".join([
-            f"[{entry.get('speaker_id', 'unknown')}] {entry.get('speaker_name', '')}: {entry.get('text', '')}"
-            for entry in conversation_history
-        ])
+        # 대화 내역을 텍스트로 변환 (on_new_transcript에서 미리 포맷된 라인 사용)
+        conversation_text = "\n".join(self._formatted_lines)
 
         try:
-            # Structured Output으로 LLM 호출
-            structured_llm = llm_to_use.with_structured_output(FinalConsultationSummary)
+            # Structured Output으로 LLM 호출 (바인딩은 LLM별로 캐싱됨)
+            structured_llm = _create_final_summary_llm(llm_to_use)
 
             messages = [
-                SystemMessage(content=FINAL_SUMMARY_SYSTEM_PROMPT),
-                HumanMessage(content=f"## 전체 상담 대화\n\n{conversation_text}")
+                _FINAL_SUMMARY_SYSTEM_MESSAGE,
+                HumanMessage(content=_FINAL_SUMMARY_HUMAN_PREFIX + conversation_text)
             ]
 
-            logger.info(f"[에이전트] 최종 요약 생성 중: {len(conversation_history)}개 턴")
-            start_time = time.time()
+            logger.info("[에이전트] 최종 요약 생성 중: %d개 턴", self.transcript_count)
+            start_time = time.monotonic()
 
-            result = await structured_llm.ainvoke(messages)
+            result = await structured_llm.ainvoke(messages, config=_LLM_RUN_CONFIG)
             final_summary = (
                 result
                 if isinstance(result, FinalConsultationSummary)
                 else FinalConsultationSummary.model_validate(result)
             )
 
-            elapsed = time.time() - start_time
-            logger.info(f"[에이전트] 최종 요약 완료: {elapsed:.2f}s")
+            elapsed = time.monotonic() - start_time
+            logger.info("[에이전트] 최종 요약 완료: %.2fs", elapsed)
 
             # LLM 반환값 확인
-            logger.debug(f"generate_final_summary result type: {type(final_summary).__name__}")
-            logger.debug(f"consultation_type: {final_summary.consultation_type}")
+            logger.debug("generate_final_summary result type: %s", type(final_summary).__name__)
+            logger.debug("consultation_type: %s", final_summary.consultation_type)
             
             return final_summary.model_dump()
 
         except Exception as e:
-            logger.error(f"[에이전트] 최종 요약 실패: {e}")
+            logger.error("[에이전트] 최종 요약 실패: %s", e)
             return {}
 
     def _format_final_summary_text(self, summary_data: Dict[str, Any]) -> str:
@@ -534,20 +773,22 @@ class RoomAgent:
         Returns:
             성공 여부
         """
-        logger.info(f"[에이전트] 세션 종료 요청 - room={self.room_name}")
+        logger.info("[에이전트] 세션 종료 요청 - room=%s", self.room_name)
 
         if not self.save_to_db or not self.session_id:
-            logger.warning(f"[에이전트] 세션 종료 스킵: save_to_db={self.save_to_db}, session={self.session_id}")
+            logger.warning(
+                "[에이전트] 세션 종료 스킵: save_to_db=%s, session=%s", self.save_to_db, self.session_id,
+            )
             return False
 
         # 최종 요약 생성 (비즈니스 로직)
-        logger.debug(f"[에이전트] 최종 요약 생성 중...")
+        logger.debug("[에이전트] 최종 요약 생성 중...")
         summary_data = await self.generate_final_summary()
         if summary_data:
             final_summary = self._format_final_summary_text(summary_data)
             if not consultation_type:
                 consultation_type = summary_data.get("consultation_type", "")
-            logger.info(f"[에이전트] 최종 요약 생성 완료 - type={consultation_type}")
+            logger.info("[에이전트] 최종 요약 생성 완료 - type=%s", consultation_type)
 
         # DB 저장 (Repository 위임)
         return await self.repository.end_session(
@@ -556,13 +797,15 @@ class RoomAgent:
         )
 
     async def update_session_customer(self, customer_id: int) -> bool:
-        """세션에 고객 정보를 연결합니다 (Repository 위임).
+        """세션에 고객 정보 연결을 예약합니다 (Repository 위임).
+
+        UPDATE는 다음 전사 flush에서 실행되며 실패 시 재시도됩니다.
 
         Args:
             customer_id: 고객 ID
 
         Returns:
-            성공 여부
+            예약 여부
         """
         return await self.repository.update_session_customer(customer_id)
 
@@ -597,9 +840,47 @@ class RoomAgent:
         return self.context_manager.base_system_message
 
 
+# 글로벌 에이전트 저장소 상한
+# - MAX_ROOM_AGENTS 초과 시 가장 오래 전에 접근한 에이전트부터 제거
+# - ROOM_AGENT_IDLE_TTL(초) 동안 접근이 없으면 주기적 정리에서 제거
+# - 세션이 열려 있는 에이전트(session_id 존재)는 재사용 가능성이 높으므로 제거하지 않음
+MAX_ROOM_AGENTS = 200
+ROOM_AGENT_IDLE_TTL = 3600.0
+ROOM_AGENT_SWEEP_INTERVAL = 30.0
+
 # 글로벌 에이전트 저장소
-# {room_name: RoomAgent}
-room_agents: Dict[str, RoomAgent] = {}
+# {room_name: RoomAgent} - 접근 순서 유지 (앞쪽이 가장 오래 전 접근)
+room_agents: "OrderedDict[str, RoomAgent]" = OrderedDict()
+_room_last_access: Dict[str, float] = {}
+
+
+def _touch_agent(room_name: str) -> None:
+    """에이전트를 최근 사용으로 표시합니다."""
+    room_agents.move_to_end(room_name)
+    _room_last_access[room_name] = time.monotonic()
+
+
+def _evict_agent(room_name: str) -> None:
+    """저장소에서 에이전트를 제거하고 보유 상태를 해제합니다."""
+    agent = room_agents.pop(room_name, None)
+    _room_last_access.pop(room_name, None)
+    if agent is not None:
+        agent.close()
+
+
+def get_agent(room_name: str) -> Optional[RoomAgent]:
+    """방의 기존 에이전트를 반환합니다 (생성하지 않음).
+
+    Args:
+        room_name (str): 방 이름
+
+    Returns:
+        Optional[RoomAgent]: 에이전트 인스턴스 (없으면 None)
+    """
+    agent = room_agents.get(room_name)
+    if agent is not None:
+        _touch_agent(room_name)
+    return agent
 
 
 def get_or_create_agent(room_name: str) -> RoomAgent:
@@ -614,17 +895,85 @@ def get_or_create_agent(room_name: str) -> RoomAgent:
     Note:
         - 방 입장 시 자동으로 에이전트 생성
         - 이미 존재하면 기존 인스턴스 재사용
+        - 생성 후 MAX_ROOM_AGENTS를 넘으면 LRU 에이전트 제거
     """
     if room_name not in room_agents:
         agent = RoomAgent(room_name)
         room_agents[room_name] = agent
-        logger.info(f"[에이전트] 새 에이전트 생성: {room_name}")
+        logger.info("[에이전트] 새 에이전트 생성: %s", room_name)
     else:
-        logger.debug(f"[에이전트] 기존 에이전트 재사용: {room_name}")
+        logger.debug("[에이전트] 기존 에이전트 재사용: %s", room_name)
+
+    _touch_agent(room_name)
+    if len(room_agents) > MAX_ROOM_AGENTS:
+        _evict_over_capacity()
 
     return room_agents[room_name]
 
 
+def _evict_over_capacity() -> int:
+    """상한을 넘은 만큼 가장 오래 전에 접근한 에이전트를 제거합니다.
+
+    Returns:
+        제거된 에이전트 수
+    """
+    excess = len(room_agents) - MAX_ROOM_AGENTS
+    victims = []
+    # 마지막(방금 접근한) 항목은 후보에서 제외
+    for room_name, agent in islice(room_agents.items(), len(room_agents) - 1):
+        if len(victims) >= excess:
+            break
+        if agent.session_id is None:
+            victims.append(room_name)
+
+    for room_name in victims:
+        _evict_agent(room_name)
+        logger.info("[에이전트] LRU 에이전트 제거: %s", room_name)
+
+    if len(victims) < excess:
+        logger.warning(
+            "[에이전트] 에이전트 수 상한 초과: %d개 (열린 세션은 제거하지 않음)",
+            len(room_agents),
+        )
+    return len(victims)
+
+
+def evict_idle_agents() -> int:
+    """ROOM_AGENT_IDLE_TTL 동안 접근이 없던 에이전트를 제거합니다.
+
+    Returns:
+        제거된 에이전트 수
+    """
+    cutoff = time.monotonic() - ROOM_AGENT_IDLE_TTL
+    victims = []
+    # 접근 순서로 정렬되어 있으므로 첫 최근 항목에서 중단
+    for room_name, agent in room_agents.items():
+        if _room_last_access.get(room_name, 0.0) > cutoff:
+            break
+        if agent.session_id is None:
+            victims.append(room_name)
+
+    for room_name in victims:
+        _evict_agent(room_name)
+        logger.info("[에이전트] 유휴 에이전트 제거: %s", room_name)
+    return len(victims)
+
+
+async def run_agent_eviction_loop() -> None:
+    """유휴 에이전트를 주기적으로 정리하는 백그라운드 루프 (서버 수명 동안 실행)."""
+    while True:
+        await asyncio.sleep(ROOM_AGENT_SWEEP_INTERVAL)
+        try:
+            evicted = evict_idle_agents()
+            if evicted:
+                logger.info(
+                    "[에이전트] 유휴 정리 완료: %d개 제거, 남은 에이전트 %d개",
+                    evicted, len(room_agents),
+                )
+        except Exception as e:
+            logger.error("[에이전트] 유휴 정리 오류: %s", e, exc_info=True)
+
+
 def remove_agent(room_name: str):
     """방의 에이전트를 제거합니다.
 
@@ -636,7 +985,7 @@ def remove_agent(room_name: str):
         - 메모리 정리 목적
     """
     if room_name in room_agents:
-        del room_agents[room_name]
-        logger.info(f"[에이전트] 에이전트 제거: {room_name}")
+        _evict_agent(room_name)
+        logger.info("[에이전트] 에이전트 제거: %s", room_name)
     else:
-        logger.warning(f"[에이전트] 에이전트 없음: {room_name}")
+        logger.warning("[에이전트] 에이전트 없음: %s", room_name)
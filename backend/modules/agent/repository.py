@@ -4,32 +4,114 @@ RoomAgent의 세션, 전사, 에이전트 결과 저장을 담당하는 Reposito
 Single Responsibility 원칙에 따라 DB 관련 로직을 분리합니다.
 """
 
+import asyncio
+import itertools
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
 from uuid import UUID
 
+from .transcript_wal import TranscriptWAL, WAL_ENABLED
+
 logger = logging.getLogger(__name__)
 
+# 전사 배치 저장 설정: 최대 BATCH_MAX행 또는 FLUSH_INTERVAL초마다 한 번의 INSERT
+TRANSCRIPT_BATCH_MAX = 32
+TRANSCRIPT_FLUSH_INTERVAL = 0.2
+
+# 고객 연결 UPDATE 실패 시 다음 flush에서 재시도하는 최대 횟수 (첫 시도 포함)
+CUSTOMER_LINK_MAX_ATTEMPTS = 3
+
+# save_agent_results 인자 순서에 대응하는 result_type 이름
+_RESULT_TYPES = ("intent", "sentiment", "summary", "rag", "faq", "risk")
+
+# 에이전트 결과 배치 저장: 모든 방이 공유하는 대기열 하나를 flush 루프가
+# 최대 BATCH_MAX행 또는 FLUSH_INTERVAL초마다 한 번의 INSERT로 저장
+AGENT_RESULT_BATCH_MAX = 64
+AGENT_RESULT_FLUSH_INTERVAL = 0.2
+
+# 대기열/flush 루프는 실행 중인 이벤트 루프에서 처음 사용할 때 생성 (import 시점 루프에 묶이지 않음)
+_result_queue: Optional[asyncio.Queue] = None
+_result_queue_loop: Optional[asyncio.AbstractEventLoop] = None
+_result_flush_task: Optional[asyncio.Task] = None
+
+
+def _agent_result_queue() -> asyncio.Queue:
+    """현재 이벤트 루프의 에이전트 결과 대기열을 반환합니다 (flush 루프가 없으면 시작)."""
+    global _result_queue, _result_queue_loop, _result_flush_task
+
+    loop = asyncio.get_running_loop()
+    if _result_queue is None or _result_queue_loop is not loop:
+        _result_queue = asyncio.Queue()
+        _result_queue_loop = loop
+        _result_flush_task = None
+    if _result_flush_task is None or _result_flush_task.done():
+        _result_flush_task = loop.create_task(_agent_result_flush_loop(_result_queue))
+    return _result_queue
+
+
+async def _agent_result_flush_loop(queue: asyncio.Queue):
+    """대기열의 에이전트 결과를 방과 관계없이 모아 일괄 저장하는 백그라운드 루프.
+
+    첫 행이 들어오면 FLUSH_INTERVAL 동안 (또는 BATCH_MAX행까지) 더 모은 뒤 저장합니다.
+    """
+    loop = asyncio.get_running_loop()
+    agent_result_repo = _get_db_repositories().agent_result
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + AGENT_RESULT_FLUSH_INTERVAL
+        while len(batch) < AGENT_RESULT_BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            await agent_result_repo.save_results_bulk(batch)
+        except Exception as e:
+            logger.error("[Repository] 결과 일괄 저장 실패 - %d건: %s", len(batch), e)
+
 # Database repositories (lazy import to avoid circular dependencies)
-_session_repo = None
-_transcript_repo = None
-_agent_result_repo = None
-
-
-def _get_db_repositories():
-    """DB Repository 싱글톤 인스턴스들을 반환합니다 (lazy initialization)."""
-    global _session_repo, _transcript_repo, _agent_result_repo
-    if _session_repo is None:
-        from modules.database import (
-            get_session_repository,
-            get_transcript_repository,
-            get_agent_result_repository,
-        )
-        _session_repo = get_session_repository()
-        _transcript_repo = get_transcript_repository()
-        _agent_result_repo = get_agent_result_repository()
-    return _session_repo, _transcript_repo, _agent_result_repo
+class _DBRepositories(NamedTuple):
+    """상담 DB Repository 묶음."""
+
+    session: Any
+    transcript: Any
+    agent_result: Any
+
+
+_db_repos: Optional[_DBRepositories] = None
+_db_repos_lock = threading.Lock()
+
+
+def _get_db_repositories() -> _DBRepositories:
+    """DB Repository 싱글톤 인스턴스들을 반환합니다 (lazy initialization).
+
+    여러 방이 동시에 시작돼도 import/생성이 한 번만 일어나도록
+    double-checked locking으로 초기화합니다.
+    """
+    global _db_repos
+
+    if _db_repos is not None:
+        return _db_repos
+
+    with _db_repos_lock:
+        if _db_repos is None:
+            from modules.database import (
+                get_session_repository,
+                get_transcript_repository,
+                get_agent_result_repository,
+            )
+            _db_repos = _DBRepositories(
+                session=get_session_repository(),
+                transcript=get_transcript_repository(),
+                agent_result=get_agent_result_repository(),
+            )
+    return _db_repos
 
 
 class RoomAgentRepository:
@@ -42,7 +124,10 @@ class RoomAgentRepository:
         room_name: 방 이름
         session_id: 현재 세션 ID
         save_to_db: DB 저장 활성화 여부
-        _turn_index: 전사 순서 인덱스
+        _turn_counter: 전사 순서 인덱스 생성기 (1부터)
+        _pending: 저장 대기 중인 전사 행 (백그라운드 flush 루프가 일괄 저장)
+        _wal: 현재 세션의 전사 WAL (TRANSCRIPT_WAL_DIR 설정 시)
+        _retired_wals: 세션이 끝났지만 대기 중인 행의 저장을 기다리는 WAL (flush 후 닫힘)
     """
 
     def __init__(self, room_name: str, save_to_db: bool = True):
@@ -55,12 +140,63 @@ class RoomAgentRepository:
         self.room_name = room_name
         self.save_to_db = save_to_db
         self.session_id: Optional[UUID] = None
-        self._turn_index = 0
+        self._turn_counter = itertools.count(1)
+        self._pending: deque = deque()
+        self._last_transcript_key: Optional[Tuple[str, str, str, int]] = None
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._db_repos: Optional[_DBRepositories] = None
+        self._wal: Optional[TranscriptWAL] = None
+        self._retired_wals: List[TranscriptWAL] = []
+        self._pending_customer: Optional[Tuple[UUID, int]] = None
+        self._customer_link_attempts = 0
+
+    @property
+    def _repos(self) -> _DBRepositories:
+        """DB Repository 묶음 (첫 사용 시 인스턴스에 바인딩)."""
+        if self._db_repos is None:
+            self._db_repos = _get_db_repositories()
+        return self._db_repos
 
     def reset(self):
         """Repository 상태를 초기화합니다."""
         self.session_id = None
-        self._turn_index = 0
+        self._turn_counter = itertools.count(1)
+        self._last_transcript_key = None
+        self._release_wal()
+
+    def close(self):
+        """Repository를 정리합니다 (에이전트 제거 시 호출).
+
+        대기/진행 중인 전사, 고객 연결, 닫을 WAL이 있으면 flush 루프가 저장(fsync 포함)을
+        마친 뒤 WAL을 닫고 스스로 종료합니다. 남은 작업이 없을 때만 유휴 flush 루프를
+        즉시 취소합니다.
+        """
+        self.reset()
+        if (
+            self._flush_task is not None
+            and not self._pending
+            and self._pending_customer is None
+            and not self._retired_wals
+            and not self._flush_lock.locked()
+        ):
+            self._flush_task.cancel()
+
+    def _release_wal(self):
+        """현재 세션의 WAL을 떼어냅니다.
+
+        저장 대기/진행 중인 전사가 없으면 바로 닫고(모든 행이 저장됐으면 삭제),
+        있으면 flush 루프가 fsync와 저장을 마친 뒤 닫도록 넘깁니다.
+        """
+        wal, self._wal = self._wal, None
+        if wal is None:
+            return
+        if self._pending or self._flush_lock.locked():
+            self._retired_wals.append(wal)
+            self._schedule_flush()
+        else:
+            wal.close(remove=wal.clean)
 
     async def create_session(
         self,
@@ -85,15 +221,15 @@ class RoomAgentRepository:
             생성된 세션 UUID 또는 None
         """
         logger.info(
-            f"[Repository] 세션 생성 요청 - room={self.room_name}, "
-            f"agent={agent_name}, room_id={room_id}"
+            "[Repository] 세션 생성 요청 - room=%s, agent=%s, room_id=%s",
+            self.room_name, agent_name, room_id,
         )
 
         if not self.save_to_db:
-            logger.warning(f"[Repository] 세션 생성 스킵: save_to_db=False")
+            logger.warning("[Repository] 세션 생성 스킵: save_to_db=False")
             return None
 
-        session_repo, _, _ = _get_db_repositories()
+        session_repo = self._repos.session
 
         self.session_id = await session_repo.create_session(
             agent_name=agent_name,
@@ -105,10 +241,12 @@ class RoomAgentRepository:
         )
 
         if self.session_id:
-            self._turn_index = 0
-            logger.info(f"[Repository] 세션 생성 성공 - session_id={self.session_id}")
+            self._turn_counter = itertools.count(1)
+            self._last_transcript_key = None
+            self._release_wal()
+            logger.info("[Repository] 세션 생성 성공 - session_id=%s", self.session_id)
         else:
-            logger.error(f"[Repository] 세션 생성 실패 - room={self.room_name}")
+            logger.error("[Repository] 세션 생성 실패 - room=%s", self.room_name)
 
         return self.session_id
 
@@ -127,21 +265,26 @@ class RoomAgentRepository:
             성공 여부
         """
         logger.info(
-            f"[Repository] 세션 종료 요청 - room={self.room_name}, "
-            f"session_id={self.session_id}"
+            "[Repository] 세션 종료 요청 - room=%s, session_id=%s",
+            self.room_name, self.session_id,
         )
 
         if not self.save_to_db:
-            logger.warning(f"[Repository] 세션 종료 스킵: save_to_db=False")
+            logger.warning("[Repository] 세션 종료 스킵: save_to_db=False")
             return False
 
         if not self.session_id:
-            logger.warning(f"[Repository] 세션 종료 스킵: session_id가 None")
+            logger.warning("[Repository] 세션 종료 스킵: session_id가 None")
             return False
 
-        session_repo, _, _ = _get_db_repositories()
+        # 대기 중인 전사를 먼저 저장 (세션 종료 전 전사 누락 방지)
+        await self.flush_transcripts()
+        # 모든 전사가 DB에 저장됐으면 WAL 삭제 (실패분이 있으면 재시작 시 재적재)
+        self._release_wal()
 
-        logger.info(f"[Repository] 세션 종료 DB 저장 중 - session={self.session_id}")
+        session_repo = self._repos.session
+
+        logger.info("[Repository] 세션 종료 DB 저장 중 - session=%s", self.session_id)
         success = await session_repo.end_session(
             session_id=self.session_id,
             final_summary=final_summary,
@@ -149,86 +292,205 @@ class RoomAgentRepository:
         )
 
         if success:
-            logger.info(f"[Repository] 세션 종료 성공 - session_id={self.session_id}")
+            logger.info("[Repository] 세션 종료 성공 - session_id=%s", self.session_id)
         else:
-            logger.error(f"[Repository] 세션 종료 실패 - session_id={self.session_id}")
+            logger.error("[Repository] 세션 종료 실패 - session_id=%s", self.session_id)
 
         return success
 
     async def update_session_customer(self, customer_id: int) -> bool:
         """세션에 고객 정보를 연결합니다.
 
+        UPDATE는 다음 전사 flush(최대 FLUSH_INTERVAL 후)에서 전사 INSERT와 함께 실행되며,
+        실패하면 이후 flush에서 CUSTOMER_LINK_MAX_ATTEMPTS회까지 재시도합니다.
+
         Args:
             customer_id: 고객 ID
 
         Returns:
-            성공 여부
+            예약 여부 (True여도 UPDATE는 아직 실행 전)
         """
         if not self.save_to_db or not self.session_id:
             return False
 
-        session_repo, _, _ = _get_db_repositories()
-        return await session_repo.update_customer(self.session_id, customer_id)
+        # 별도 왕복 대신 다음 전사 flush에 합쳐 저장 (연속 호출 시 마지막 값만 반영)
+        self._pending_customer = (self.session_id, customer_id)
+        self._customer_link_attempts = 0
+        self._schedule_flush()
+        return True
 
-    async def save_transcript(
+    def save_transcript(
         self,
         speaker_type: str,
         speaker_name: str,
         text: str,
-        timestamp: datetime,
+        timestamp: float,
         confidence: float = None
-    ) -> bool:
-        """전사 내용을 DB에 저장합니다.
+    ) -> Optional[int]:
+        """전사 내용을 저장 대기열에 추가합니다.
+
+        DB 왕복 없이 turn_index를 즉시 할당해 대기열에 넣고,
+        백그라운드 flush 루프가 여러 행을 한 번의 INSERT로 저장합니다.
+        직전 전사와 발화자/초 단위 시간/텍스트가 모두 같으면 STT 중간/최종 결과의
+        중복으로 보고 turn_index를 할당하지 않고 제외합니다.
 
         Args:
             speaker_type: 발화자 타입 (agent, customer)
             speaker_name: 발화자 이름
             text: 발화 내용
-            timestamp: 발화 시간
+            timestamp: 발화 시간 (Unix epoch 초, DB에서 timestamptz로 변환)
             confidence: STT 신뢰도
 
         Returns:
-            성공 여부
+            할당된 turn_index (저장하지 않거나 중복이면 None)
         """
-        logger.debug(
-            f"[Repository] 전사 저장 시도 - save_to_db={self.save_to_db}, "
-            f"session_id={self.session_id}"
-        )
-
         if not self.save_to_db:
             logger.debug("[Repository] 전사 저장 스킵: save_to_db=False")
-            return False
+            return None
 
         if not self.session_id:
-            logger.warning(f"[Repository] 전사 저장 스킵: session_id가 None")
-            return False
-
-        _, transcript_repo, _ = _get_db_repositories()
+            logger.warning("[Repository] 전사 저장 스킵: session_id가 None")
+            return None
 
-        self._turn_index += 1
-        logger.info(
-            f"[Repository] 전사 저장 중 - session={self.session_id}, "
-            f"turn={self._turn_index}, speaker={speaker_name}"
+        key = (speaker_type, speaker_name, text, int(timestamp))
+        if key == self._last_transcript_key:
+            logger.debug("[Repository] 중복 전사 제외 - speaker=%s", speaker_name)
+            return None
+        self._last_transcript_key = key
+
+        turn_index = next(self._turn_counter)
+        row = {
+            "session_id": self.session_id,
+            "turn_index": turn_index,
+            "speaker_type": speaker_type,
+            "speaker_name": speaker_name,
+            "text": text,
+            "ts_us": int(timestamp * 1_000_000),
+            "confidence": confidence,
+        }
+        if WAL_ENABLED:
+            if self._wal is None:
+                self._wal = TranscriptWAL(self.session_id)
+            self._wal.append(row)
+        self._pending.append(row)
+        logger.debug(
+            "[Repository] 전사 대기열 추가 - session=%s, turn=%d, pending=%d",
+            self.session_id, turn_index, len(self._pending),
         )
 
-        result = await transcript_repo.add_transcript(
-            session_id=self.session_id,
-            turn_index=self._turn_index,
-            speaker_type=speaker_type,
-            speaker_name=speaker_name,
-            text=text,
-            timestamp=timestamp,
-            confidence=confidence
-        )
+        if len(self._pending) >= TRANSCRIPT_BATCH_MAX:
+            self._flush_event.set()
+        self._schedule_flush()
 
-        if result:
-            logger.info(f"[Repository] 전사 저장 완료 - turn={self._turn_index}")
-        else:
-            logger.error(f"[Repository] 전사 저장 실패 - turn={self._turn_index}")
+        return turn_index
+
+    def _schedule_flush(self):
+        """flush 루프가 없으면 시작합니다."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
 
-        return result
+    async def flush_transcripts(self) -> int:
+        """대기 중인 전사와 예약된 고객 연결을 모두 저장합니다.
 
-    async def save_agent_results(
+        세션이 끝나 떼어낸 WAL은 이번 배치의 저장 결과를 반영한 뒤 닫습니다.
+
+        Returns:
+            저장된 개수
+        """
+        async with self._flush_lock:
+            pending_customer, self._pending_customer = self._pending_customer, None
+            retired_wals, self._retired_wals = self._retired_wals, []
+            if not self._pending and pending_customer is None:
+                self._close_wals(retired_wals)
+                return 0
+
+            rows = list(self._pending)
+            self._pending.clear()
+
+            # DB 저장 전에 WAL을 배치 단위로 디스크에 반영 (group commit)
+            wals = retired_wals if self._wal is None else [*retired_wals, self._wal]
+            for wal in wals:
+                await wal.sync()
+
+            # 대기열 전체를 연결 하나로 BATCH_MAX행씩 저장
+            # (고객 연결 UPDATE도 같은 트랜잭션에서 함께 커밋/롤백)
+            if rows:
+                saved = await self._repos.transcript.add_transcripts_bulk(
+                    rows, batch_size=TRANSCRIPT_BATCH_MAX, customer_link=pending_customer
+                )
+                customer_ok = saved == len(rows)
+            else:
+                saved = 0
+                customer_ok = await self._repos.session.update_customer(*pending_customer)
+            if pending_customer is not None:
+                if customer_ok:
+                    self._customer_link_attempts = 0
+                else:
+                    self._retry_customer_link(pending_customer)
+            if saved < len(rows):
+                # 실패 행이 어느 세션 것이든 관련 WAL은 모두 남겨 재시작 시 재적재
+                for wal in wals:
+                    wal.clean = False
+                logger.error(
+                    "[Repository] 전사 일괄 저장 실패 (롤백) - turn=%d~%d",
+                    rows[0]["turn_index"], rows[-1]["turn_index"],
+                )
+            self._close_wals(retired_wals)
+            return saved
+
+    def _retry_customer_link(self, pending_customer: Tuple[UUID, int]):
+        """실패한 고객 연결을 다음 flush에 다시 예약합니다 (새 값이 예약됐으면 그 값 우선)."""
+        self._customer_link_attempts += 1
+        if self._pending_customer is not None:
+            return
+        if self._customer_link_attempts < CUSTOMER_LINK_MAX_ATTEMPTS:
+            logger.warning(
+                "[Repository] 고객 연결 실패, 재시도 예약 (%d/%d) - session=%s, customer=%s",
+                self._customer_link_attempts, CUSTOMER_LINK_MAX_ATTEMPTS, *pending_customer,
+            )
+            self._pending_customer = pending_customer
+        else:
+            logger.error(
+                "[Repository] 고객 연결 실패 - session=%s, customer=%s",
+                *pending_customer,
+            )
+            self._customer_link_attempts = 0
+
+    @staticmethod
+    def _close_wals(wals: List[TranscriptWAL]):
+        """떼어낸 WAL들을 닫습니다 (모든 행이 저장된 WAL은 삭제)."""
+        for wal in wals:
+            wal.close(remove=wal.clean)
+
+    async def _flush_loop(self):
+        """대기열을 주기적으로 비우는 백그라운드 루프.
+
+        BATCH_MAX행이 쌓이면 즉시, 아니면 FLUSH_INTERVAL마다 저장하며
+        대기열이 빈 상태로 한 주기가 지나면 종료합니다 (다음 전사 추가 시 재시작).
+        """
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        self._flush_event.wait(), timeout=TRANSCRIPT_FLUSH_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_event.clear()
+
+                if (
+                    not self._pending
+                    and self._pending_customer is None
+                    and not self._retired_wals
+                ):
+                    return
+                await self.flush_transcripts()
+        except Exception as e:
+            logger.error("[Repository] 전사 flush 루프 오류: %s", e, exc_info=True)
+        finally:
+            self._flush_task = None
+
+    def save_agent_results(
         self,
         turn_id: str,
         intent_result: dict = None,
@@ -237,8 +499,12 @@ class RoomAgentRepository:
         rag_result: dict = None,
         faq_result: dict = None,
         risk_result: dict = None
-    ):
-        """에이전트 분석 결과를 DB에 저장합니다.
+    ) -> bool:
+        """에이전트 분석 결과 저장을 백그라운드로 예약합니다.
+
+        분석 결과 저장은 응답 지연 경로가 아니므로 호출자는 기다리지 않으며,
+        결과 행은 모든 방이 공유하는 대기열에 넣고 flush 루프가 여러 세션의 행을
+        모아 한 번의 INSERT로 저장합니다. 세션 ID는 예약 시점 값으로 고정됩니다.
 
         Args:
             turn_id: 연관된 turn ID
@@ -248,56 +514,39 @@ class RoomAgentRepository:
             rag_result: RAG 검색 결과
             faq_result: FAQ 검색 결과
             risk_result: 리스크 분석 결과
-        """
-        result_types = []
-        if intent_result:
-            result_types.append("intent")
-        if sentiment_result:
-            result_types.append("sentiment")
-        if summary_result:
-            result_types.append("summary")
-        if rag_result:
-            result_types.append("rag")
-        if faq_result:
-            result_types.append("faq")
-        if risk_result:
-            result_types.append("risk")
 
-        logger.debug(
-            f"[Repository] 결과 저장 시도 - save_to_db={self.save_to_db}, "
-            f"session_id={self.session_id}, types={result_types}"
-        )
+        Returns:
+            예약 여부
+        """
+        # 저장할 결과가 하나도 없으면 목록 구성/로그 없이 바로 반환
+        if not (
+            intent_result or sentiment_result or summary_result
+            or rag_result or faq_result or risk_result
+        ):
+            return False
 
         if not self.save_to_db:
             logger.debug("[Repository] 결과 저장 스킵: save_to_db=False")
-            return
+            return False
 
         if not self.session_id:
-            logger.warning(f"[Repository] 결과 저장 스킵: session_id가 None")
-            return
+            logger.warning("[Repository] 결과 저장 스킵: session_id가 None")
+            return False
+
+        # 비어있지 않은 결과만 대기열에 추가 (타입 이름은 모듈 상수 재사용)
+        queue = _agent_result_queue()
+        session_id = self.session_id
+        queued_types = []
+        for result_type, result_data in zip(
+            _RESULT_TYPES,
+            (intent_result, sentiment_result, summary_result,
+             rag_result, faq_result, risk_result),
+        ):
+            if result_data:
+                queue.put_nowait((session_id, turn_id, result_type, result_data))
+                queued_types.append(result_type)
 
         logger.info(
-            f"[Repository] 결과 저장 시작 - session={self.session_id}, "
-            f"types={result_types}"
+            "[Repository] 결과 저장 예약 - session=%s, types=%s", session_id, queued_types
         )
-
-        _, _, agent_result_repo = _get_db_repositories()
-
-        # 각 결과 타입별로 저장
-        results_to_save = [
-            ("intent", intent_result),
-            ("sentiment", sentiment_result),
-            ("summary", summary_result),
-            ("rag", rag_result),
-            ("faq", faq_result),
-            ("risk", risk_result),
-        ]
-
-        for result_type, result_data in results_to_save:
-            if result_data:
-                await agent_result_repo.save_result(
-                    session_id=self.session_id,
-                    result_type=result_type,
-                    result_data=result_data,
-                    turn_id=turn_id
-                )
+        return True
@@ -0,0 +1,130 @@
+"""전사 Write-Ahead Log.
+
+세션별 로컬 append-only 파일(JSON Lines)에 전사 행을 먼저 기록하여,
+DB 저장이 지연되거나 프로세스가 비정상 종료돼도 전사가 유실되지 않도록 합니다.
+
+- 기록: save_transcript에서 버퍼 쓰기 한 번 (네트워크 왕복 없음)
+- fsync: 전사 flush 루프에서 배치 단위로 한 번 (group commit)
+- 정리: 대기 중인 행을 모두 저장한 뒤 닫고, 실패 행이 없으면 파일 삭제
+- 복구: 서버 시작 시 남아 있는 파일을 DB에 재적재 (ON CONFLICT upsert라 중복 안전)
+
+TRANSCRIPT_WAL_DIR 환경변수를 지정한 경우에만 활성화됩니다.
+
+Usage:
+    >>> wal = TranscriptWAL(session_id)
+    >>> wal.append(row)
+    >>> await wal.sync()
+    >>> wal.close(remove=True)
+"""
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+WAL_DIR = os.getenv("TRANSCRIPT_WAL_DIR", "")
+WAL_ENABLED = bool(WAL_DIR)
+
+
+class TranscriptWAL:
+    """세션 하나의 전사 WAL 파일.
+
+    Attributes:
+        path: WAL 파일 경로
+        clean: 기록한 행 중 DB 저장에 실패한 행이 없으면 True (닫을 때 삭제 여부)
+    """
+
+    __slots__ = ("path", "clean", "_file", "_dirty")
+
+    def __init__(self, session_id: UUID):
+        """WAL 파일을 추가 모드로 엽니다.
+
+        Args:
+            session_id: 세션 UUID (파일 이름으로 사용)
+        """
+        wal_dir = Path(WAL_DIR)
+        wal_dir.mkdir(parents=True, exist_ok=True)
+        self.path = wal_dir / f"{session_id}.jsonl"
+        self.clean = True
+        self._file = open(self.path, "ab")
+        self._dirty = False
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """전사 행 하나를 기록합니다 (버퍼 쓰기, fsync는 sync에서)."""
+        self._file.write(
+            json.dumps(row, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+        )
+        self._dirty = True
+
+    async def sync(self) -> None:
+        """마지막 sync 이후 기록한 행들을 디스크에 한 번에 반영합니다."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._file.flush()
+        await asyncio.to_thread(os.fsync, self._file.fileno())
+
+    def close(self, remove: bool = False) -> None:
+        """WAL 파일을 닫습니다.
+
+        Args:
+            remove: True면 파일 삭제 (모든 행이 DB에 저장된 경우)
+        """
+        self._file.close()
+        if remove:
+            self.path.unlink(missing_ok=True)
+
+
+def _load_rows(path: Path) -> List[Dict[str, Any]]:
+    """WAL 파일에서 전사 행들을 읽습니다 (마지막 불완전한 줄은 무시)."""
+    rows = []
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except ValueError:
+                logger.warning("[WAL] 손상된 줄 무시: %s", path.name)
+                continue
+            row["session_id"] = UUID(row["session_id"])
+            rows.append(row)
+    return rows
+
+
+async def replay_transcript_wal(batch_size: int = 32) -> int:
+    """남아 있는 WAL 파일을 DB에 재적재합니다 (서버 시작 시 호출).
+
+    Args:
+        batch_size: INSERT 한 번에 넣을 최대 행 수
+
+    Returns:
+        재적재된 전사 수
+    """
+    if not WAL_ENABLED or not os.path.isdir(WAL_DIR):
+        return 0
+
+    from modules.database import get_transcript_repository
+
+    transcript_repo = get_transcript_repository()
+    replayed = 0
+    for path in sorted(Path(WAL_DIR).glob("*.jsonl")):
+        try:
+            rows = _load_rows(path)
+        except Exception as e:
+            logger.error("[WAL] 파일 읽기 실패: %s - %s", path.name, e)
+            continue
+
+        saved = await transcript_repo.add_transcripts_bulk(rows, batch_size=batch_size)
+        if saved == len(rows):
+            path.unlink(missing_ok=True)
+            replayed += saved
+        else:
+            logger.error("[WAL] 재적재 실패, 파일 유지: %s (%d/%d)", path.name, saved, len(rows))
+
+    if replayed:
+        logger.info("[WAL] 전사 재적재 완료: %d건", replayed)
+    return replayed
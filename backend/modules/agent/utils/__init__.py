@@ -4,7 +4,7 @@ LangGraph 에이전트 유틸리티 모듈들의 통합 export.
 """
 
 # State 관련
-from .states import ConversationState, ContextSchema
+from .states import ConversationState, ContextSchema, Utterance
 
 # Pydantic 스키마 (Structured Output용)
 from .schemas import (
@@ -46,12 +46,18 @@ from .cache import (
     setup_global_llm_cache,
     clear_llm_cache,
     get_cache_stats,
+    cached_tokens_handler,
 )
 
+# 시맨틱 결과 캐시
+from .result_cache import SemanticResultCache
+
 # 노드 생성 함수 및 유틸리티
 from .nodes import (
     # 유틸리티 함수
     with_timing,
+    cache_per_llm,
+    route_after_intent,
     # 노드 생성 함수
     create_summarize_node,
     create_intent_node,
@@ -76,6 +82,7 @@ __all__ = [
     # States
     "ConversationState",
     "ContextSchema",
+    "Utterance",
     # Schemas
     "AgentBaseModel",
     "SummaryResult",
@@ -106,8 +113,12 @@ __all__ = [
     "setup_global_llm_cache",
     "clear_llm_cache",
     "get_cache_stats",
+    "cached_tokens_handler",
+    "SemanticResultCache",
     # Nodes
     "with_timing",
+    "cache_per_llm",
+    "route_after_intent",
     "create_summarize_node",
     "create_intent_node",
     "create_sentiment_node",
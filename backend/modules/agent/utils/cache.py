@@ -17,10 +17,13 @@ OpenAI Implicit Prompt Caching:
 """
 
 import logging
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional
 
 from redis.exceptions import ResponseError
 from langchain_core.caches import BaseCache
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
 
 from .config import redis_cache_config
 
@@ -30,6 +33,46 @@ logger = logging.getLogger(__name__)
 _llm_cache: Optional[BaseCache] = None
 _cache_initialized: bool = False
 
+# OpenAI Implicit Caching 누적 통계 (usage.prompt_tokens_details.cached_tokens)
+_prompt_token_stats: Dict[str, int] = {"prompt_tokens": 0, "cached_tokens": 0}
+_prompt_token_lock = threading.Lock()
+
+
+class CachedTokensHandler(AsyncCallbackHandler):
+    """LLM 응답의 프롬프트/캐시 토큰 수를 누적하는 콜백 핸들러.
+
+    정적 시스템 접두사가 OpenAI Implicit Caching에 실제로 히트하는지
+    get_cache_stats()의 hit_ratio로 확인할 수 있습니다.
+    """
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        prompt_tokens, cached_tokens = _extract_prompt_token_usage(response)
+        if not prompt_tokens:
+            return
+        with _prompt_token_lock:
+            _prompt_token_stats["prompt_tokens"] += prompt_tokens
+            _prompt_token_stats["cached_tokens"] += cached_tokens
+
+
+def _extract_prompt_token_usage(response: LLMResult) -> tuple:
+    """LLMResult에서 (프롬프트 토큰 수, 캐시된 토큰 수)를 추출합니다."""
+    # 1. 메시지의 usage_metadata (스트리밍/비스트리밍 공통)
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                details = usage.get("input_token_details") or {}
+                return usage.get("input_tokens", 0), details.get("cache_read", 0) or 0
+
+    # 2. llm_output의 OpenAI token_usage
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    details = token_usage.get("prompt_tokens_details") or {}
+    return token_usage.get("prompt_tokens", 0) or 0, details.get("cached_tokens", 0) or 0
+
+
+# 모든 그래프/요약 호출에 전달하는 공유 핸들러 (상태 없음)
+cached_tokens_handler = CachedTokensHandler()
+
 
 def get_llm_cache() -> Optional[BaseCache]:
     """LLM 캐시 인스턴스를 반환합니다.
@@ -87,25 +130,37 @@ def _create_semantic_cache() -> BaseCache:
     임베딩 모델을 사용하여 의미적 유사도를 계산합니다.
     """
     from langchain_redis import RedisSemanticCache
-    from langchain_openai import OpenAIEmbeddings
+    from modules.database import get_embeddings
 
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+    embeddings = get_embeddings()
+    index_name = _semantic_index_name()
 
+    # 모든 에이전트가 하나의 고정된 인덱스를 공유 (요청별 prefix를 쓰면 재사용 불가)
+    # - LLM 모델 구분은 캐시 항목의 llm_string 필터가 담당
+    # - 임베딩 모델별로 벡터 공간이 다르므로 인덱스 이름/키 prefix에 임베딩 모델 포함
     cache = RedisSemanticCache(
         redis_url=redis_cache_config.REDIS_URL,
         embeddings=embeddings,
         distance_threshold=redis_cache_config.SEMANTIC_DISTANCE_THRESHOLD,
         ttl=redis_cache_config.CACHE_TTL,
-        name=redis_cache_config.CACHE_NAME,
+        name=index_name,
+        prefix=index_name,
     )
 
     logger.info(
-        f"[캐시] 시맨틱 캐시 생성: "
+        f"[캐시] 시맨틱 캐시 생성: index={index_name}, "
         f"threshold={redis_cache_config.SEMANTIC_DISTANCE_THRESHOLD}"
     )
     return cache
 
 
+def _semantic_index_name() -> str:
+    """시맨틱 캐시 인덱스 이름 (캐시 이름 + 임베딩 모델, 프로세스 간 동일)."""
+    from modules.database.embeddings import EMBEDDING_MODEL
+
+    return f"{redis_cache_config.CACHE_NAME}:{EMBEDDING_MODEL}"
+
+
 def _create_exact_cache() -> BaseCache:
     """RedisCache 인스턴스를 생성합니다.
 
@@ -151,6 +206,13 @@ def clear_llm_cache() -> bool:
     Returns:
         bool: 클리어 성공 여부
     """
+    from modules.database import clear_embedding_cache
+    from .nodes import _rag_result_cache
+
+    # 쿼리 임베딩 LRU 캐시와 RAG 결과 시맨틱 캐시도 함께 비움 (Redis 캐시 유무와 무관)
+    clear_embedding_cache()
+    _rag_result_cache.clear()
+
     cache = get_llm_cache()
 
     if cache is None:
@@ -171,6 +233,9 @@ def get_cache_stats() -> dict:
     Returns:
         dict: 캐시 설정 및 상태 정보
     """
+    from modules.database import get_embedding_cache_stats
+    from .nodes import _rag_result_cache
+
     return {
         "enabled": redis_cache_config.CACHE_ENABLED,
         "type": redis_cache_config.CACHE_TYPE,
@@ -178,6 +243,22 @@ def get_cache_stats() -> dict:
         "ttl_seconds": redis_cache_config.CACHE_TTL,
         "semantic_threshold": redis_cache_config.SEMANTIC_DISTANCE_THRESHOLD if redis_cache_config.CACHE_TYPE == "semantic" else None,
         "cache_name": redis_cache_config.CACHE_NAME,
+        "semantic_index": _semantic_index_name() if redis_cache_config.CACHE_TYPE == "semantic" else None,
         "initialized": _cache_initialized,
         "cache_available": _llm_cache is not None,
+        "prompt_cache": _prompt_cache_stats(),
+        "embedding_cache": get_embedding_cache_stats(),
+        "rag_result_cache": _rag_result_cache.stats(),
+    }
+
+
+def _prompt_cache_stats() -> Dict[str, Any]:
+    """OpenAI Implicit Caching 누적 통계를 반환합니다."""
+    with _prompt_token_lock:
+        prompt_tokens = _prompt_token_stats["prompt_tokens"]
+        cached_tokens = _prompt_token_stats["cached_tokens"]
+    return {
+        "cached_tokens": cached_tokens,
+        "total_prompt_tokens": prompt_tokens,
+        "hit_ratio": round(cached_tokens / prompt_tokens, 4) if prompt_tokens else 0.0,
     }
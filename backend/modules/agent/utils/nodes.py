@@ -10,16 +10,30 @@
 - faq_search: FAQ 검색
 """
 
+import os
+import re
+import json
+import sys
 import logging
 import time
 import asyncio
-from typing import List, Dict, Any, Callable, Awaitable, Optional
-from dataclasses import dataclass, field
+import functools
+import heapq
+from collections import Counter, deque
+from itertools import chain, islice
+from typing import List, Dict, Any, Callable, Awaitable, Optional, Sequence, Tuple, Deque, FrozenSet
+from dataclasses import astuple, dataclass, field, replace
+from uuid import UUID
 
 from langgraph.runtime import Runtime
+from langgraph.types import Send
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import SystemMessage, HumanMessage
 
+# modules.database는 agent 패키지를 import하지 않으므로 순환 없이 모듈 수준에서 import
+from modules.database import embed_query, get_db_manager, get_faq_service
+
+from .states import Utterance
 from .schemas import (
     SummaryResult,
     IntentResult,
@@ -34,6 +48,13 @@ from .prompts import (
     DRAFT_REPLY_SYSTEM_PROMPT,
     RISK_SYSTEM_PROMPT,
 )
+from .result_cache import SemanticResultCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +67,59 @@ logger = logging.getLogger(__name__)
 # 컬렉션 목록 (langchain_pg_embedding, 1536차원, text-embedding-3-small)
 EMBEDDING_TABLE = "langchain_pg_embedding"
 
+# RAG 검색 결과 시맨틱 캐시 (같은 의도/컬렉션/고객 컨텍스트에서 유사 질문 결과 재사용)
+# 임베딩 생성 후 pgvector 조회 전에 확인 (동일 문장은 임베딩 LRU로 OpenAI 호출도 생략)
+RAG_RESULT_CACHE_MAX_SIZE = int(os.getenv("RAG_RESULT_CACHE_MAX_SIZE", "1024"))
+RAG_RESULT_CACHE_TTL = float(os.getenv("RAG_RESULT_CACHE_TTL", "300"))
+# 0.85 수준에서는 금액/요금제 이름만 다른 질문도 적중하므로 재표현 수준만 재사용
+RAG_RESULT_CACHE_THRESHOLD = float(os.getenv("RAG_RESULT_CACHE_THRESHOLD", "0.95"))
+_rag_result_cache = SemanticResultCache(
+    max_size=RAG_RESULT_CACHE_MAX_SIZE,
+    ttl=RAG_RESULT_CACHE_TTL,
+    threshold=RAG_RESULT_CACHE_THRESHOLD,
+)
+# RAG 벡터 검색 쿼리 (고정 문자열 + 파라미터 -> asyncpg 연결별 prepared statement 재사용)
+# 컬렉션별로 한 번씩 병렬 실행 후 유사도 순으로 병합 (컬렉션 하나씩 인덱스 스캔)
+# 컬렉션은 이름 JOIN 대신 미리 조회한 UUID로 collection_id를 직접 필터 (임베딩 테이블만 스캔)
+# $1: 쿼리 임베딩(vector, 바이너리 코덱), $2: 컬렉션 UUID, $3: 제외할 현재 요금제 이름('' = 제외 안 함),
+# $4: LIMIT, $5: 컬렉션 이름 (결과 행에 그대로 반환)
+# 1단계(ranked)에서 id/메타데이터만으로 순위를 정하고, LIMIT 행에 대해서만 본문을 읽어
+# 앞 500자(content)와 끝의 "상세 정보: {...}" JSON(details_json)만 전송 (전체 본문 전송 없음)
+# details_json: 상세 정보 블록, 없으면 본문 전체가 JSON일 때만 본문, 그 외 NULL
+_RAG_SEARCH_SQL = rf"""
+    WITH ranked AS (
+        SELECT
+            e.id,
+            e.cmetadata,
+            e.embedding <=> $1::vector as distance
+        FROM {EMBEDDING_TABLE} e
+        WHERE e.collection_id = $2::uuid
+          AND ($3::text = '' OR e.cmetadata->>'name' IS NULL OR e.cmetadata->>'name' != $3::text)
+        ORDER BY e.embedding <=> $1::vector
+        LIMIT $4
+    )
+    SELECT
+        $5::text as collection_name,
+        r.cmetadata,
+        1 - r.distance as similarity,
+        left(e.document, 500) as document,
+        COALESCE(
+            substring(e.document from '상세 정보:\s*(\{{.*\}})\s*$'),
+            CASE WHEN ltrim(e.document, E' \t\r\n') LIKE '{{%' THEN e.document END
+        ) as details_json
+    FROM ranked r
+    JOIN {EMBEDDING_TABLE} e ON e.id = r.id
+    ORDER BY r.distance
+"""
+
+# 컬렉션 이름 -> UUID 캐시 (없는 이름이 나오거나 TTL이 지나면 전체 재조회)
+COLLECTION_UUID_TTL = 600.0
+_collection_uuids: Dict[str, UUID] = {}
+_collection_uuids_loaded_at = 0.0
+
+# 진행 중인 RAG 검색 (같은 검색어/범위의 동시 요청은 하나의 pgvector 조회를 공유)
+_inflight_rag_searches: Dict[Tuple, "asyncio.Task"] = {}
+
 # 컬렉션 이름 목록
 COLLECTIONS = {
     "mobile": "kt_mobile_plans",
@@ -68,6 +142,20 @@ RAG_TRIGGERING_KEYWORDS = [
     "5G", "LTE",
 ]
 
+# RAG 트리거 키워드 단일 스캔 패턴 (대소문자 무시, 호출마다 lower() 생략)
+_RAG_TRIGGER_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(RAG_TRIGGERING_KEYWORDS, key=len, reverse=True))),
+    re.IGNORECASE,
+)
+
+# 멤버십 등급표 조회 키워드 / 데이터 증량 요청 키워드 (대소문자 무시 단일 스캔)
+_MEMBERSHIP_GRADE_PATTERN = re.compile(r'등급|기준|조건|vvip|vip|gold|silver', re.IGNORECASE)
+_DATA_UPGRADE_PATTERN = re.compile(r'많은|더|늘리|부족|초과|무제한|대용량', re.IGNORECASE)
+
+# 검색 쿼리에 사용할 최근 고객 발화 (최근 N개 발화 중 최대 M개)
+RECENT_CUSTOMER_WINDOW = 6
+RECENT_CUSTOMER_MAXLEN = 2
+
 # RAG 트리거 최소 신뢰도 임계값
 RAG_CONFIDENCE_THRESHOLD = 0.5
 
@@ -85,12 +173,59 @@ FAQ_INTENT_CATEGORY_MAP = {
     "멤버십 가입": "가입/카드발급",
 }
 
-# FAQ 검색 트리거 키워드
-FAQ_TRIGGERING_KEYWORDS = [
-    "멤버십", "VIP", "VVIP", "포인트", "혜택", "등급",
-    "영화", "할인", "스타벅스", "커피", "제휴",
-    "카드", "발급", "가입",
-]
+# FAQ 카테고리별 트리거 키워드 (소문자 + intern, 집합 교집합으로 조회)
+FAQ_CATEGORY_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    category: frozenset(sys.intern(k.lower()) for k in keywords)
+    for category, keywords in (
+        ("멤버십 혜택", ("멤버십", "혜택", "영화", "할인", "스타벅스", "커피", "제휴")),
+        ("등급", ("VIP", "VVIP", "포인트", "등급")),
+        ("가입/카드발급", ("카드", "발급", "가입")),
+    )
+}
+
+# FAQ 검색 트리거 키워드 (전체 카테고리 합집합)
+FAQ_TRIGGERING_KEYWORDS: FrozenSet[str] = frozenset().union(*FAQ_CATEGORY_KEYWORDS.values())
+
+# 카테고리 우선순위 (선언 순서, 0이 가장 높음)
+_FAQ_CATEGORIES: Tuple[str, ...] = tuple(FAQ_CATEGORY_KEYWORDS)
+
+# 키워드 -> 최우선 카테고리 순위 (더 긴 키워드가 먼저 매칭되므로 포함된 짧은 키워드의 카테고리까지 고려)
+_FAQ_KEYWORD_RANKS: Dict[str, int] = {
+    keyword: min(
+        rank for rank, keywords in enumerate(FAQ_CATEGORY_KEYWORDS.values())
+        if any(other in keyword for other in keywords)
+    )
+    for keyword in FAQ_TRIGGERING_KEYWORDS
+}
+
+# FAQ 키워드 단일 스캔 패턴 (전체 카테고리 1회 스캔, 대소문자 무시로 호출마다 lower() 생략)
+# 한국어는 조사가 붙어 공백 토큰화가 불안정하므로 부분 문자열 매칭 유지
+_FAQ_KEYWORD_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(FAQ_TRIGGERING_KEYWORDS, key=len, reverse=True))),
+    re.IGNORECASE,
+)
+
+# FAQ 검색 최소 쿼리 길이 (이보다 짧으면 임베딩 호출 없이 스킵)
+FAQ_MIN_QUERY_LENGTH = 3
+
+# FAQ 검색 파라미터 (intent 선행 검색과 faq_search 노드가 공유)
+FAQ_SEARCH_LIMIT = 5
+FAQ_DISTANCE_THRESHOLD = 0.45
+
+# intent 스트리밍 중 미리 시작한 FAQ 검색을 faq_search가 가져가지 않을 때 폐기까지의 시간 (초)
+FAQ_PREFETCH_TTL_SEC = 30.0
+
+# FAQ 검색이 확실히 필요한 의도 (O(1) 조회, 키워드 스캔 생략)
+FAQ_INTENT_WHITELIST = frozenset(FAQ_INTENT_CATEGORY_MAP)
+
+# FAQ 검색이 필요 없는 의도 (멤버십 FAQ와 무관, 키워드 스캔 없이 스킵)
+FAQ_NEGATIVE_INTENTS = frozenset({
+    "의도 불명확",
+    "통화품질 불량",
+    "데이터 속도 저하",
+    "명의도용 의심",
+    "스미싱 문자 확인",
+})
 
 # 의도 -> 컬렉션 매핑
 INTENT_COLLECTION_MAP: Dict[str, List[str]] = {
@@ -136,14 +271,84 @@ KEYWORD_COLLECTION_MAP: Dict[str, List[str]] = {
     "포인트": ["membership"],
 }
 
+# 키워드별 컬렉션 키 (더 긴 키워드가 먼저 매칭되므로 포함된 짧은 키워드의 컬렉션까지 합침)
+_KEYWORD_COLLECTION_KEYS: Dict[str, FrozenSet[str]] = {
+    keyword: frozenset().union(*(
+        cols for other, cols in KEYWORD_COLLECTION_MAP.items() if other in keyword
+    ))
+    for keyword in KEYWORD_COLLECTION_MAP
+}
+
+# 컬렉션 키워드 단일 스캔 패턴 (키워드 수와 무관하게 텍스트 1회 스캔)
+_KEYWORD_COLLECTION_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(KEYWORD_COLLECTION_MAP, key=len, reverse=True)))
+)
+
+
+def _scan_collection_keywords(text: str) -> FrozenSet[str]:
+    """텍스트에 포함된 키워드의 컬렉션 키를 한 번의 스캔으로 모읍니다."""
+    keys = frozenset()
+    for match in _KEYWORD_COLLECTION_PATTERN.finditer(text):
+        keys |= _KEYWORD_COLLECTION_KEYS[match.group()]
+    return keys
+
+
+# 의도 라벨 디스패치 테이블: 의도 매핑 + 라벨 자체의 키워드 매칭 결과를 미리 합침
+# (등록된 의도는 호출 시 라벨 스캔 없이 dict 조회 한 번)
+_INTENT_DISPATCH: Dict[str, FrozenSet[str]] = {
+    intent: frozenset(keys) | _scan_collection_keywords(intent)
+    for intent, keys in INTENT_COLLECTION_MAP.items()
+}
+_DEFAULT_COLLECTION_KEYS: FrozenSet[str] = frozenset(INTENT_COLLECTION_MAP["default"])
+
+
+@functools.lru_cache(maxsize=128)
+def _collections_for_intent(intent_label: str) -> FrozenSet[str]:
+    """의도 라벨의 컬렉션 키를 반환합니다 (미등록 라벨도 스캔 결과를 캐시)."""
+    label_keys = _INTENT_DISPATCH.get(intent_label)
+    if label_keys is None:
+        label_keys = _scan_collection_keywords(intent_label)
+    return label_keys
+
 
 # =============================================================================
 # RAG 정책 관련 데이터 클래스
 # =============================================================================
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _customer_segments(age: int, membership_grade: str, monthly_fee: int) -> Tuple[str, ...]:
+    """나이/등급/월 요금으로 타겟 세그먼트 키워드를 계산합니다 (같은 고객 특성은 캐시 재사용)."""
+    segments = []
+    if age > 0:
+        if age <= 18:
+            segments.extend(["청소년", "학생", "Y틴", "틴"])
+        elif age <= 34:
+            segments.extend(["MZ세대", "청년", "Y", "젊은"])
+        elif age <= 50:
+            segments.extend(["중장년", "직장인", "프리미엄"])
+        elif age <= 64:
+            segments.extend(["중장년", "시니어"])
+        else:
+            segments.extend(["시니어", "어르신", "효도", "65세"])
+    if membership_grade:
+        grade = membership_grade.upper()
+        if grade in ["VVIP", "VIP"]:
+            segments.extend(["프리미엄", "헤비유저", "고객"])
+        elif grade == "GENERAL":
+            segments.extend(["가성비", "저사용자"])
+    if monthly_fee > 0:
+        if monthly_fee >= 60000:
+            segments.extend(["프리미엄", "헤비유저"])
+        elif monthly_fee >= 40000:
+            segments.extend(["가성비", "중간"])
+        else:
+            segments.extend(["저가", "저사용자", "가성비"])
+    return tuple(segments)
+
+
+@dataclass(frozen=True, slots=True)
 class CustomerContext:
-    """고객 컨텍스트 정보."""
+    """고객 컨텍스트 정보 (불변, 해시 가능)."""
     customer_name: str = ""
     current_plan: str = ""
     monthly_fee: int = 0
@@ -170,35 +375,10 @@ class CustomerContext:
 
     def get_customer_segments(self) -> List[str]:
         """고객 특성을 기반으로 타겟 세그먼트 키워드를 추출합니다."""
-        segments = []
-        if self.age > 0:
-            if self.age <= 18:
-                segments.extend(["청소년", "학생", "Y틴", "틴"])
-            elif self.age <= 34:
-                segments.extend(["MZ세대", "청년", "Y", "젊은"])
-            elif self.age <= 50:
-                segments.extend(["중장년", "직장인", "프리미엄"])
-            elif self.age <= 64:
-                segments.extend(["중장년", "시니어"])
-            else:
-                segments.extend(["시니어", "어르신", "효도", "65세"])
-        if self.membership_grade:
-            grade = self.membership_grade.upper()
-            if grade in ["VVIP", "VIP"]:
-                segments.extend(["프리미엄", "헤비유저", "고객"])
-            elif grade == "GENERAL":
-                segments.extend(["가성비", "저사용자"])
-        if self.monthly_fee > 0:
-            if self.monthly_fee >= 60000:
-                segments.extend(["프리미엄", "헤비유저"])
-            elif self.monthly_fee >= 40000:
-                segments.extend(["가성비", "중간"])
-            else:
-                segments.extend(["저가", "저사용자", "가성비"])
-        return segments
+        return list(_customer_segments(self.age, self.membership_grade, self.monthly_fee))
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyRecommendation:
     """단일 정책/문구 추천 결과."""
     collection: str
@@ -219,7 +399,7 @@ class PolicyRecommendation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGPolicyResult:
     """RAG 정책 검색 전체 결과."""
     intent_label: str
@@ -244,34 +424,50 @@ class RAGPolicyResult:
 # 공통 유틸 함수
 # =============================================================================
 
-def _format_conversation_text(conversation_history: List[Dict[str, Any]]) -> str:
+def _format_conversation_text(conversation_history: List[Utterance]) -> str:
     """speaker: text 형식으로 문자열 변환."""
-    lines = []
-    for entry in conversation_history:
-        speaker = entry.get("speaker_name", "Unknown")
-        text = entry.get("text", "")
-        lines.append(f"{speaker}: {text}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"{entry.speaker_name}: {entry.text}" for entry in conversation_history
+    )
 
 
 def _has_customer_turn_since(
-    conversation_history: List[Dict[str, Any]],
+    conversation_history: List[Utterance],
     last_index: int
 ) -> bool:
     """last_index 이후로 고객 발화가 있는지 확인합니다."""
     for entry in conversation_history[last_index:]:
-        speaker_name = entry.get("speaker_name", "")
-        speaker_id = entry.get("speaker_id", "")
-        is_customer = entry.get("is_customer", False)
-        if is_customer:
+        if entry.is_customer:
             return True
-        if speaker_name.startswith("고객"):
+        if entry.speaker_name.startswith("고객"):
             return True
-        if speaker_id.startswith("user") or speaker_id.startswith("customer"):
+        if entry.speaker_id.startswith(("user", "customer")):
             return True
     return False
 
 
+def _recent_customer_query(
+    conversation_history: List[Utterance],
+    recent_customer_utts: Optional[Deque[Tuple[int, str]]] = None,
+) -> str:
+    """최근 6개 발화 중 마지막 고객 발화 최대 2개를 이어 붙입니다.
+
+    Args:
+        conversation_history: 대화 이력
+        recent_customer_utts: 수집 시점에 채워진 (이력 인덱스, 텍스트) deque(maxlen=2).
+            없으면 최근 6개 발화를 한 번 순회하여 계산합니다.
+    """
+    window_start = len(conversation_history) - RECENT_CUSTOMER_WINDOW
+    if recent_customer_utts is not None:
+        return " ".join(text for idx, text in recent_customer_utts if idx >= window_start)
+
+    recent: Deque[str] = deque(maxlen=RECENT_CUSTOMER_MAXLEN)
+    for entry in islice(conversation_history, max(window_start, 0), None):
+        if entry.is_customer or entry.speaker_name.startswith("고객"):
+            recent.append(entry.text)
+    return " ".join(recent)
+
+
 def _should_trigger_rag(
     intent_label: str,
     customer_query: str,
@@ -282,38 +478,173 @@ def _should_trigger_rag(
         return False
     if intent_confidence < RAG_CONFIDENCE_THRESHOLD:
         logger.info(
-            f"[RAG] 신뢰도 낮음 ({intent_confidence:.2f} < {RAG_CONFIDENCE_THRESHOLD}), RAG 스킵"
+            "[RAG] 신뢰도 낮음 (%.2f < %s), RAG 스킵",
+            intent_confidence, RAG_CONFIDENCE_THRESHOLD,
         )
         return False
-    combined_text = f"{intent_label} {customer_query}".lower()
-    for keyword in RAG_TRIGGERING_KEYWORDS:
-        if keyword.lower() in combined_text:
-            return True
-    return False
+    return bool(
+        _RAG_TRIGGER_PATTERN.search(intent_label)
+        or _RAG_TRIGGER_PATTERN.search(customer_query)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _query_tokens(query: str) -> FrozenSet[str]:
+    """쿼리의 2글자 이상 소문자 토큰 집합 (직전 FAQ 쿼리는 매 발화마다 다시 비교되므로 캐시)."""
+    return frozenset(w for w in query.lower().split() if len(w) >= 2)
 
 
 def _is_similar_query(query1: str, query2: str, threshold: float = 0.7) -> bool:
     """두 쿼리가 유사한지 간단히 비교합니다 (키워드 기반)."""
     if not query1 or not query2:
         return False
-    words1 = set(w for w in query1.lower().split() if len(w) >= 2)
-    words2 = set(w for w in query2.lower().split() if len(w) >= 2)
+    words1 = _query_tokens(query1)
+    words2 = _query_tokens(query2)
     if not words1 or not words2:
         return query1.strip() == query2.strip()
     intersection = len(words1 & words2)
-    union = len(words1 | words2)
-    return (intersection / union) >= threshold if union > 0 else False
+    # |A ∪ B| = |A| + |B| - |A ∩ B| (합집합을 만들지 않음)
+    union = len(words1) + len(words2) - intersection
+    return (intersection / union) >= threshold
+
+
+def _match_faq_category(customer_query: str) -> Optional[str]:
+    """고객 발화에서 처음 매칭되는 FAQ 카테고리를 반환합니다.
+
+    전체 키워드 패턴으로 한 번만 스캔하고, 매칭된 키워드 중 우선순위가 가장 높은
+    카테고리를 반환합니다 (최우선 카테고리가 나오면 즉시 종료).
+    """
+    if not customer_query or len(customer_query.strip()) < FAQ_MIN_QUERY_LENGTH:
+        return None
+    best_rank = None
+    for match in _FAQ_KEYWORD_PATTERN.finditer(customer_query):
+        rank = _FAQ_KEYWORD_RANKS[match.group().lower()]
+        if best_rank is None or rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+    return _FAQ_CATEGORIES[best_rank] if best_rank is not None else None
+
+
+def _should_trigger_faq(
+    intent_label: str,
+    customer_query: str
+) -> Tuple[bool, Optional[str]]:
+    """의도 라벨과 고객 발화로 FAQ 검색 여부와 카테고리를 판단합니다.
 
+    의도 라벨이 부정/화이트리스트 집합에 있으면 문자열 스캔 없이 바로 반환합니다.
+
+    Returns:
+        (검색 필요 여부, FAQ 카테고리 또는 None)
+    """
+    if intent_label in FAQ_NEGATIVE_INTENTS:
+        return False, None
+    if intent_label in FAQ_INTENT_WHITELIST:
+        return True, FAQ_INTENT_CATEGORY_MAP[intent_label]
+    category = _match_faq_category(customer_query)
+    return category is not None, category
+
+
+def _advance_index(key: str, previous: int, current: int) -> Dict[str, int]:
+    """인덱스가 실제로 진행된 경우에만 상태 업데이트를 반환합니다.
+
+    값이 같으면 빈 dict를 반환해 불필요한 state merge/체크포인트 쓰기를 피합니다.
+    """
+    return {key: current} if current != previous else {}
+
+
+# intent 스트리밍 중 시작한 FAQ 검색 태스크 ((쿼리, 카테고리) -> Task, single-flight)
+_faq_prefetch: Dict[Tuple[str, Optional[str]], "asyncio.Task[Any]"] = {}
+
+
+def _faq_search(
+    customer_query: str,
+    faq_category: Optional[str],
+    on_partial_result: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+) -> Awaitable[Any]:
+    """FAQ semantic search 코루틴을 생성합니다 (미초기화 상태면 내부에서 초기화됨)."""
+    return get_faq_service().semantic_search(
+        query=customer_query,
+        limit=FAQ_SEARCH_LIMIT,
+        use_cache=True,
+        distance_threshold=FAQ_DISTANCE_THRESHOLD,
+        on_partial_result=on_partial_result,
+        category=faq_category,
+    )
+
+
+def _faq_top1_emitter(
+    runtime: Runtime, customer_query: str, shown_faq_ids: FrozenSet[str]
+) -> Callable[[List[Dict[str, Any]]], None]:
+    """캐시 저장을 기다리지 않고 첫 번째 신규 FAQ를 먼저 스트리밍하는 콜백을 만듭니다."""
+
+    def emit_top1(faqs: List[Dict[str, Any]]) -> None:
+        for faq in faqs:
+            faq_id = faq.get("id") or faq.get("faq_id") or faq.get("question", "")[:50]
+            if faq_id not in shown_faq_ids:
+                # "updates" 스트림과 같은 {노드: payload} 형태로 전달
+                runtime.stream_writer({
+                    "faq_search": {
+                        "faq_result": {
+                            "skipped": False,
+                            "partial": True,
+                            "query": customer_query,
+                            "cache_hit": False,
+                            "faqs": [faq],
+                        }
+                    }
+                })
+                return
+
+    return emit_top1
+
+
+def _start_faq_prefetch(
+    customer_query: str,
+    faq_category: Optional[str],
+    on_partial_result: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+) -> None:
+    """FAQ 검색을 백그라운드로 먼저 시작합니다 (같은 쿼리/카테고리는 한 번만).
+
+    faq_search 노드가 _take_faq_prefetch로 가져가지 않으면 TTL 후 폐기합니다.
+    """
+    key = (customer_query, faq_category)
+    if key in _faq_prefetch:
+        return
+
+    loop = asyncio.get_running_loop()
+    task = loop.create_task(_faq_search(customer_query, faq_category, on_partial_result))
+    # 가져가지 않은 태스크의 예외가 "never retrieved" 경고로 남지 않도록 소비
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    _faq_prefetch[key] = task
+
+    def _expire() -> None:
+        # 같은 키로 새 태스크가 등록됐으면 건드리지 않음
+        if _faq_prefetch.get(key) is task:
+            del _faq_prefetch[key]
+
+    loop.call_later(FAQ_PREFETCH_TTL_SEC, _expire)
 
-def _should_trigger_faq_by_text(customer_query: str) -> bool:
-    """고객 발화 텍스트만으로 FAQ 검색이 필요한지 판단합니다."""
-    if not customer_query or len(customer_query.strip()) < 3:
-        return False
-    query_lower = customer_query.lower()
-    for keyword in FAQ_TRIGGERING_KEYWORDS:
-        if keyword.lower() in query_lower:
-            return True
-    return False
+
+def _take_faq_prefetch(
+    customer_query: str, faq_category: Optional[str]
+) -> "Optional[asyncio.Task[Any]]":
+    """미리 시작된 FAQ 검색 태스크를 꺼냅니다 (없으면 None)."""
+    return _faq_prefetch.pop((customer_query, faq_category), None)
+
+
+def _preliminary_intent_label(chunk: Any) -> Optional[str]:
+    """스트리밍 중인 구조화 출력에서 확정된 의도 라벨을 꺼냅니다.
+
+    IntentResult는 intent_label이 첫 필드이므로 다음 필드가 나타나면 라벨 문자열이 완성된 것입니다.
+    아직 라벨이 작성 중이면 None을 반환합니다.
+    """
+    if isinstance(chunk, IntentResult):
+        chunk = chunk.model_dump(exclude_unset=True)
+    if not isinstance(chunk, dict) or len(chunk) < 2:
+        return None
+    label = chunk.get("intent_label")
+    return label if isinstance(label, str) and label else None
 
 
 def with_timing(
@@ -328,7 +659,7 @@ def with_timing(
             result = await node_fn(state, runtime)
         except Exception:
             elapsed_ms = int((time.perf_counter() - start) * 1000)
-            logger.exception(f"[에이전트] {node_name} 노드 실패: {elapsed_ms}ms")
+            logger.exception("[에이전트] %s 노드 실패: %dms", node_name, elapsed_ms)
             raise
 
         elapsed_ms = int((time.perf_counter() - start) * 1000)
@@ -337,7 +668,7 @@ def with_timing(
             "elapsed_ms": elapsed_ms,
             "timestamp": int(time.time() * 1000),
         }
-        logger.debug(f"[에이전트] {node_name} 실행: {elapsed_ms}ms")
+        logger.debug("[에이전트] %s 실행: %dms", node_name, elapsed_ms)
 
         if isinstance(result, dict):
             return {**result, f"{node_name}_metrics": metrics}
@@ -346,23 +677,55 @@ def with_timing(
     return _wrapped
 
 
+def cache_per_llm(
+    maxsize: int = 4
+) -> Callable[[Callable[[BaseChatModel], Any]], Callable[[BaseChatModel], Any]]:
+    """LLM 인스턴스별로 그래프 팩토리 결과를 캐싱하는 데코레이터.
+
+    BaseChatModel은 해시 불가능하므로 id(llm)를 키로 쓰고,
+    LLM 참조를 함께 보관하여 id 재사용으로 인한 오탐을 막습니다.
+    """
+
+    def decorator(factory: Callable[[BaseChatModel], Any]) -> Callable[[BaseChatModel], Any]:
+        cache: Dict[int, tuple] = {}
+
+        @functools.wraps(factory)
+        def _wrapped(llm: BaseChatModel) -> Any:
+            cached = cache.get(id(llm))
+            if cached is not None and cached[0] is llm:
+                return cached[1]
+            result = factory(llm)
+            if len(cache) >= maxsize:
+                cache.pop(next(iter(cache)))
+            cache[id(llm)] = (llm, result)
+            return result
+
+        _wrapped.cache_clear = cache.clear
+        return _wrapped
+
+    return decorator
+
+
+def route_after_intent(state: Any) -> List[Send]:
+    """intent 완료 후 faq_search/rag_policy로 Send 팬아웃합니다.
+
+    faq_search는 이번 턴의 의도로 FAQ 검색 여부를 판단하도록 intent 이후에 실행합니다
+    (부정 의도면 임베딩 호출 없이 스킵, intent 스트리밍 중 시작된 검색이 있으면 그 결과를 사용).
+    rag_policy는 의도 결과가 없어도 항상 보내 last_rag_index가 진행되도록 합니다
+    (검색 여부는 노드 내부에서 판단, 인덱스가 멈추면 이력 압축이 막힘).
+    """
+    return [Send("faq_search", state), Send("rag_policy", state)]
+
+
 # =============================================================================
 # RAG 정책 검색 내부 함수 (rag_policy.py 통합)
 # =============================================================================
 
 def _get_collections_for_intent(intent_label: str, query: str) -> List[str]:
     """의도와 쿼리를 분석하여 검색할 컬렉션 목록을 반환합니다."""
-    collection_keys = set()
-    if intent_label in INTENT_COLLECTION_MAP:
-        collection_keys.update(INTENT_COLLECTION_MAP[intent_label])
-    for keyword, cols in KEYWORD_COLLECTION_MAP.items():
-        if keyword in intent_label:
-            collection_keys.update(cols)
-    for keyword, cols in KEYWORD_COLLECTION_MAP.items():
-        if keyword in query:
-            collection_keys.update(cols)
+    collection_keys = _collections_for_intent(intent_label) | _scan_collection_keywords(query)
     if not collection_keys:
-        collection_keys.update(INTENT_COLLECTION_MAP["default"])
+        collection_keys = _DEFAULT_COLLECTION_KEYS
     collection_names = [COLLECTIONS[key] for key in collection_keys if key in COLLECTIONS]
     return collection_names
 
@@ -403,44 +766,99 @@ def _generate_recommendation_reason(
     return " / ".join(reasons) if reasons else "고객 문의 내용과 관련된 정보"
 
 
+# 데이터량 파싱 패턴 (대소문자 무시, 호출마다 lower() 생략)
+_UNLIMITED_RE = re.compile(r'무제한|unlimited', re.IGNORECASE)
+_DATA_RE = re.compile(r'(\d+)\s*(?:gb|기가)', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
 def _parse_data_amount_from_text(search_text: str) -> int:
-    """search_text에서 데이터량(GB)을 파싱합니다."""
-    import re
+    """search_text에서 데이터량(GB)을 파싱합니다 (같은 요금제 문서가 반복되므로 LRU 캐시)."""
     if not search_text:
         return 0
-    text_lower = search_text.lower()
-    if "무제한" in text_lower or "unlimited" in text_lower:
+    if _UNLIMITED_RE.search(search_text):
         return 9999
-    match = re.search(r'(\d+)\s*(?:gb|기가)', text_lower)
+    match = _DATA_RE.search(search_text)
     if match:
         return int(match.group(1))
     return 0
 
 
+# _customer_segments가 만들 수 있는 세그먼트 -> 비트 (소문자 키)
+_SEGMENT_BITS: Dict[str, int] = {
+    segment.lower(): 1 << bit
+    for bit, segment in enumerate((
+        "청소년", "학생", "Y틴", "틴", "MZ세대", "청년", "Y", "젊은",
+        "중장년", "직장인", "프리미엄", "시니어", "어르신", "효도", "65세",
+        "헤비유저", "고객", "가성비", "저사용자", "중간", "저가",
+    ))
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _segment_weights(customer_segments: Tuple[str, ...]) -> Tuple[int, Tuple[Tuple[int, int], ...]]:
+    """고객 세그먼트를 비트 마스크와 중복 보정값으로 변환합니다 (같은 조합은 캐시 재사용).
+
+    Returns:
+        (세그먼트 마스크, 두 번 이상 등장한 세그먼트의 (비트, 추가 횟수) 목록)
+    """
+    counts = Counter(_SEGMENT_BITS[segment.lower()] for segment in customer_segments)
+    mask = 0
+    for bit in counts:
+        mask |= bit
+    extras = tuple((bit, count - 1) for bit, count in counts.items() if count > 1)
+    return mask, extras
+
+
+@functools.lru_cache(maxsize=1024)
+def _target_segment_mask(target_segment: str, price_sensitivity: str) -> int:
+    """요금제 타겟 문자열에 포함된 세그먼트 비트 마스크 (같은 메타데이터는 캐시 재사용)."""
+    combined_target = f"{target_segment} {price_sensitivity}".lower()
+    mask = 0
+    for segment, bit in _SEGMENT_BITS.items():
+        if segment in combined_target:
+            mask |= bit
+    return mask
+
+
 def _calculate_segment_match_score(
     target_segment: str,
     price_sensitivity: str,
-    customer_segments: List[str]
+    segment_weights: Tuple[int, Tuple[Tuple[int, int], ...]]
 ) -> int:
-    """고객 세그먼트와 요금제 타겟 세그먼트의 매칭 점수를 계산합니다."""
-    if not customer_segments:
+    """고객 세그먼트와 요금제 타겟 세그먼트의 매칭 점수를 계산합니다.
+
+    공통 비트 수(popcount)에 중복 세그먼트의 추가 횟수를 더합니다.
+    """
+    customer_mask, extras = segment_weights
+    if not customer_mask or not (target_segment or price_sensitivity):
         return 0
-    combined_target = f"{target_segment} {price_sensitivity}".lower()
-    match_count = 0
-    for segment in customer_segments:
-        if segment.lower() in combined_target:
-            match_count += 1
-    return match_count
+    matched = customer_mask & _target_segment_mask(target_segment, price_sensitivity)
+    score = matched.bit_count()
+    for bit, extra in extras:
+        if matched & bit:
+            score += extra
+    return score
 
 
 def _sort_by_customer_fit(
     results: List[PolicyRecommendation],
     customer: CustomerContext
 ) -> List[PolicyRecommendation]:
-    """고객 특성에 맞는 요금제 순으로 정렬합니다."""
-    customer_segments = customer.get_customer_segments()
+    """고객 특성에 맞는 요금제 순으로 정렬합니다.
+
+    고객 단위 값(세그먼트 가중치, 적정 가격 구간)은 정렬 1회당 한 번만 계산합니다.
+    """
+    if len(results) < 2:
+        return results
+    segment_weights = _segment_weights(
+        _customer_segments(customer.age, customer.membership_grade, customer.monthly_fee)
+    )
     current_fee = customer.monthly_fee
     current_data = customer.current_data_gb
+    # 현재 요금 대비 0.5~1.5배 구간 (항목마다 나눗셈 대신 경계 비교)
+    price_low = current_fee * 0.5
+    price_high = current_fee * 1.5
 
     def calculate_sort_key(rec: PolicyRecommendation) -> tuple:
         search_text = rec.metadata.get("search_text", "")
@@ -457,14 +875,13 @@ def _sort_by_customer_fit(
         target_segment = rec.metadata.get("target_segment", "")
         price_sensitivity = rec.metadata.get("price_sensitivity", "")
         segment_score = -_calculate_segment_match_score(
-            target_segment, price_sensitivity, customer_segments
+            target_segment, price_sensitivity, segment_weights
         )
         price = rec.metadata.get("monthly_price", 0) or 0
         if current_fee > 0 and price > 0:
-            ratio = price / current_fee
-            if 0.5 <= ratio <= 1.5:
+            if price_low <= price <= price_high:
                 price_score = 0
-            elif ratio < 0.5:
+            elif price < price_low:
                 price_score = 1
             else:
                 price_score = 2
@@ -476,125 +893,158 @@ def _sort_by_customer_fit(
     return sorted(results, key=calculate_sort_key)
 
 
-async def _get_embedding(text: str) -> List[float]:
-    """텍스트의 임베딩 벡터를 생성합니다."""
-    from langchain_openai import OpenAIEmbeddings
-    embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-    vector = await embeddings.aembed_query(text)
-    return vector
+async def _get_embedding(text: str) -> Sequence[float]:
+    """텍스트의 임베딩 벡터를 생성합니다 (LRU 캐시 + 공유 커넥션 풀 재사용, float32 array)."""
+    return await embed_query(text)
+
+
+def _parse_document_details(json_str: Optional[str]) -> Optional[Dict[str, Any]]:
+    """검색 쿼리가 추출한 상세 정보 JSON을 파싱합니다 (없거나 파싱 실패 시 None).
+
+    추출은 _RAG_SEARCH_SQL의 details_json 컬럼에서 서버 측으로 수행합니다.
+    orjson이 설치되어 있으면 C 파서를 사용합니다.
+    """
+    if not json_str:
+        return None
+    try:
+        doc_data = orjson.loads(json_str) if ORJSON_AVAILABLE else json.loads(json_str)
+    except (ValueError, TypeError):
+        return None
+    return doc_data if isinstance(doc_data, dict) else None
+
+
+def _row_to_recommendation(row: Any) -> PolicyRecommendation:
+    """벡터 검색 결과 행 하나를 추천 객체로 변환합니다 (추천 이유 제외)."""
+    metadata = row["cmetadata"] or {}
+    title = metadata.get("name", "정책 문서")
+    monthly_price = metadata.get("monthly_price_numeric", 0)
+
+    plan_details = {}
+    document_head = row["document"]
+    doc_data = _parse_document_details(row["details_json"])
+    if doc_data:
+        plan_details = doc_data.get("plan_details", {})
+        if not title or title == "정책 문서":
+            title = doc_data.get("name", title)
+        if not monthly_price:
+            monthly_price = doc_data.get("monthly_price_numeric", 0)
+
+    return PolicyRecommendation(
+        collection=row["collection_name"],
+        title=title,
+        content=document_head or "",
+        relevance_score=float(row["similarity"]),
+        metadata={
+            "monthly_price": monthly_price,
+            "target_segment": metadata.get("target_segment", ""),
+            "price_sensitivity": metadata.get("price_sensitivity", ""),
+            "product_type": metadata.get("product_type", ""),
+            "search_text": metadata.get("search_text", ""),
+            "plan_details": plan_details,
+        },
+    )
+
+
+def _build_recommendations(
+    rows: List[Any],
+    customer: CustomerContext,
+    intent_label: str,
+    is_plan_search: bool,
+    top_k: int,
+) -> List[PolicyRecommendation]:
+    """벡터 검색 결과 행을 파싱하고 고객 적합도 순으로 정렬합니다 (동기).
+
+    요금제 검색이 아니면 DB 유사도 순서를 그대로 쓰므로 상위 top_k 행만 변환하고,
+    추천 이유는 최종 top_k 결과에 대해서만 생성합니다.
+    """
+    if not is_plan_search:
+        rows = rows[:top_k]
+
+    results = [_row_to_recommendation(row) for row in rows]
+
+    if is_plan_search:
+        results = _sort_by_customer_fit(results, customer)[:top_k]
+
+    for rec in results:
+        rec.recommendation_reason = _generate_recommendation_reason(rec, customer, intent_label)
+    return results
+
+
+async def _resolve_collection_uuids(db: Any, collection_names: List[str]) -> List[Tuple[str, UUID]]:
+    """컬렉션 이름을 UUID로 변환합니다 (캐시 미스/만료 시 langchain_pg_collection 1회 조회).
+
+    존재하지 않는 컬렉션은 결과에서 제외합니다 (이름 JOIN 시 결과 없음과 동일).
+    """
+    global _collection_uuids, _collection_uuids_loaded_at
+    expired = time.monotonic() - _collection_uuids_loaded_at > COLLECTION_UUID_TTL
+    if expired or any(name not in _collection_uuids for name in collection_names):
+        rows = await db.fetch("SELECT uuid, name FROM langchain_pg_collection")
+        _collection_uuids = {row["name"]: row["uuid"] for row in rows}
+        _collection_uuids_loaded_at = time.monotonic()
+    return [
+        (name, _collection_uuids[name])
+        for name in collection_names if name in _collection_uuids
+    ]
 
 
 async def _search_with_collections(
-    query_embedding: List[float],
+    query_embedding: Sequence[float],
     collection_names: List[str],
     customer: CustomerContext,
     intent_label: str,
     top_k: int = 5,
 ) -> List[PolicyRecommendation]:
-    """컬렉션 필터를 적용하여 벡터 검색을 수행합니다."""
-    from modules.database import get_db_manager
-    import json
-    import re
+    """컬렉션 필터를 적용하여 벡터 검색을 수행합니다.
 
+    DB 오류는 로그 후 다시 발생시킵니다 (일시적 오류의 빈 결과가 캐시되지 않도록).
+    """
     try:
         db = get_db_manager()
         if not db.is_initialized:
             logger.warning("[RAG] DB 초기화 안됨, 검색 스킵")
             return []
 
-        embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
-
-        if collection_names:
-            collection_filter = " OR ".join([
-                f"c.name = '{col}'" for col in collection_names
-            ])
-            where_clause = f"({collection_filter})"
-        else:
-            where_clause = "c.name = 'kt_mobile_plans'"
-
-        if customer.current_plan:
-            safe_plan_name = customer.current_plan.replace("'", "''")
-            where_clause += f" AND (e.cmetadata->>'name' IS NULL OR e.cmetadata->>'name' != '{safe_plan_name}')"
-
         plan_collections = {"kt_mobile_plans", "kt_internet_plans", "kt_tv_plans"}
         is_plan_search = bool(set(collection_names) & plan_collections) if collection_names else True
 
-        query = f"""
-            SELECT
-                c.name as collection_name,
-                e.document,
-                e.cmetadata,
-                1 - (e.embedding <=> $1::vector) as similarity
-            FROM {EMBEDDING_TABLE} e
-            JOIN langchain_pg_collection c ON e.collection_id = c.uuid
-            WHERE {where_clause}
-            ORDER BY e.embedding <=> $1::vector
-            LIMIT $2
-        """
-
-        rows = await db.fetch(query, embedding_str, top_k * 2)
-
-        results = []
-        for row in rows:
-            metadata = row["cmetadata"] or {}
-            title = metadata.get("name", "정책 문서")
-            monthly_price = metadata.get("monthly_price_numeric", 0)
-
-            plan_details = {}
-            document_raw = row["document"]
-            if document_raw:
-                try:
-                    json_match = re.search(r'상세 정보:\s*(\{.*\})\s*$', document_raw, re.DOTALL)
-                    if json_match:
-                        json_str = json_match.group(1)
-                        doc_data = json.loads(json_str)
-                        if isinstance(doc_data, dict):
-                            plan_details = doc_data.get("plan_details", {})
-                            if not title or title == "정책 문서":
-                                title = doc_data.get("name", title)
-                            if not monthly_price:
-                                monthly_price = doc_data.get("monthly_price_numeric", 0)
-                    else:
-                        doc_data = json.loads(document_raw)
-                        if isinstance(doc_data, dict):
-                            plan_details = doc_data.get("plan_details", {})
-                            if not title or title == "정책 문서":
-                                title = doc_data.get("name", title)
-                            if not monthly_price:
-                                monthly_price = doc_data.get("monthly_price_numeric", 0)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-            rec = PolicyRecommendation(
-                collection=row["collection_name"],
-                title=title,
-                content=document_raw[:500] if document_raw else "",
-                relevance_score=float(row["similarity"]),
-                metadata={
-                    "monthly_price": monthly_price,
-                    "target_segment": metadata.get("target_segment", ""),
-                    "price_sensitivity": metadata.get("price_sensitivity", ""),
-                    "product_type": metadata.get("product_type", ""),
-                    "search_text": metadata.get("search_text", ""),
-                    "plan_details": plan_details,
-                },
+        # 벡터는 연결 풀의 pgvector 바이너리 코덱으로 전송 (문자열 직렬화 없음)
+        # 컬렉션별 쿼리를 병렬 실행 (컬렉션 수만큼 풀 연결 사용)
+        limit = top_k * 2
+        exclude_plan = customer.current_plan or ""
+        collections = await _resolve_collection_uuids(db, collection_names or ["kt_mobile_plans"])
+        if not collections:
+            return []
+        rows_lists = await asyncio.gather(*(
+            db.fetch(_RAG_SEARCH_SQL, query_embedding, uuid, exclude_plan, limit, name)
+            for name, uuid in collections
+        ))
+        if len(rows_lists) == 1:
+            rows = rows_lists[0]
+        else:
+            rows = heapq.nlargest(
+                limit, chain.from_iterable(rows_lists),
+                key=lambda row: row["similarity"],
             )
-            rec.recommendation_reason = _generate_recommendation_reason(rec, customer, intent_label)
-            results.append(rec)
 
-        if is_plan_search:
-            results = _sort_by_customer_fit(results, customer)
-
-        return results[:top_k]
+        # 행 파싱/점수 계산은 최대 수십 행이라 인라인 실행 (스레드 전환/GIL 경합보다 저렴)
+        return _build_recommendations(rows, customer, intent_label, is_plan_search, top_k)
 
     except Exception as e:
-        logger.error(f"[RAG] 검색 실패: {e}")
-        return []
+        logger.error("[RAG] 검색 실패: %s", e)
+        raise
+
+
+# 멤버십 등급 정보 캐시 (상품 기준 정보라 거의 변하지 않음): (조회 시각, 등급 목록, 등급표 문자열)
+MEMBERSHIP_GRADE_CACHE_TTL = 3600.0
+_membership_grade_cache: Optional[Tuple[float, List[PolicyRecommendation], str]] = None
 
 
 async def _get_all_membership_grades() -> List[PolicyRecommendation]:
-    """모든 멤버십 등급 정보를 등급 순서대로 가져옵니다."""
-    from modules.database import get_db_manager
+    """모든 멤버십 등급 정보를 등급 순서대로 가져옵니다 (TTL 동안 캐시 재사용)."""
+    global _membership_grade_cache
+    cached = _membership_grade_cache
+    if cached is not None and time.monotonic() - cached[0] < MEMBERSHIP_GRADE_CACHE_TTL:
+        return cached[1]
 
     try:
         db = get_db_manager()
@@ -636,12 +1086,24 @@ async def _get_all_membership_grades() -> List[PolicyRecommendation]:
             rec.recommendation_reason = f"{grade} 등급: 연 {spending} 이용 시 적용"
             results.append(rec)
 
+        if results:
+            _membership_grade_cache = (
+                time.monotonic(), results, _format_membership_table(results),
+            )
         return results
     except Exception as e:
-        logger.error(f"[RAG] 멤버십 등급 조회 실패: {e}")
+        logger.error("[RAG] 멤버십 등급 조회 실패: %s", e)
         return []
 
 
+def _get_membership_table(grades: List[PolicyRecommendation]) -> str:
+    """등급 목록의 표 문자열을 반환합니다 (캐시된 등급 목록이면 미리 만든 표 재사용)."""
+    cached = _membership_grade_cache
+    if cached is not None and cached[1] is grades:
+        return cached[2]
+    return _format_membership_table(grades)
+
+
 def _format_membership_table(grades: List[PolicyRecommendation]) -> str:
     """멤버십 등급 정보를 표 형태의 문자열로 포맷합니다."""
     if not grades:
@@ -697,37 +1159,22 @@ async def rag_policy_search(
         customer = CustomerContext.from_dict(customer_info or {})
         collection_names = _get_collections_for_intent(intent_label, customer_query)
         logger.info(
-            f"[RAG] 검색 시작: 의도='{intent_label}', "
-            f"컬렉션={collection_names}, 월요금={customer.monthly_fee}"
+            "[RAG] 검색 시작: 의도='%s', 컬렉션=%s, 월요금=%s",
+            intent_label, collection_names, customer.monthly_fee,
         )
 
         is_membership_grade_query = (
-            "membership" in collection_names and
-            any(kw in f"{intent_label} {customer_query}".lower()
-                for kw in ["등급", "기준", "조건", "vvip", "vip", "gold", "silver"])
+            COLLECTIONS["membership"] in collection_names and bool(
+                _MEMBERSHIP_GRADE_PATTERN.search(intent_label)
+                or _MEMBERSHIP_GRADE_PATTERN.search(customer_query)
+            )
         )
 
-        if is_membership_grade_query:
-            all_grades = await _get_all_membership_grades()
-            if all_grades:
-                grade_table = _format_membership_table(all_grades)
-                search_context = _generate_search_context(customer, intent_label, collection_names)
-                search_context = f"{search_context}\n\n{grade_table}"
-                return RAGPolicyResult(
-                    intent_label=intent_label,
-                    query=customer_query,
-                    searched_classifications=collection_names,
-                    recommendations=all_grades,
-                    search_context=search_context,
-                )
-
         search_query = f"{intent_label} {customer_query}"
         if customer.current_plan:
             search_query = f"{search_query} 현재 {customer.current_plan}"
 
-        data_keywords = ["많은", "더", "늘리", "부족", "초과", "무제한", "대용량"]
-        query_lower = customer_query.lower()
-        if any(kw in query_lower for kw in data_keywords):
+        if _DATA_UPGRADE_PATTERN.search(customer_query):
             if customer.current_data_gb > 0:
                 search_query = f"{search_query} 데이터 {customer.current_data_gb}GB 이상 무제한"
             else:
@@ -736,28 +1183,68 @@ async def rag_policy_search(
         if conversation_context:
             search_query = f"{search_query} {conversation_context[:200]}"
 
-        query_embedding = await _get_embedding(search_query)
+        # 임베딩 생성(OpenAI 왕복)을 먼저 시작하고 등급표 조회와 겹쳐 실행
+        # (등급표가 없어 벡터 검색으로 폴백할 때 임베딩 대기 시간 제거)
+        embed_task = asyncio.create_task(_get_embedding(search_query))
 
-        recommendations = await _search_with_collections(
-            query_embedding=query_embedding,
-            collection_names=collection_names,
-            customer=customer,
-            intent_label=intent_label,
-            top_k=top_k
-        )
+        if is_membership_grade_query:
+            all_grades = await _get_all_membership_grades()
+            if all_grades:
+                embed_task.cancel()
+                grade_table = _get_membership_table(all_grades)
+                search_context = _generate_search_context(customer, intent_label, collection_names)
+                search_context = f"{search_context}\n\n{grade_table}"
+                return RAGPolicyResult(
+                    intent_label=intent_label,
+                    query=customer_query,
+                    searched_classifications=collection_names,
+                    recommendations=all_grades,
+                    search_context=search_context,
+                )
+
+        query_embedding = await embed_task
+
+        # 표현만 다른 유사 질문이면 이전 결과 재사용 (pgvector 조회 생략)
+        cache_scope = (intent_label, tuple(collection_names), astuple(customer))
+        cached_result = _rag_result_cache.get(query_embedding, cache_scope)
+        if cached_result is not None:
+            logger.info("[RAG] 시맨틱 캐시 적중: 의도='%s'", intent_label)
+            return replace(cached_result, query=customer_query)
+
+        # 같은 검색이 이미 진행 중이면 그 결과를 함께 기다림 (single-flight)
+        flight_key = (search_query, cache_scope, top_k)
+        search_task = _inflight_rag_searches.get(flight_key)
+        is_leader = search_task is None
+        if is_leader:
+            search_task = asyncio.ensure_future(_search_with_collections(
+                query_embedding=query_embedding,
+                collection_names=collection_names,
+                customer=customer,
+                intent_label=intent_label,
+                top_k=top_k
+            ))
+            _inflight_rag_searches[flight_key] = search_task
+            search_task.add_done_callback(
+                lambda _task: _inflight_rag_searches.pop(flight_key, None)
+            )
+        recommendations = await asyncio.shield(search_task)
 
         search_context = _generate_search_context(customer, intent_label, collection_names)
 
-        return RAGPolicyResult(
+        result = RAGPolicyResult(
             intent_label=intent_label,
             query=customer_query,
             searched_classifications=collection_names,
             recommendations=recommendations,
             search_context=search_context,
         )
+        # 빈 결과(DB 미초기화 등)는 캐시하지 않음 (검색 오류는 예외로 전파되어 캐시 안 됨)
+        if is_leader and recommendations:
+            _rag_result_cache.put(query_embedding, cache_scope, result)
+        return result
 
     except Exception as e:
-        logger.error(f"[RAG] 정책 검색 실패: {e}", exc_info=True)
+        logger.error("[RAG] 정책 검색 실패: %s", e, exc_info=True)
         return RAGPolicyResult(
             intent_label=intent_label,
             query=customer_query,
@@ -783,9 +1270,11 @@ def create_summarize_node(llm: BaseChatModel):
         last_summarized_index = state.get("last_summarized_index", 0)
         current_summary = state.get("current_summary", "")
         existing_summary_result = state.get("summary_result", {})
+        # 요약 전에 이력 압축으로 제거된 발화 (manager._compact_history가 보관)
+        pending_summary_text = state.get("pending_summary_text", "")
 
         total_count = len(conversation_history)
-        if last_summarized_index >= total_count:
+        if last_summarized_index >= total_count and not pending_summary_text:
             logger.debug("[에이전트] 새로운 대화 없음, 기존 요약 유지")
             return {
                 "current_summary": current_summary,
@@ -795,6 +1284,8 @@ def create_summarize_node(llm: BaseChatModel):
         new_entries = conversation_history[last_summarized_index:]
         new_last_index = total_count
         new_conversation_text = _format_conversation_text(new_entries)
+        if pending_summary_text:
+            new_conversation_text = f"{pending_summary_text}\n{new_conversation_text}".rstrip()
 
         previous_summary_text = "없음"
         try:
@@ -830,7 +1321,7 @@ def create_summarize_node(llm: BaseChatModel):
             )
             summary_json = latest_summary.model_dump_json(ensure_ascii=False)
         except Exception as e:
-            logger.error(f"[에이전트] 요약 노드 LLM 호출 실패: {e}")
+            logger.error("[에이전트] 요약 노드 LLM 호출 실패: %s", e)
             return {
                 "summary_result": state.get("summary_result", {}),
                 "current_summary": current_summary,
@@ -840,7 +1331,8 @@ def create_summarize_node(llm: BaseChatModel):
         return {
             "summary_result": latest_summary.model_dump(),
             "current_summary": summary_json,
-            "last_summarized_index": new_last_index
+            "last_summarized_index": new_last_index,
+            "pending_summary_text": "",
         }
 
     return summarize_node
@@ -882,17 +1374,67 @@ def create_intent_node(llm: BaseChatModel):
             HumanMessage(content=user_content),
         ]
 
+        customer_query = _recent_customer_query(
+            conversation_history, state.get("recent_customer_utts")
+        ).strip()
+        last_faq_query = state.get("last_faq_query", "")
+        # faq_search 노드의 스킵 조건과 동일 (짧은 쿼리/직전과 유사한 쿼리는 선행 검색 안 함)
+        can_prefetch_faq = len(customer_query) >= FAQ_MIN_QUERY_LENGTH and not (
+            last_faq_query
+            and (
+                customer_query == last_faq_query
+                or _is_similar_query(customer_query, last_faq_query)
+            )
+        )
+
         try:
-            result = await structured_llm.ainvoke(messages)
+            # 구조화 출력을 스트리밍하여 라벨이 확정되는 즉시 FAQ 검색을 시작
+            # (나머지 필드 생성과 FAQ 임베딩/검색 지연을 겹침)
+            result = None
+            preliminary_label = None
+            async for chunk in structured_llm.astream(messages):
+                result = chunk
+                if preliminary_label is not None:
+                    continue
+                preliminary_label = _preliminary_intent_label(chunk)
+                if preliminary_label is None:
+                    continue
+                runtime.stream_writer({
+                    "intent": {
+                        "intent_label_preliminary": preliminary_label,
+                        "intent_result": {"intent_label": preliminary_label, "partial": True},
+                    }
+                })
+                if can_prefetch_faq:
+                    should_prefetch, prefetch_category = _should_trigger_faq(
+                        preliminary_label, customer_query
+                    )
+                    if should_prefetch:
+                        _start_faq_prefetch(
+                            customer_query,
+                            prefetch_category,
+                            _faq_top1_emitter(
+                                runtime, customer_query,
+                                frozenset(state.get("shown_faq_ids", [])),
+                            ),
+                        )
+
             intent_model = (
                 result if isinstance(result, IntentResult) else IntentResult.model_validate(result)
             )
+            # FAQ 트리거 판단을 한 번만 계산하여 faq_search가 재사용 (계산 시점 대화 수 기록)
+            faq_trigger, faq_category = _should_trigger_faq(
+                intent_model.intent_label, customer_query
+            )
             return {
                 "intent_result": intent_model.model_dump(),
+                "faq_trigger": faq_trigger,
+                "faq_category": faq_category,
+                "faq_trigger_index": len(conversation_history),
                 "last_intent_index": len(conversation_history)
             }
         except Exception as e:
-            logger.error(f"[에이전트] 의도 노드 LLM 호출 실패: {e}")
+            logger.error("[에이전트] 의도 노드 LLM 호출 실패: %s", e)
             return {"last_intent_index": len(conversation_history)}
 
     return intent_node
@@ -919,7 +1461,7 @@ def create_sentiment_node(llm: BaseChatModel):
 
         recent_user_utts = [
             e for e in conversation_history[-8:]
-            if e.get("speaker_name", "").startswith("고객") or e.get("speaker_id", "").startswith("user")
+            if e.speaker_name.startswith("고객") or e.speaker_id.startswith("user")
         ] or conversation_history[-4:]
 
         convo_text = _format_conversation_text(recent_user_utts)
@@ -945,7 +1487,7 @@ def create_sentiment_node(llm: BaseChatModel):
                 "last_sentiment_index": len(conversation_history)
             }
         except Exception as e:
-            logger.error(f"[에이전트] 감정 노드 LLM 호출 실패: {e}")
+            logger.error("[에이전트] 감정 노드 LLM 호출 실패: %s", e)
             return {"last_sentiment_index": len(conversation_history)}
 
     return sentiment_node
@@ -1003,7 +1545,7 @@ def create_draft_reply_node(llm: BaseChatModel):
                 "last_draft_index": len(conversation_history)
             }
         except Exception as e:
-            logger.error(f"[에이전트] 응답 초안 노드 LLM 호출 실패: {e}")
+            logger.error("[에이전트] 응답 초안 노드 LLM 호출 실패: %s", e)
             return {"last_draft_index": len(conversation_history)}
 
     return draft_reply_node
@@ -1057,7 +1599,7 @@ def create_risk_node(llm: BaseChatModel):
                 "last_risk_index": len(conversation_history)
             }
         except Exception as e:
-            logger.error(f"[에이전트] 위험 감지 노드 LLM 호출 실패: {e}")
+            logger.error("[에이전트] 위험 감지 노드 LLM 호출 실패: %s", e)
             return {"last_risk_index": len(conversation_history)}
 
     return risk_node
@@ -1073,47 +1615,44 @@ def create_rag_policy_node():
         customer_info = state.get("customer_info", {})
         last_rag_index = state.get("last_rag_index", 0)
         last_rag_intent = state.get("last_rag_intent", "")
+        index_update = _advance_index("last_rag_index", last_rag_index, len(conversation_history))
 
         if not intent_result:
             logger.info("[RAG] 의도 결과 없음, 스킵")
-            return {"last_rag_index": len(conversation_history)}
+            return index_update
 
         intent_label = intent_result.get("intent_label", "")
         intent_confidence = intent_result.get("intent_confidence", 0.0)
 
         if intent_label and intent_label == last_rag_intent:
-            logger.info(f"[RAG] 동일 의도 '{intent_label}', 중복 검색 스킵")
+            logger.info("[RAG] 동일 의도 '%s', 중복 검색 스킵", intent_label)
             return {
                 "rag_policy_result": {
                     "skipped": True,
                     "skip_reason": "동일한 의도로 이미 검색된 결과가 있습니다.",
                     "intent_label": intent_label
                 },
-                "last_rag_index": len(conversation_history)
+                **index_update
             }
 
-        recent_customer_utts = []
-        for entry in reversed(conversation_history[-6:]):
-            speaker_name = entry.get("speaker_name", "")
-            is_customer = entry.get("is_customer", False)
-            if is_customer or speaker_name.startswith("고객"):
-                recent_customer_utts.insert(0, entry.get("text", ""))
-                if len(recent_customer_utts) >= 2:
-                    break
-        customer_query = " ".join(recent_customer_utts)
+        customer_query = _recent_customer_query(
+            conversation_history, state.get("recent_customer_utts")
+        )
 
         if not _should_trigger_rag(intent_label, customer_query, intent_confidence):
-            logger.info(f"[RAG] 검색 불필요: 의도='{intent_label}' (신뢰도={intent_confidence:.2f})")
+            logger.info(
+                "[RAG] 검색 불필요: 의도='%s' (신뢰도=%.2f)", intent_label, intent_confidence
+            )
             return {
                 "rag_policy_result": {
                     "skipped": True,
                     "skip_reason": "RAG 검색이 필요하지 않은 의도입니다.",
                     "intent_label": intent_label
                 },
-                "last_rag_index": len(conversation_history)
+                **index_update
             }
 
-        logger.info(f"[RAG] 정책 검색 중: 의도='{intent_label}'")
+        logger.info("[RAG] 정책 검색 중: 의도='%s'", intent_label)
 
         try:
             rag_result = await rag_policy_search(
@@ -1125,15 +1664,15 @@ def create_rag_policy_node():
             result_dict = rag_result.to_dict()
             result_dict["skipped"] = False
 
-            logger.info(f"[RAG] 검색 완료: {len(rag_result.recommendations)}개 추천")
+            logger.info("[RAG] 검색 완료: %d개 추천", len(rag_result.recommendations))
 
             return {
                 "rag_policy_result": result_dict,
-                "last_rag_index": len(conversation_history),
+                **index_update,
                 "last_rag_intent": intent_label
             }
         except Exception as e:
-            logger.error(f"[RAG] 정책 검색 실패: {e}")
+            logger.error("[RAG] 정책 검색 실패: %s", e)
             return {
                 "rag_policy_result": {
                     "skipped": False,
@@ -1144,79 +1683,87 @@ def create_rag_policy_node():
                     "search_context": "",
                     "error": str(e)
                 },
-                "last_rag_index": len(conversation_history)
+                **index_update
             }
 
     return rag_policy_node
 
 
 def create_faq_search_node():
-    """FAQ Semantic Cache 검색 노드를 생성합니다."""
+    """FAQ Semantic Cache 검색 노드를 생성합니다.
+
+    FAQ 데이터 로드는 app.py lifespan에서 수행합니다 (미초기화 상태면 첫 검색 시 초기화).
+    """
 
     async def faq_search_node(state: Any, runtime: Runtime) -> Dict[str, Any]:
         """FAQ semantic cache 검색 노드."""
-        from modules.database import get_faq_service
 
         conversation_history = state.get("conversation_history", [])
         last_faq_index = state.get("last_faq_index", 0)
         last_faq_query = state.get("last_faq_query", "")
         shown_faq_ids = set(state.get("shown_faq_ids", []))
+        index_update = _advance_index("last_faq_index", last_faq_index, len(conversation_history))
 
         has_new_customer = _has_customer_turn_since(conversation_history, last_faq_index)
         if not has_new_customer:
             logger.debug("[FAQ] 새로운 고객 발화 없음, 스킵")
-            return {"last_faq_index": len(conversation_history)}
-
-        recent_customer_utts = []
-        for entry in reversed(conversation_history[-6:]):
-            speaker_name = entry.get("speaker_name", "")
-            is_customer = entry.get("is_customer", False)
-            if is_customer or speaker_name.startswith("고객"):
-                recent_customer_utts.insert(0, entry.get("text", ""))
-                if len(recent_customer_utts) >= 2:
-                    break
-        customer_query = " ".join(recent_customer_utts)
-
-        if not customer_query.strip():
-            logger.debug("[FAQ] 고객 발화 텍스트 없음, 스킵")
-            return {"last_faq_index": len(conversation_history)}
-
-        if last_faq_query and _is_similar_query(customer_query, last_faq_query):
-            logger.debug(f"[FAQ] 유사 쿼리 중복, 스킵: '{customer_query[:30]}...'")
+            return index_update
+
+        customer_query = _recent_customer_query(
+            conversation_history, state.get("recent_customer_utts")
+        )
+
+        # 임베딩/DB 조회 전에 빈 쿼리나 너무 짧은 쿼리는 바로 스킵
+        customer_query = customer_query.strip()
+        if len(customer_query) < FAQ_MIN_QUERY_LENGTH:
+            logger.debug("[FAQ] 고객 발화가 비었거나 너무 짧음, 스킵")
+            return index_update
+
+        if last_faq_query and (
+            customer_query == last_faq_query
+            or _is_similar_query(customer_query, last_faq_query)
+        ):
+            logger.debug("[FAQ] 유사 쿼리 중복, 스킵: '%.30s...'", customer_query)
             return {
                 "faq_result": {
                     "skipped": True,
                     "skip_reason": "유사한 질문으로 이미 검색된 결과가 있습니다.",
                     "query": customer_query
                 },
-                "last_faq_index": len(conversation_history)
+                **index_update
             }
 
-        should_search = _should_trigger_faq_by_text(customer_query)
+        # intent가 이번 대화까지 계산한 트리거가 있으면 재사용
+        # (intent 스킵/실패로 트리거가 이전 턴 것이면 텍스트만으로 판단)
+        if state.get("faq_trigger_index", -1) == len(conversation_history):
+            should_search = state.get("faq_trigger", False)
+            faq_category = state.get("faq_category")
+        else:
+            should_search, faq_category = _should_trigger_faq("", customer_query)
         if not should_search:
-            logger.debug(f"[FAQ] 검색 불필요: 쿼리='{customer_query[:30]}...'")
+            logger.debug("[FAQ] 검색 불필요: 쿼리='%.30s...'", customer_query)
             return {
                 "faq_result": {
                     "skipped": True,
                     "skip_reason": "FAQ 검색이 필요하지 않은 발화입니다.",
                     "query": customer_query
                 },
-                "last_faq_index": len(conversation_history)
+                **index_update
             }
 
-        logger.debug(f"[FAQ] 검색 중: 쿼리='{customer_query[:50]}...'")
+        logger.debug("[FAQ] 검색 중: 쿼리='%.50s...', 카테고리=%s", customer_query, faq_category)
 
         try:
-            faq_service = get_faq_service()
-            if not faq_service.is_initialized:
-                await faq_service.initialize()
-
-            result = await faq_service.semantic_search(
-                query=customer_query,
-                limit=5,
-                use_cache=True,
-                distance_threshold=0.45,
-            )
+            # intent 스트리밍 중 같은 쿼리/카테고리로 시작된 검색이 있으면 그 결과를 사용
+            prefetch = _take_faq_prefetch(customer_query, faq_category)
+            if prefetch is not None:
+                result = await prefetch
+            else:
+                result = await _faq_search(
+                    customer_query,
+                    faq_category,
+                    _faq_top1_emitter(runtime, customer_query, frozenset(shown_faq_ids)),
+                )
 
             new_faqs = []
             new_faq_ids = []
@@ -1236,13 +1783,14 @@ def create_faq_search_node():
                         "skip_reason": "이미 안내된 FAQ입니다.",
                         "query": customer_query
                     },
-                    "last_faq_index": len(conversation_history)
+                    **index_update
                 }
 
             updated_shown_ids = list(shown_faq_ids | set(new_faq_ids))
 
             faq_result = {
                 "skipped": False,
+                "partial": False,
                 "query": customer_query,
                 "cache_hit": result.cache_hit,
                 "similarity_score": result.similarity_score,
@@ -1252,19 +1800,19 @@ def create_faq_search_node():
             }
 
             logger.debug(
-                f"[FAQ] 검색 완료: {len(new_faqs)}개 (필터 전 {len(result.faqs)}개, "
-                f"캐시={result.cache_hit}, 유사도={result.similarity_score:.3f})"
+                "[FAQ] 검색 완료: %d개 (필터 전 %d개, 캐시=%s, 유사도=%.3f)",
+                len(new_faqs), len(result.faqs), result.cache_hit, result.similarity_score,
             )
 
             return {
                 "faq_result": faq_result,
-                "last_faq_index": len(conversation_history),
+                **index_update,
                 "last_faq_query": customer_query,
                 "shown_faq_ids": updated_shown_ids,
             }
 
         except Exception as e:
-            logger.error(f"[FAQ] 검색 실패: {e}")
+            logger.error("[FAQ] 검색 실패: %s", e)
             return {
                 "faq_result": {
                     "skipped": False,
@@ -1272,7 +1820,7 @@ def create_faq_search_node():
                     "faqs": [],
                     "error": str(e)
                 },
-                "last_faq_index": len(conversation_history)
+                **index_update
             }
 
     return faq_search_node
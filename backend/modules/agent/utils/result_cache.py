@@ -0,0 +1,137 @@
+"""임베딩 유사도 기반 검색 결과 캐시.
+
+표현만 다른 같은 질문("89000원 왜 찍혔죠" / "요금이 왜 89000원인가요")에 대해
+이전 검색 결과를 재사용하여 pgvector 조회 왕복을 생략합니다.
+
+- 범위(scope): 의도/컬렉션/고객 컨텍스트가 같은 항목끼리만 비교
+- 유사도: L2 정규화 벡터의 내적 (= 코사인 유사도)
+- 저장: 정규화 벡터를 int8 + 벡터별 scale로 양자화 (FP32 대비 메모리 1/4)
+- 만료: 전체 항목 수 상한(LRU) + TTL
+
+Usage:
+    >>> cache = SemanticResultCache(max_size=1024, ttl=300.0, threshold=0.95)
+    >>> cached = cache.get(vector, scope)
+    >>> if cached is None:
+    ...     cache.put(vector, scope, result)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from modules.database import quantize_int8
+
+
+class SemanticResultCache:
+    """범위별 쿼리 벡터 유사도로 결과를 재사용하는 인메모리 캐시.
+
+    Attributes:
+        max_size: 전체 최대 항목 수 (초과 시 가장 오래 전 사용 항목 제거)
+        ttl: 항목 유효 시간 (초)
+        threshold: 적중으로 인정할 최소 코사인 유사도
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0, threshold: float = 0.95):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.threshold = threshold
+        # 항목 ID -> (scope, int8 코드, scale, 결과, 생성 시각), 접근 순서 유지
+        self._entries: "OrderedDict[int, Tuple[Hashable, np.ndarray, float, Any, float]]" = OrderedDict()
+        # scope -> 항목 ID 목록
+        self._scopes: Dict[Hashable, List[int]] = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm > 0 else array
+
+    @classmethod
+    def _quantize(cls, vector) -> Tuple[np.ndarray, float]:
+        """정규화 벡터를 int8 코드와 scale로 양자화합니다 (v ≈ codes * scale)."""
+        return quantize_int8(cls._normalize(vector))
+
+    def get(self, vector, scope: Hashable) -> Optional[Any]:
+        """같은 범위에서 가장 유사한 항목의 결과를 반환합니다.
+
+        Args:
+            vector: 쿼리 임베딩 벡터
+            scope: 비교 범위 키
+
+        Returns:
+            캐시된 결과 (유사도 threshold 미만이거나 없으면 None)
+        """
+        ids = self._scopes.get(scope)
+        if ids:
+            self._expire(ids)
+        if not ids:
+            self.misses += 1
+            return None
+
+        # 쿼리는 FP32 그대로, 저장 항목만 int8 -> FP32 복원 후 scale 곱 (비대칭 양자화)
+        entries = [self._entries[entry_id] for entry_id in ids]
+        codes = np.stack([entry[1] for entry in entries]).astype(np.float32)
+        scales = np.fromiter((entry[2] for entry in entries), dtype=np.float32, count=len(entries))
+        similarities = (codes @ self._normalize(vector)) * scales
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            self.misses += 1
+            return None
+
+        entry_id = ids[best]
+        self._entries.move_to_end(entry_id)
+        self.hits += 1
+        return self._entries[entry_id][3]
+
+    def put(self, vector, scope: Hashable, value: Any) -> None:
+        """결과를 저장합니다.
+
+        Args:
+            vector: 쿼리 임베딩 벡터
+            scope: 비교 범위 키
+            value: 저장할 결과
+        """
+        entry_id = self._next_id
+        self._next_id += 1
+        codes, scale = self._quantize(vector)
+        self._entries[entry_id] = (scope, codes, scale, value, time.monotonic())
+        self._scopes.setdefault(scope, []).append(entry_id)
+
+        while len(self._entries) > self.max_size:
+            oldest_id, (oldest_scope, *_) = self._entries.popitem(last=False)
+            self._remove_from_scope(oldest_scope, oldest_id)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        self._entries.clear()
+        self._scopes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _expire(self, ids: List[int]) -> None:
+        """범위 내 TTL이 지난 항목을 제거합니다."""
+        cutoff = time.monotonic() - self.ttl
+        expired = [entry_id for entry_id in ids if self._entries[entry_id][4] < cutoff]
+        for entry_id in expired:
+            scope = self._entries.pop(entry_id)[0]
+            self._remove_from_scope(scope, entry_id)
+
+    def _remove_from_scope(self, scope: Hashable, entry_id: int) -> None:
+        ids = self._scopes.get(scope)
+        if ids is None:
+            return
+        ids.remove(entry_id)
+        if not ids:
+            del self._scopes[scope]
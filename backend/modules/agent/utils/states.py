@@ -1,14 +1,47 @@
 """LangGraph State 정의 모듈.
 
-대화 상태(ConversationState)와 런타임 컨텍스트(ContextSchema)를 정의합니다.
+대화 상태(ConversationState), 발화(Utterance), 런타임 컨텍스트(ContextSchema)를 정의합니다.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Deque, Tuple
 from dataclasses import dataclass
 
 from langgraph.graph.message import MessagesState
 
 
+@dataclass(slots=True)
+class Utterance:
+    """conversation_history의 단일 발화.
+
+    dict 대신 slots 데이터클래스를 사용하여 노드에서 속성으로 직접 접근합니다.
+    직렬화가 필요한 경계에서만 to_dict()를 사용합니다.
+    """
+    speaker_id: str = ""
+    speaker_name: str = ""
+    text: str = ""
+    timestamp: float = 0.0
+    is_customer: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Utterance":
+        return cls(
+            speaker_id=data.get("speaker_id", ""),
+            speaker_name=data.get("speaker_name", ""),
+            text=data.get("text", ""),
+            timestamp=data.get("timestamp", 0.0),
+            is_customer=data.get("is_customer", False),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "speaker_id": self.speaker_id,
+            "speaker_name": self.speaker_name,
+            "text": self.text,
+            "timestamp": self.timestamp,
+            "is_customer": self.is_customer,
+        }
+
+
 @dataclass
 class ContextSchema:
     """에이전트 생성 시 설정하는 Runtime Context.
@@ -37,7 +70,7 @@ class ConversationState(MessagesState):
 
     커스텀 필드:
         room_name (str)
-        conversation_history (List[Dict])
+        conversation_history (List[Utterance])
         current_summary (str)
         last_summarized_index (int)
         summary_result (Dict | None)
@@ -49,7 +82,12 @@ class ConversationState(MessagesState):
         draft_replies (Dict | None)
         risk_result (Dict | None)
         rag_policy_result (Dict | None): RAG 정책 검색 결과
+        faq_trigger (bool): intent 노드가 계산한 FAQ 검색 필요 여부
+        faq_category (str | None): intent 노드가 계산한 FAQ 카테고리
+        faq_trigger_index (int): faq_trigger를 계산한 시점의 대화 수 (현재 대화 수와 같을 때만 유효)
+        pending_summary_text (str): 요약 전에 이력 상한으로 제거된 발화 텍스트 (다음 요약에 합침)
 
+        recent_customer_utts (Deque[Tuple[int, str]]): 최근 고객 발화 (이력 인덱스, 텍스트), maxlen=2
         has_new_customer_turn (bool): 새로운 고객 발화가 있는지 여부
         last_intent_index (int): 마지막으로 의도 분석한 대화 인덱스
         last_sentiment_index (int): 마지막으로 감정 분석한 대화 인덱스
@@ -58,7 +96,7 @@ class ConversationState(MessagesState):
         last_rag_index (int): 마지막으로 RAG 검색한 대화 인덱스
     """
     room_name: str
-    conversation_history: List[Dict[str, Any]]
+    conversation_history: List[Utterance]
     current_summary: str
     last_summarized_index: int
     summary_result: Dict[str, Any] | None
@@ -71,7 +109,12 @@ class ConversationState(MessagesState):
     risk_result: Dict[str, Any] | None
     rag_policy_result: Dict[str, Any] | None
     faq_result: Dict[str, Any] | None  # FAQ semantic cache 검색 결과
+    faq_trigger: bool  # intent 노드가 계산한 FAQ 검색 필요 여부
+    faq_category: str | None  # intent 노드가 계산한 FAQ 카테고리
+    faq_trigger_index: int  # faq_trigger 계산 시점의 대화 수 (-1 = 없음)
+    pending_summary_text: str  # 요약 전에 제거된 발화 (summarize 성공 시 비움)
 
+    recent_customer_utts: Deque[Tuple[int, str]]  # 수집 시점에 갱신 (검색 쿼리용)
     has_new_customer_turn: bool
     last_intent_index: int
     last_sentiment_index: int
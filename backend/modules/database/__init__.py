@@ -34,6 +34,15 @@ from .consultation_repository import (
 from .log_handler import DatabaseLogHandler
 from .faq_service import FAQService, get_faq_service
 from .faq_cache import FAQSemanticCache, FAQCacheResult, get_faq_cache
+from .embeddings import (
+    get_embeddings,
+    close_embeddings,
+    embed_query,
+    clear_embedding_cache,
+    get_embedding_cache_stats,
+    quantize_int8,
+    dequantize_int8,
+)
 
 __all__ = [
     "DatabaseManager",
@@ -62,4 +71,12 @@ __all__ = [
     "FAQSemanticCache",
     "FAQCacheResult",
     "get_faq_cache",
+    # Embeddings
+    "get_embeddings",
+    "close_embeddings",
+    "embed_query",
+    "clear_embedding_cache",
+    "get_embedding_cache_stats",
+    "quantize_int8",
+    "dequantize_int8",
 ]
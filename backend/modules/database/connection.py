@@ -12,15 +12,63 @@ Examples:
 """
 
 import os
+import sys
 import json
+import struct
 import logging
-from typing import Optional
+from array import array
+from typing import List, Optional, Sequence
 from contextlib import asynccontextmanager
 
 import asyncpg
 
 logger = logging.getLogger(__name__)
 
+# pgvector 확장이 설치된 스키마
+PGVECTOR_SCHEMA = os.getenv("PGVECTOR_SCHEMA", "public")
+
+# HNSW 인덱스 탐색 범위 (높을수록 재현율 증가/지연 증가, LIMIT보다 커야 함)
+HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "40"))
+
+# HNSW 반복 스캔 (pgvector 0.8+): collection_id 필터로 ef_search 후보가 걸러져 LIMIT보다
+# 적게 남으면 인덱스 탐색을 이어서 수행 (off | strict_order | relaxed_order)
+# relaxed_order의 순서 오차는 RAG 쿼리 바깥 ORDER BY distance에서 다시 정렬됨
+# 0.8 미만에서는 알 수 없는 설정으로 무시되므로 재현율 보강을 위해 ef_search를 높여야 함
+HNSW_ITERATIVE_SCAN = os.getenv("HNSW_ITERATIVE_SCAN", "relaxed_order")
+
+
+_HOST_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _encode_vector(vector: Sequence[float]) -> bytes:
+    """pgvector 바이너리 형식으로 인코딩합니다 (int16 차원, int16 예약, float4 big-endian).
+
+    float 변환/바이트 순서 변환은 array 모듈(C)에서 처리 (원소별 파이썬 인자 전달 없음).
+    float32 버퍼(array("f"), float32 ndarray)는 원소 순회 없이 메모리 복사로 변환합니다.
+    """
+    try:
+        view = memoryview(vector)
+    except TypeError:
+        view = None
+    if view is not None and view.format == "f" and view.ndim == 1 and view.c_contiguous:
+        floats = array("f")
+        floats.frombytes(view.cast("B"))
+    else:
+        floats = array("f", vector)
+    if _HOST_LITTLE_ENDIAN:
+        floats.byteswap()
+    return struct.pack(">HH", len(floats), 0) + floats.tobytes()
+
+
+def _decode_vector(data: bytes) -> List[float]:
+    """pgvector 바이너리 형식을 float 리스트로 디코딩합니다."""
+    dim, _ = struct.unpack_from(">HH", data)
+    floats = array("f")
+    floats.frombytes(data[4:4 + dim * 4])
+    if _HOST_LITTLE_ENDIAN:
+        floats.byteswap()
+    return floats.tolist()
+
 
 class DatabaseManager:
     """PostgreSQL 연결 풀을 관리하는 싱글톤 클래스.
@@ -53,7 +101,7 @@ class DatabaseManager:
         return self._initialized and self.pool is not None
 
     async def _init_connection(self, conn: asyncpg.Connection):
-        """각 연결에 JSONB 코덱을 설정합니다."""
+        """각 연결에 JSONB/pgvector 코덱을 설정합니다."""
         await conn.set_type_codec(
             'jsonb',
             encoder=json.dumps,
@@ -66,6 +114,17 @@ class DatabaseManager:
             decoder=json.loads,
             schema='pg_catalog'
         )
+        # vector 파라미터를 텍스트 '[...]' 대신 float4 바이너리로 전송 (서버 측 텍스트 파싱 생략)
+        try:
+            await conn.set_type_codec(
+                'vector',
+                encoder=_encode_vector,
+                decoder=_decode_vector,
+                schema=PGVECTOR_SCHEMA,
+                format='binary',
+            )
+        except ValueError:
+            logger.warning("[DB] pgvector 타입 없음, vector 코덱 미등록 (schema=%s)", PGVECTOR_SCHEMA)
 
     async def initialize(self, min_size: int = 5, max_size: int = 20) -> bool:
         """연결 풀을 초기화합니다.
@@ -88,6 +147,11 @@ class DatabaseManager:
                 max_size=max_size,
                 command_timeout=60,
                 init=self._init_connection,
+                # 연결 시작 시 한 번 설정 (쿼리마다 SET LOCAL 왕복 없음)
+                server_settings={
+                    "hnsw.ef_search": str(HNSW_EF_SEARCH),
+                    "hnsw.iterative_scan": HNSW_ITERATIVE_SCAN,
+                },
             )
             self._initialized = True
             logger.info(f"[DB] 연결 풀 초기화 완료 (min={min_size}, max={max_size})")
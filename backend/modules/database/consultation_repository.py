@@ -11,13 +11,75 @@ Classes:
 import json
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 
 from .connection import get_db_manager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# 자주 실행되는 INSERT 문 (고정 문자열)
+# asyncpg는 연결별로 쿼리 문자열을 키로 prepared statement를 캐시하므로,
+# 동일한 문자열을 재사용하면 두 번째 실행부터 parse/plan 없이 바인딩만 전송합니다.
+_INSERT_SESSION_SQL = """
+    INSERT INTO consultation_sessions
+    (room_id, customer_id, agent_id, agent_name, channel, metadata)
+    VALUES ($1, $2, $3, $4, $5, $6::jsonb)
+    RETURNING session_id
+"""
+
+_INSERT_TRANSCRIPTS_BULK_SQL = """
+    INSERT INTO consultation_transcripts
+    (session_id, turn_index, speaker_type, speaker_name, text, timestamp, confidence, is_final, source)
+    SELECT t.session_id, t.turn_index, t.speaker_type, t.speaker_name, t.text,
+           to_timestamp(t.ts_us / 1000000.0), t.confidence, t.is_final, t.source
+    FROM unnest(
+        $1::uuid[], $2::int[], $3::text[], $4::text[], $5::text[],
+        $6::int8[], $7::float8[], $8::bool[], $9::text[]
+    ) AS t(session_id, turn_index, speaker_type, speaker_name, text, ts_us, confidence, is_final, source)
+    ON CONFLICT (session_id, turn_index) DO UPDATE
+    SET text = EXCLUDED.text, confidence = EXCLUDED.confidence, is_final = EXCLUDED.is_final
+"""
+
+_UPDATE_SESSION_CUSTOMER_SQL = """
+    UPDATE consultation_sessions
+    SET customer_id = $2
+    WHERE session_id = $1
+"""
+
+_INSERT_AGENT_RESULTS_BATCH_SQL = """
+    INSERT INTO consultation_agent_results
+    (session_id, turn_id, result_type, result_data)
+    SELECT $1, $2, t.result_type, t.result_data
+    FROM unnest($3::text[], $4::jsonb[]) AS t(result_type, result_data)
+"""
+
+_INSERT_AGENT_RESULTS_BULK_SQL = """
+    INSERT INTO consultation_agent_results
+    (session_id, turn_id, result_type, result_data)
+    SELECT t.session_id, t.turn_id, t.result_type, t.result_data
+    FROM unnest($1::uuid[], $2::text[], $3::text[], $4::jsonb[])
+        AS t(session_id, turn_id, result_type, result_data)
+"""
+
+
+def _dumps_result(result_data: Any) -> str:
+    """에이전트 결과를 JSON 문자열로 직렬화합니다.
+
+    orjson이 설치되어 있으면 C 인코더를 사용하고, 없으면 표준 json을 사용합니다.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            result_data, option=orjson.OPT_NON_STR_KEYS, default=str
+        ).decode("utf-8")
+    return json.dumps(result_data, ensure_ascii=False, default=str)
+
 
 class ConsultationSessionRepository:
     """상담 세션 데이터 저장소."""
@@ -47,37 +109,37 @@ class ConsultationSessionRepository:
         Returns:
             생성된 세션의 UUID 또는 None
         """
-        logger.info(f"[세션생성] 시작 - agent_name={agent_name}, room_id={room_id}, agent_id={agent_id}, channel={channel}")
+        logger.info(
+            "[세션생성] 시작 - agent_name=%s, room_id=%s, agent_id=%s, channel=%s",
+            agent_name, room_id, agent_id, channel,
+        )
 
         if not self.db.is_initialized:
             logger.warning("[세션생성] 실패: 데이터베이스 초기화 안됨")
             return None
 
-        logger.debug(f"[세션생성] DB 초기화 확인 완료")
+        logger.debug("[세션생성] DB 초기화 확인 완료")
 
         try:
             metadata_json = json.dumps(metadata or {})
-            logger.debug(f"[세션생성] 메타데이터 JSON 변환 완료: {metadata_json}")
+            logger.debug("[세션생성] 메타데이터 JSON 변환 완료: %s", metadata_json)
 
-            logger.info(f"[세션생성] INSERT 실행 중 - room_id={room_id} (type={type(room_id).__name__})")
+            logger.info(
+                "[세션생성] INSERT 실행 중 - room_id=%s (type=%s)", room_id, type(room_id).__name__,
+            )
             session_id = await self.db.fetchval(
-                """
-                INSERT INTO consultation_sessions
-                (room_id, customer_id, agent_id, agent_name, channel, metadata)
-                VALUES ($1, $2, $3, $4, $5, $6::jsonb)
-                RETURNING session_id
-                """,
+                _INSERT_SESSION_SQL,
                 room_id, customer_id, agent_id, agent_name, channel, metadata_json
             )
 
             if session_id:
-                logger.info(f"[세션생성] 성공 - session_id={session_id}")
+                logger.info("[세션생성] 성공 - session_id=%s", session_id)
             else:
-                logger.warning(f"[세션생성] 실패: session_id가 None으로 반환됨")
+                logger.warning("[세션생성] 실패: session_id가 None으로 반환됨")
 
             return session_id
         except Exception as e:
-            logger.error(f"[세션생성] 예외 발생: {type(e).__name__}: {e}", exc_info=True)
+            logger.error("[세션생성] 예외 발생: %s: %s", type(e).__name__, e, exc_info=True)
             return None
 
     async def update_customer(
@@ -94,24 +156,17 @@ class ConsultationSessionRepository:
         Returns:
             성공 여부
         """
-        logger.info(f"[고객연결] 시작 - session_id={session_id}, customer_id={customer_id}")
+        logger.info("[고객연결] 시작 - session_id=%s, customer_id=%s", session_id, customer_id)
         if not self.db.is_initialized:
-            logger.warning(f"[고객연결] 스킵: DB 미초기화")
+            logger.warning("[고객연결] 스킵: DB 미초기화")
             return False
 
         try:
-            await self.db.execute(
-                """
-                UPDATE consultation_sessions
-                SET customer_id = $2
-                WHERE session_id = $1
-                """,
-                session_id, customer_id
-            )
-            logger.info(f"[고객연결] 성공 - session_id={session_id}, customer_id={customer_id}")
+            await self.db.execute(_UPDATE_SESSION_CUSTOMER_SQL, session_id, customer_id)
+            logger.info("[고객연결] 성공 - session_id=%s, customer_id=%s", session_id, customer_id)
             return True
         except Exception as e:
-            logger.error(f"[고객연결] 실패 - session_id={session_id}: {e}", exc_info=True)
+            logger.error("[고객연결] 실패 - session_id=%s: %s", session_id, e, exc_info=True)
             return False
 
     async def end_session(
@@ -130,8 +185,11 @@ class ConsultationSessionRepository:
         Returns:
             성공 여부
         """
-        logger.info(f"[세션종료] 시작 - session_id={session_id}, type={consultation_type}")
-        logger.debug(f"end_session params: consultation_type='{consultation_type}' (type: {type(consultation_type).__name__})")
+        logger.info("[세션종료] 시작 - session_id=%s, type=%s", session_id, consultation_type)
+        logger.debug(
+            "end_session params: consultation_type='%s' (type: %s)",
+            consultation_type, type(consultation_type).__name__,
+        )
 
         if not self.db.is_initialized:
             logger.warning("[세션종료] 실패: 데이터베이스 초기화 안됨")
@@ -143,14 +201,17 @@ class ConsultationSessionRepository:
                 "SELECT status FROM consultation_sessions WHERE session_id = $1",
                 session_id
             )
-            logger.debug(f"current session status: {current_status}")
+            logger.debug("current session status: %s", current_status)
 
-            logger.info(f"[세션종료] DB 함수 호출 중 - end_consultation_session({session_id}, summary길이={len(final_summary) if final_summary else 0}, type='{consultation_type}')")
+            logger.info(
+                "[세션종료] DB 함수 호출 중 - end_consultation_session(%s, summary길이=%s, type='%s')",
+                session_id, len(final_summary) if final_summary else 0, consultation_type,
+            )
             result = await self.db.fetchval(
                 "SELECT end_consultation_session($1, $2, $3)",
                 session_id, final_summary, consultation_type
             )
-            logger.debug(f"DB function result: {result}")
+            logger.debug("DB function result: %s", result)
 
             if result:
                 # 저장 후 확인
@@ -158,13 +219,13 @@ class ConsultationSessionRepository:
                     "SELECT consultation_type FROM consultation_sessions WHERE session_id = $1",
                     session_id
                 )
-                logger.debug(f"saved consultation_type in DB: '{saved_type}'")
-                logger.info(f"[세션종료] 성공 - session_id={session_id}")
+                logger.debug("saved consultation_type in DB: '%s'", saved_type)
+                logger.info("[세션종료] 성공 - session_id=%s", session_id)
             else:
-                logger.warning(f"[세션종료] 결과 없음 - session_id={session_id} (status가 active가 아닐 수 있음)")
+                logger.warning("[세션종료] 결과 없음 - session_id=%s (status가 active가 아닐 수 있음)", session_id)
             return bool(result)
         except Exception as e:
-            logger.error(f"[세션종료] 예외 발생: {type(e).__name__}: {e}", exc_info=True)
+            logger.error("[세션종료] 예외 발생: %s: %s", type(e).__name__, e, exc_info=True)
             return False
 
     async def get_session(self, session_id: UUID) -> Optional[Dict[str, Any]]:
@@ -195,7 +256,7 @@ class ConsultationSessionRepository:
             )
             return dict(row) if row else None
         except Exception as e:
-            logger.error(f"Failed to get session {session_id}: {e}")
+            logger.error("Failed to get session %s: %s", session_id, e)
             return None
 
     async def get_session_by_room(self, room_id: UUID) -> Optional[Dict[str, Any]]:
@@ -222,7 +283,7 @@ class ConsultationSessionRepository:
             )
             return dict(row) if row else None
         except Exception as e:
-            logger.error(f"Failed to get session by room {room_id}: {e}")
+            logger.error("Failed to get session by room %s: %s", room_id, e)
             return None
 
     async def get_customer_sessions(
@@ -254,7 +315,7 @@ class ConsultationSessionRepository:
             )
             return [dict(row) for row in rows]
         except Exception as e:
-            logger.error(f"Failed to get sessions for customer {customer_id}: {e}")
+            logger.error("Failed to get sessions for customer %s: %s", customer_id, e)
             return []
 
     async def get_recent_sessions(
@@ -296,7 +357,7 @@ class ConsultationSessionRepository:
                 )
             return [dict(row) for row in rows]
         except Exception as e:
-            logger.error(f"Failed to get recent sessions: {e}")
+            logger.error("Failed to get recent sessions: %s", e)
             return []
 
 
@@ -334,7 +395,9 @@ class ConsultationTranscriptRepository:
         Returns:
             성공 여부
         """
-        logger.debug(f"[전사저장] 시작 - session_id={session_id}, turn={turn_index}, speaker={speaker_name}")
+        logger.debug(
+            "[전사저장] 시작 - session_id=%s, turn=%s, speaker=%s", session_id, turn_index, speaker_name,
+        )
 
         if not self.db.is_initialized:
             logger.warning("[전사저장] 실패: 데이터베이스 초기화 안됨")
@@ -351,10 +414,12 @@ class ConsultationTranscriptRepository:
                 """,
                 session_id, turn_index, speaker_type, speaker_name, text, timestamp, confidence, is_final, source
             )
-            logger.info(f"[전사저장] 성공 - session={session_id}, turn={turn_index}, text={text[:30]}...")
+            logger.info(
+                "[전사저장] 성공 - session=%s, turn=%s, text=%s...", session_id, turn_index, text[:30],
+            )
             return True
         except Exception as e:
-            logger.error(f"[전사저장] 예외 발생: {type(e).__name__}: {e}", exc_info=True)
+            logger.error("[전사저장] 예외 발생: %s: %s", type(e).__name__, e, exc_info=True)
             return False
 
     async def add_transcripts_batch(
@@ -390,9 +455,71 @@ class ConsultationTranscriptRepository:
             if success:
                 saved_count += 1
 
-        logger.info(f"Batch saved {saved_count}/{len(transcripts)} transcripts for session {session_id}")
+        logger.info(
+            "Batch saved %d/%d transcripts for session %s",
+            saved_count, len(transcripts), session_id,
+        )
         return saved_count
 
+    async def add_transcripts_bulk(
+        self,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 0,
+        customer_link: Optional[Tuple[UUID, int]] = None
+    ) -> int:
+        """여러 전사를 다중 행 INSERT로 저장합니다.
+
+        add_transcripts_batch와 달리 행마다 왕복하지 않으며,
+        행마다 session_id를 가지므로 여러 세션의 전사를 함께 저장할 수 있습니다.
+        모든 배치는 풀에서 한 번 획득한 연결 하나의 트랜잭션으로 실행하므로
+        중간 배치가 실패하면 전체가 롤백됩니다 (일부만 저장되지 않음).
+        customer_link가 있으면 세션-고객 연결 UPDATE도 같은 트랜잭션에서 실행합니다.
+
+        Args:
+            rows: 전사 목록 [{session_id, turn_index, speaker_type, speaker_name,
+                text, ts_us, confidence, is_final, source}, ...]
+                (ts_us: Unix epoch 마이크로초, DB에서 timestamptz로 변환)
+            batch_size: INSERT 한 번에 넣을 최대 행 수 (0이면 전체를 한 번에)
+            customer_link: 전사와 함께 커밋할 (session_id, customer_id) 고객 연결
+
+        Returns:
+            저장된 개수 (실패 시 0, 고객 연결도 롤백됨)
+        """
+        if not rows:
+            return 0
+
+        if not self.db.is_initialized:
+            logger.warning("[전사저장] 일괄 저장 실패: 데이터베이스 초기화 안됨")
+            return 0
+
+        step = batch_size or len(rows)
+        try:
+            async with self.db.acquire() as conn:
+                async with conn.transaction():
+                    if customer_link is not None:
+                        await conn.execute(_UPDATE_SESSION_CUSTOMER_SQL, *customer_link)
+                    for start in range(0, len(rows), step):
+                        chunk = rows[start:start + step]
+                        await conn.execute(
+                            _INSERT_TRANSCRIPTS_BULK_SQL,
+                            [r["session_id"] for r in chunk],
+                            [r["turn_index"] for r in chunk],
+                            [r["speaker_type"] for r in chunk],
+                            [r.get("speaker_name") for r in chunk],
+                            [r["text"] for r in chunk],
+                            [r["ts_us"] for r in chunk],
+                            [r.get("confidence") for r in chunk],
+                            [r.get("is_final", True) for r in chunk],
+                            [r.get("source", "google") for r in chunk],
+                        )
+        except Exception as e:
+            logger.error(
+                "[전사저장] 일괄 저장 예외 발생: %s: %s", type(e).__name__, e, exc_info=True
+            )
+            return 0
+        logger.info("[전사저장] 일괄 성공 - %d건", len(rows))
+        return len(rows)
+
     async def get_session_transcripts(
         self,
         session_id: UUID,
@@ -425,7 +552,7 @@ class ConsultationTranscriptRepository:
             )
             return [dict(row) for row in rows]
         except Exception as e:
-            logger.error(f"Failed to get transcripts for session {session_id}: {e}")
+            logger.error("Failed to get transcripts for session %s: %s", session_id, e)
             return []
 
     async def get_conversation_text(self, session_id: UUID) -> str:
@@ -478,14 +605,16 @@ class ConsultationAgentResultRepository:
         Returns:
             성공 여부
         """
-        logger.debug(f"[결과저장] 시작 - session_id={session_id}, type={result_type}, turn_id={turn_id}")
+        logger.debug(
+            "[결과저장] 시작 - session_id=%s, type=%s, turn_id=%s", session_id, result_type, turn_id,
+        )
 
         if not self.db.is_initialized:
             logger.warning("[결과저장] 실패: 데이터베이스 초기화 안됨")
             return False
 
         try:
-            result_json = json.dumps(result_data, ensure_ascii=False, default=str)
+            result_json = _dumps_result(result_data)
 
             await self.db.execute(
                 """
@@ -495,12 +624,88 @@ class ConsultationAgentResultRepository:
                 """,
                 session_id, turn_id, result_type, result_json, processing_time_ms, model_version
             )
-            logger.info(f"[결과저장] 성공 - session={session_id}, type={result_type}")
+            logger.info("[결과저장] 성공 - session=%s, type=%s", session_id, result_type)
             return True
         except Exception as e:
-            logger.error(f"[결과저장] 예외 발생: {type(e).__name__}: {e}", exc_info=True)
+            logger.error("[결과저장] 예외 발생: %s: %s", type(e).__name__, e, exc_info=True)
             return False
 
+    async def save_results_batch(
+        self,
+        session_id: UUID,
+        results: List[Tuple[str, Dict[str, Any]]],
+        turn_id: str = None
+    ) -> int:
+        """여러 에이전트 분석 결과를 한 번의 INSERT로 저장합니다.
+
+        Args:
+            session_id: 세션 UUID
+            results: (result_type, result_data) 목록
+            turn_id: 연관된 turn ID (선택)
+
+        Returns:
+            저장된 개수
+        """
+        if not results:
+            return 0
+
+        if not self.db.is_initialized:
+            logger.warning("[결과저장] 실패: 데이터베이스 초기화 안됨")
+            return 0
+
+        try:
+            result_types = [result_type for result_type, _ in results]
+            result_jsons = [_dumps_result(result_data) for _, result_data in results]
+
+            # unnest로 다중 행을 한 번의 왕복으로 삽입 (save_result와 동일한 직렬화)
+            await self.db.execute(
+                _INSERT_AGENT_RESULTS_BATCH_SQL,
+                session_id, turn_id, result_types, result_jsons
+            )
+            logger.info("[결과저장] 일괄 성공 - session=%s, types=%s", session_id, result_types)
+            return len(results)
+        except Exception as e:
+            logger.error("[결과저장] 일괄 저장 예외 발생: %s: %s", type(e).__name__, e, exc_info=True)
+            return 0
+
+    async def save_results_bulk(
+        self,
+        rows: List[Tuple[UUID, Optional[str], str, Dict[str, Any]]]
+    ) -> int:
+        """여러 세션의 에이전트 분석 결과를 한 번의 INSERT로 저장합니다.
+
+        save_results_batch와 달리 행마다 session_id/turn_id를 가지므로
+        여러 방의 결과를 함께 저장할 수 있습니다.
+
+        Args:
+            rows: (session_id, turn_id, result_type, result_data) 목록
+
+        Returns:
+            저장된 개수
+        """
+        if not rows:
+            return 0
+
+        if not self.db.is_initialized:
+            logger.warning("[결과저장] 실패: 데이터베이스 초기화 안됨")
+            return 0
+
+        try:
+            await self.db.execute(
+                _INSERT_AGENT_RESULTS_BULK_SQL,
+                [row[0] for row in rows],
+                [row[1] for row in rows],
+                [row[2] for row in rows],
+                [_dumps_result(row[3]) for row in rows],
+            )
+            logger.info("[결과저장] 일괄 성공 - %d건", len(rows))
+            return len(rows)
+        except Exception as e:
+            logger.error(
+                "[결과저장] 일괄 저장 예외 발생: %s: %s", type(e).__name__, e, exc_info=True
+            )
+            return 0
+
     async def save_intent(
         self,
         session_id: UUID,
@@ -616,7 +821,7 @@ class ConsultationAgentResultRepository:
                 )
             return [dict(row) for row in rows]
         except Exception as e:
-            logger.error(f"Failed to get results for session {session_id}: {e}")
+            logger.error("Failed to get results for session %s: %s", session_id, e)
             return []
 
     async def get_latest_result(
@@ -649,7 +854,7 @@ class ConsultationAgentResultRepository:
             )
             return dict(row) if row else None
         except Exception as e:
-            logger.error(f"Failed to get latest {result_type} for session {session_id}: {e}")
+            logger.error("Failed to get latest %s for session %s: %s", result_type, session_id, e)
             return None
 
 
@@ -726,7 +931,7 @@ class AgentRepository:
                 agent_code
             )
             if existing:
-                logger.warning(f"Agent with code {agent_code} already exists")
+                logger.warning("Agent with code %s already exists", agent_code)
                 return None
 
             agent_id = await self.db.fetchval(
@@ -737,10 +942,10 @@ class AgentRepository:
                 """,
                 agent_code, agent_name
             )
-            logger.info(f"Registered agent: {agent_name} (code: {agent_code}, id: {agent_id})")
+            logger.info("Registered agent: %s (code: %s, id: %s)", agent_name, agent_code, agent_id)
             return agent_id
         except Exception as e:
-            logger.error(f"Failed to register agent: {e}")
+            logger.error("Failed to register agent: %s", e)
             return None
 
     async def find_agent(
@@ -771,7 +976,7 @@ class AgentRepository:
             )
             return dict(row) if row else None
         except Exception as e:
-            logger.error(f"Failed to find agent: {e}")
+            logger.error("Failed to find agent: %s", e)
             return None
 
     async def get_agent_by_id(self, agent_id: int) -> Optional[Dict[str, Any]]:
@@ -790,7 +995,7 @@ class AgentRepository:
             )
             return dict(row) if row else None
         except Exception as e:
-            logger.error(f"Failed to get agent by id: {e}")
+            logger.error("Failed to get agent by id: %s", e)
             return None
 
     async def get_all_agents(self, limit: int = 100) -> List[Dict[str, Any]]:
@@ -822,10 +1027,10 @@ class AgentRepository:
                 if item.get('created_at'):
                     item['created_at'] = str(item['created_at'])
                 result.append(item)
-            logger.info(f"Found {len(result)} agents")
+            logger.info("Found %d agents", len(result))
             return result
         except Exception as e:
-            logger.error(f"Failed to get all agents: {e}")
+            logger.error("Failed to get all agents: %s", e)
             return []
 
     async def get_agent_sessions(
@@ -885,7 +1090,7 @@ class AgentRepository:
                 result.append(item)
             return result
         except Exception as e:
-            logger.error(f"Failed to get agent sessions: {e}")
+            logger.error("Failed to get agent sessions: %s", e)
             return []
 
 
@@ -0,0 +1,234 @@
+"""공유 OpenAI 임베딩 클라이언트.
+
+FAQ 시맨틱 캐시, RAG 정책 검색, LLM 시맨틱 캐시가 하나의 임베딩 인스턴스와
+HTTP 커넥션 풀을 공유하도록 합니다. 짧은 쿼리의 임베딩 호출은 TLS 핸드셰이크와
+커넥션 생성 비용이 대부분이므로, keep-alive 커넥션을 재사용해 지연을 줄입니다.
+
+쿼리 임베딩은 프로세스 내 LRU 캐시(embed_query)를 거치므로, 같은 세션에서
+반복되는 검색어는 임베딩 API를 다시 호출하지 않습니다. 캐시 미스는 짧은 시간 동안
+모아 한 번의 배치 요청(aembed_documents)으로 보냅니다.
+
+Usage:
+    >>> from modules.database import get_embeddings, embed_query
+    >>> vector = await get_embeddings().aembed_query("VIP 혜택")
+    >>> vector = await embed_query("VIP 혜택")  # LRU 캐시 경유
+    >>> # 서버 종료 시
+    >>> await close_embeddings()
+"""
+
+import asyncio
+import logging
+import os
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+import numpy as np
+from langchain_openai import OpenAIEmbeddings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# 커넥션 풀 설정 (룸 수 x 동시 노드 수 기준)
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+HTTP_TIMEOUT = 10.0
+
+# 마이크로 배칭: 최대 EMBED_BATCH_MAX개 또는 EMBED_BATCH_LINGER_MS 대기 후 한 번의 API 호출
+EMBED_BATCH_MAX = int(os.getenv("EMBED_BATCH_MAX", "32"))
+EMBED_BATCH_LINGER_MS = float(os.getenv("EMBED_BATCH_LINGER_MS", "10"))
+
+# 쿼리 임베딩 LRU 캐시 크기 (int8 + scale 저장, 1536차원 기준 항목당 약 1.5KB)
+EMBED_CACHE_MAXSIZE = 2048
+
+# 글로벌 인스턴스 (싱글톤)
+_embeddings: Optional[OpenAIEmbeddings] = None
+_http_client: Optional[httpx.Client] = None
+_http_async_client: Optional[httpx.AsyncClient] = None
+
+# 쿼리 텍스트 -> (int8 코드, scale) (접근 순서 유지, 앞쪽이 가장 오래 전 사용)
+# float32 대비 메모리 1/4, 복원 벡터와 원본의 코사인 유사도는 0.9999 이상
+# (SemanticResultCache와 같은 벡터별 최대 절댓값 기준 양자화)
+_embed_cache: "OrderedDict[str, Tuple[np.ndarray, float]]" = OrderedDict()
+_embed_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "coalesced": 0}
+# 진행 중인 임베딩 요청 (같은 텍스트의 동시 요청은 하나의 API 호출을 공유)
+_inflight: Dict[str, "asyncio.Task[array]"] = {}
+
+
+def get_embeddings() -> OpenAIEmbeddings:
+    """공유 OpenAIEmbeddings 인스턴스를 반환합니다 (lazy initialization).
+
+    동기 호출(LLM 시맨틱 캐시)과 비동기 호출(FAQ/RAG 검색) 모두
+    keep-alive 커넥션 풀을 재사용합니다.
+
+    Returns:
+        OpenAIEmbeddings: 공유 임베딩 인스턴스
+    """
+    global _embeddings, _http_client, _http_async_client
+
+    if _embeddings is None:
+        _http_client = httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        _http_async_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        _embeddings = OpenAIEmbeddings(
+            model=EMBEDDING_MODEL,
+            http_client=_http_client,
+            http_async_client=_http_async_client,
+        )
+        logger.info("[임베딩] 공유 클라이언트 생성: model=%s", EMBEDDING_MODEL)
+
+    return _embeddings
+
+
+async def close_embeddings() -> None:
+    """공유 HTTP 커넥션 풀을 닫습니다 (서버 종료 시 호출)."""
+    global _embeddings, _http_client, _http_async_client
+
+    if _http_async_client is not None:
+        await _http_async_client.aclose()
+    if _http_client is not None:
+        _http_client.close()
+
+    _embeddings = None
+    _http_client = None
+    _http_async_client = None
+
+
+class EmbeddingBatcher:
+    """동시에 들어온 임베딩 요청을 모아 한 번의 API 호출로 처리합니다.
+
+    첫 요청 후 linger 동안 기다리거나 max_batch개가 모이면 aembed_documents를
+    호출하고, 각 호출자의 Future에 해당 벡터를 전달합니다.
+    """
+
+    def __init__(self, max_batch: int = EMBED_BATCH_MAX, linger_ms: float = EMBED_BATCH_LINGER_MS):
+        self.max_batch = max_batch
+        self.linger = linger_ms / 1000
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # 실행 중인 배치 태스크 (완료 전 GC 방지)
+        self._running: Set[asyncio.Task] = set()
+
+    async def submit(self, text: str) -> array:
+        """텍스트를 배치에 추가하고 임베딩 결과(float32 array)를 기다립니다."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._embed_batch(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _embed_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            vectors = await get_embeddings().aembed_documents([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(batch) > 1:
+            logger.debug("[임베딩] 배치 요청: %d건", len(batch))
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(array("f", vector))
+
+        # 응답 벡터 수가 입력보다 적으면 남은 요청을 실패 처리
+        # (미해결로 두면 single-flight 태스크가 영원히 대기)
+        if len(vectors) < len(batch):
+            error = RuntimeError(
+                f"임베딩 응답 개수 불일치: 요청 {len(batch)}건, 응답 {len(vectors)}건"
+            )
+            logger.error("[임베딩] %s", error)
+            for _, future in batch[len(vectors):]:
+                if not future.done():
+                    future.set_exception(error)
+
+
+_batcher = EmbeddingBatcher()
+
+
+def quantize_int8(vector) -> Tuple[np.ndarray, float]:
+    """벡터를 int8 코드와 scale로 양자화합니다 (v ≈ codes * scale).
+
+    벡터별 최대 절댓값을 127에 맞추므로 부호 포함 8비트로 표현됩니다.
+    """
+    values = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.max(np.abs(values))) if values.size else 0.0
+    scale = max_abs / 127.0 if max_abs > 0 else 1.0
+    return np.round(values / scale).astype(np.int8), scale
+
+
+def dequantize_int8(codes: np.ndarray, scale: float) -> np.ndarray:
+    """quantize_int8 결과를 float32 벡터로 복원합니다."""
+    return codes.astype(np.float32) * np.float32(scale)
+
+
+async def embed_query(text: str) -> array:
+    """쿼리 임베딩을 LRU 캐시를 거쳐 반환합니다.
+
+    캐시에 없고 같은 텍스트의 요청이 이미 진행 중이면 새로 호출하지 않고
+    그 결과를 함께 기다립니다 (single-flight).
+    캐시에는 int8로 양자화해 보관하고, 적중 시 float32로 복원한 새 배열을 반환합니다.
+    같은 요청을 기다린 호출자들은 API 응답 배열을 공유하므로 수정하면 안 됩니다.
+
+    Args:
+        text: 임베딩할 텍스트
+
+    Returns:
+        array: float32 임베딩 벡터 (array typecode "f", 시퀀스로 사용 가능)
+    """
+    entry = _embed_cache.get(text)
+    if entry is not None:
+        _embed_cache.move_to_end(text)
+        _embed_cache_stats["hits"] += 1
+        vector = array("f")
+        vector.frombytes(dequantize_int8(*entry).tobytes())
+        return vector
+
+    task = _inflight.get(text)
+    if task is not None:
+        _embed_cache_stats["coalesced"] += 1
+        # 한 호출자가 취소돼도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    _embed_cache_stats["misses"] += 1
+    task = asyncio.ensure_future(_batcher.submit(text))
+    _inflight[text] = task
+    try:
+        vector = await asyncio.shield(task)
+    finally:
+        _inflight.pop(text, None)
+
+    _embed_cache[text] = quantize_int8(vector)
+    if len(_embed_cache) > EMBED_CACHE_MAXSIZE:
+        _embed_cache.popitem(last=False)
+        _embed_cache_stats["evictions"] += 1
+    return vector
+
+
+def clear_embedding_cache() -> None:
+    """쿼리 임베딩 LRU 캐시를 비웁니다."""
+    _embed_cache.clear()
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """쿼리 임베딩 LRU 캐시 통계를 반환합니다."""
+    return {
+        "size": len(_embed_cache),
+        "maxsize": EMBED_CACHE_MAXSIZE,
+        **_embed_cache_stats,
+    }
@@ -18,7 +18,18 @@ PostgreSQL Schema:
         created_at TIMESTAMP DEFAULT NOW(),
         hit_count INTEGER DEFAULT 0
     );
-    CREATE INDEX ON faq_query_cache USING ivfflat (query_embedding vector_cosine_ops);
+    CREATE INDEX ON faq_query_cache USING ivfflat (query_embedding vector_ip_ops);
+    CREATE INDEX ON faq_query_cache
+        USING hnsw ((binary_quantize(query_embedding)::bit(1536)) bit_hamming_ops);
+
+Binary Quantization:
+    1. binary_quantize()로 1비트 코드(1536bit = 192B)에서 Hamming 거리로 후보 추출
+    2. 후보만 FP32 내적으로 재정렬 (정확도 유지)
+    pgvector < 0.7 (binary_quantize 미지원)이면 초기화 시 감지하여 FP32 내적 검색만 사용
+
+Normalization:
+    임베딩은 저장/조회 전에 L2 정규화되므로 내적(<#>)이 코사인 유사도와 같습니다.
+    (코사인 거리 <=> 대비 벡터 노름 계산 생략, 인덱스도 <#>용 vector_ip_ops)
 
 Usage:
     >>> from modules.database import get_faq_cache
@@ -30,20 +41,61 @@ Usage:
 import json
 import logging
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass
 
-from langchain_openai import OpenAIEmbeddings
-
+import numpy as np
 from .connection import get_db_manager
+from .embeddings import EMBEDDING_MODEL, embed_query, get_embeddings
 
 logger = logging.getLogger(__name__)
 
 # Cache configuration
-EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIM = 1536
 SIMILARITY_THRESHOLD = 0.50  # Cosine similarity (lower for Korean semantic matching)
 CACHE_TABLE = "faq_query_cache"
+BINARY_CANDIDATES = 20  # Hamming 거리 1차 후보 수 (FP32 재정렬 대상)
+
+# 캐시 검색 쿼리 (고정 문자열 + 파라미터 -> asyncpg 연결별 prepared statement 재사용)
+# 1차: 이진 양자화 코드의 Hamming 거리로 후보 추출
+# 2차: 후보만 FP32 내적으로 재정렬 (정규화 벡터이므로 -(<#>) = 코사인 유사도)
+# $1: 쿼리 임베딩(vector), $2: 후보 수, $3: 카테고리 (NULL = 전체)
+# asyncpg에서 :: 캐스팅 대신 CAST() 사용
+_CACHE_SEARCH_SQL = f"""
+    SELECT
+        id,
+        query_text,
+        faq_results,
+        category,
+        -(query_embedding <#> CAST($1 AS vector)) as similarity
+    FROM (
+        SELECT id, query_text, faq_results, category, query_embedding
+        FROM {CACHE_TABLE}
+        WHERE query_embedding IS NOT NULL
+          AND ($3::text IS NULL OR category = $3::text)
+        ORDER BY binary_quantize(query_embedding)::bit({EMBEDDING_DIM})
+            <~> binary_quantize(CAST($1 AS vector))
+        LIMIT $2
+    ) candidates
+    ORDER BY query_embedding <#> CAST($1 AS vector)
+    LIMIT 1
+"""
+
+# binary_quantize 미지원 환경용 캐시 검색 쿼리 (FP32 내적만 사용)
+# $1: 쿼리 임베딩(vector), $2: 카테고리 (NULL = 전체)
+_CACHE_SEARCH_FLAT_SQL = f"""
+    SELECT
+        id,
+        query_text,
+        faq_results,
+        category,
+        -(query_embedding <#> CAST($1 AS vector)) as similarity
+    FROM {CACHE_TABLE}
+    WHERE query_embedding IS NOT NULL
+      AND ($2::text IS NULL OR category = $2::text)
+    ORDER BY query_embedding <#> CAST($1 AS vector)
+    LIMIT 1
+"""
 
 
 @dataclass
@@ -82,6 +134,7 @@ class FAQSemanticCache:
             cls._instance = super().__new__(cls)
             cls._instance._initialized = False
             cls._instance._embeddings = None
+            cls._instance._binary_quantize = False
         return cls._instance
 
     @property
@@ -104,18 +157,19 @@ class FAQSemanticCache:
                 logger.error("[FAQ] DB 초기화 안됨, 캐시 불가")
                 return False
 
-            # Embeddings 초기화
-            self._embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
+            # Embeddings 초기화 (공유 커넥션 풀 사용)
+            self._embeddings = get_embeddings()
 
             # 캐시 테이블 생성 (없으면)
             await self._ensure_table_exists()
+            self._binary_quantize = await self._supports_binary_quantize()
 
             self._initialized = True
             logger.info("[FAQ] 시맨틱 캐시 초기화 완료 (pgvector)")
             return True
 
         except Exception as e:
-            logger.error(f"[FAQ] 캐시 초기화 실패: {e}")
+            logger.error("[FAQ] 캐시 초기화 실패: %s", e)
             self._initialized = False
             return False
 
@@ -141,22 +195,49 @@ class FAQSemanticCache:
         await db.execute(create_table_sql)
 
         # 인덱스 생성 (이미 있으면 무시)
+        # 검색은 정규화 벡터 내적(<#>)으로 정렬하므로 연산자 클래스도 vector_ip_ops
+        # (vector_cosine_ops 인덱스는 <=>에만 쓰이므로 이전 버전에서 만든 인덱스는 제거)
         try:
+            await db.execute(f"DROP INDEX IF EXISTS idx_{CACHE_TABLE}_embedding")
             await db.execute(f"""
-                CREATE INDEX IF NOT EXISTS idx_{CACHE_TABLE}_embedding
+                CREATE INDEX IF NOT EXISTS idx_{CACHE_TABLE}_embedding_ip
                 ON {CACHE_TABLE}
-                USING ivfflat (query_embedding vector_cosine_ops)
+                USING ivfflat (query_embedding vector_ip_ops)
                 WITH (lists = 100)
             """)
         except Exception as e:
             # ivfflat 인덱스 생성 실패 시 (데이터 부족 등) 무시
-            logger.debug(f"[FAQ] 인덱스 생성 스킵: {e}")
+            logger.debug("[FAQ] 인덱스 생성 스킵: %s", e)
+
+        # 이진 양자화 인덱스 (pgvector >= 0.7, Hamming 거리 1차 검색용)
+        # 미지원 버전에서는 생성에 실패하고, 검색은 FP32 내적 쿼리로 대체됨
+        try:
+            await db.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{CACHE_TABLE}_embedding_bq
+                ON {CACHE_TABLE}
+                USING hnsw ((binary_quantize(query_embedding)::bit({EMBEDDING_DIM})) bit_hamming_ops)
+            """)
+        except Exception as e:
+            logger.debug("[FAQ] 이진 양자화 인덱스 생성 스킵: %s", e)
 
-        logger.debug(f"[FAQ] 캐시 테이블 확인 완료: {CACHE_TABLE}")
+        logger.debug("[FAQ] 캐시 테이블 확인 완료: %s", CACHE_TABLE)
 
-    async def _get_embedding(self, text: str) -> List[float]:
-        """텍스트의 임베딩 벡터를 생성합니다."""
-        vector = await self._embeddings.aembed_query(text)
+    async def _supports_binary_quantize(self) -> bool:
+        """pgvector가 binary_quantize()를 지원하는지 확인합니다 (>= 0.7)."""
+        try:
+            await get_db_manager().fetchval("SELECT binary_quantize('[1,-1]'::vector)")
+            return True
+        except Exception as e:
+            logger.info("[FAQ] binary_quantize 미지원, FP32 내적 검색 사용: %s", e)
+            return False
+
+    async def _get_embedding(self, text: str) -> np.ndarray:
+        """텍스트의 L2 정규화된 임베딩 벡터를 생성합니다 (float32, C-contiguous)."""
+        # 캐시된 버퍼를 공유하지 않도록 복사 (아래에서 in-place 정규화)
+        vector = np.array(await embed_query(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
         return vector
 
     async def search_cache(
@@ -187,30 +268,16 @@ class FAQSemanticCache:
 
             # 쿼리 임베딩 생성
             query_embedding = await self._get_embedding(query)
-            embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
-
-            # 카테고리 필터 조건
-            category_filter = ""
-            if category:
-                category_filter = f"AND category = '{category}'"
-
-            # 코사인 유사도 검색 (1 - distance = similarity)
-            # asyncpg에서 :: 캐스팅 대신 CAST() 사용
-            search_sql = f"""
-                SELECT
-                    id,
-                    query_text,
-                    faq_results,
-                    category,
-                    1 - (query_embedding <=> CAST($1 AS vector)) as similarity
-                FROM {CACHE_TABLE}
-                WHERE query_embedding IS NOT NULL
-                {category_filter}
-                ORDER BY query_embedding <=> CAST($1 AS vector)
-                LIMIT 1
-            """
 
-            row = await db.fetchrow(search_sql, embedding_str)
+            # 카테고리는 문자열 결합 대신 파라미터로 전달
+            if self._binary_quantize:
+                row = await db.fetchrow(
+                    _CACHE_SEARCH_SQL, query_embedding, BINARY_CANDIDATES, category or None
+                )
+            else:
+                row = await db.fetchrow(
+                    _CACHE_SEARCH_FLAT_SQL, query_embedding, category or None
+                )
 
             search_time_ms = (time.time() - start_time) * 1000
 
@@ -222,7 +289,7 @@ class FAQSemanticCache:
             # 유사도가 임계값 미만이면 캐시 미스
             if similarity < similarity_threshold:
                 logger.debug(
-                    f"[FAQ] 캐시 미스: 유사도={similarity:.4f} < 임계값={similarity_threshold}"
+                    "[FAQ] 캐시 미스: 유사도=%.4f < 임계값=%s", similarity, similarity_threshold
                 )
                 return None
 
@@ -241,9 +308,8 @@ class FAQSemanticCache:
             cached_query = row["query_text"]
 
             logger.info(
-                f"[FAQ] 캐시 히트: 쿼리='{query[:30]}...' "
-                f"캐시된='{cached_query[:30]}...' "
-                f"유사도={similarity:.4f}"
+                "[FAQ] 캐시 히트: 쿼리='%s...' 캐시된='%s...' 유사도=%.4f",
+                query[:30], cached_query[:30], similarity,
             )
 
             return FAQCacheResult(
@@ -256,7 +322,7 @@ class FAQSemanticCache:
             )
 
         except Exception as e:
-            logger.error(f"[FAQ] 캐시 검색 실패: {e}")
+            logger.error("[FAQ] 캐시 검색 실패: %s", e)
             return None
 
     async def cache_result(
@@ -286,7 +352,6 @@ class FAQSemanticCache:
 
             # 쿼리 임베딩 생성
             query_embedding = await self._get_embedding(query)
-            embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
 
             # 캐시에 저장 (asyncpg에서 CAST 사용)
             insert_sql = f"""
@@ -297,16 +362,16 @@ class FAQSemanticCache:
             await db.execute(
                 insert_sql,
                 query,
-                embedding_str,
+                query_embedding,
                 category or "general",
                 json.dumps(faqs, ensure_ascii=False),
             )
 
-            logger.debug(f"[FAQ] 캐시 저장: 쿼리='{query[:50]}...', 결과={len(faqs)}개")
+            logger.debug("[FAQ] 캐시 저장: 쿼리='%s...', 결과=%d개", query[:50], len(faqs))
             return True
 
         except Exception as e:
-            logger.error(f"[FAQ] 캐시 저장 실패: {e}")
+            logger.error("[FAQ] 캐시 저장 실패: %s", e)
             return False
 
     async def search_with_cache(
@@ -315,6 +380,7 @@ class FAQSemanticCache:
         category: Optional[str] = None,
         fallback_search_func=None,
         similarity_threshold: float = SIMILARITY_THRESHOLD,
+        on_partial_result: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
     ) -> FAQCacheResult:
         """캐시를 확인하고, 미스 시 fallback 검색을 수행합니다.
 
@@ -324,6 +390,8 @@ class FAQSemanticCache:
             fallback_search_func: 캐시 미스 시 호출할 검색 함수
                 async def search(query: str, category: str) -> List[Dict]
             similarity_threshold: 유사도 임계값
+            on_partial_result: 캐시 미스 시 결과 캐싱(임베딩 + INSERT) 전에
+                fallback 결과를 먼저 전달받는 콜백
 
         Returns:
             FAQCacheResult: 검색 결과 (캐시 히트 여부 포함)
@@ -342,11 +410,17 @@ class FAQSemanticCache:
             try:
                 faqs = await fallback_search_func(query, category)
             except Exception as e:
-                logger.error(f"[FAQ] 폴백 검색 실패: {e}")
+                logger.error("[FAQ] 폴백 검색 실패: %s", e)
 
         search_time_ms = (time.time() - start_time) * 1000
 
-        # 3. 결과 캐싱
+        # 3. 결과 캐싱 (캐싱 전에 결과를 먼저 전달)
+        if faqs and on_partial_result:
+            try:
+                on_partial_result(faqs)
+            except Exception as e:
+                logger.warning("[FAQ] 부분 결과 전달 실패: %s", e)
+
         if faqs:
             await self.cache_result(query, faqs, category)
 
@@ -384,11 +458,11 @@ class FAQSemanticCache:
 
             # 결과에서 삭제된 행 수 추출
             deleted = int(result.split()[-1]) if result else 0
-            logger.info(f"[FAQ] 캐시 삭제 완료: {deleted}개 항목")
+            logger.info("[FAQ] 캐시 삭제 완료: %d개 항목", deleted)
             return deleted
 
         except Exception as e:
-            logger.error(f"[FAQ] 캐시 삭제 실패: {e}")
+            logger.error("[FAQ] 캐시 삭제 실패: %s", e)
             return 0
 
     async def get_cache_stats(self) -> Dict[str, Any]:
@@ -424,7 +498,7 @@ class FAQSemanticCache:
             }
 
         except Exception as e:
-            logger.error(f"[FAQ] 캐시 통계 조회 실패: {e}")
+            logger.error("[FAQ] 캐시 통계 조회 실패: %s", e)
             return {"initialized": True, "error": str(e)}
 
 
@@ -26,7 +26,7 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
 
 from .redis_connection import get_redis_manager
 
@@ -150,12 +150,15 @@ class FAQService:
             logger.error(f"[FAQ] 파일 로드 실패: {e}")
             return False
 
-    async def search(self, query: str, limit: int = 5) -> list[dict]:
+    async def search(
+        self, query: str, limit: int = 5, category: Optional[str] = None
+    ) -> list[dict]:
         """키워드로 FAQ를 검색합니다.
 
         Args:
             query: 검색 쿼리
             limit: 최대 결과 수
+            category: 우선할 FAQ 카테고리 (해당 카테고리 FAQ를 먼저 반환, 다른 카테고리도 포함)
 
         Returns:
             list[dict]: 관련도 순으로 정렬된 FAQ 목록
@@ -166,18 +169,10 @@ class FAQService:
         if not query or not query.strip():
             return []
 
-        query = query.strip().lower()
-        keywords = set(re.split(r'\s+', query))
-
-        results = []
-
-        for faq in self._faqs:
-            score = self._calculate_relevance(faq, query, keywords)
-            if score > 0:
-                results.append((score, faq))
-
-        # 점수 순으로 정렬
-        results.sort(key=lambda x: x[0], reverse=True)
+        results = self._score_faqs(query)
+        if category:
+            # 같은 카테고리 FAQ 우선 (안정 정렬이라 그룹 내 점수 순서 유지)
+            results.sort(key=lambda item: item[1].get("category") != category)
 
         return [faq for _, faq in results[:limit]]
 
@@ -208,18 +203,7 @@ class FAQService:
         if not query or not query.strip():
             return {}
 
-        query = query.strip().lower()
-        keywords = set(re.split(r'\s+', query))
-
-        # 점수와 함께 결과 수집
-        results = []
-        for faq in self._faqs:
-            score = self._calculate_relevance(faq, query, keywords)
-            if score > 0:
-                results.append((score, faq))
-
-        # 점수 순으로 정렬
-        results.sort(key=lambda x: x[0], reverse=True)
+        results = self._score_faqs(query)
 
         # 카테고리별 그룹화 (점수 순서 유지)
         grouped: Dict[str, List[dict]] = {}
@@ -255,6 +239,24 @@ class FAQService:
 
         return {cat: grouped[cat] for cat in sorted_categories}
 
+    def _score_faqs(self, query: str) -> list[tuple[float, dict]]:
+        """모든 FAQ의 관련도를 계산하여 점수 내림차순으로 반환합니다.
+
+        FAQ는 수십 건 규모라 스레드 풀로 넘기는 비용보다 인라인 계산이 빠릅니다.
+        """
+        query = query.strip().lower()
+        keywords = set(re.split(r'\s+', query))
+
+        results = []
+        for faq in self._faqs:
+            score = self._calculate_relevance(faq, query, keywords)
+            if score > 0:
+                results.append((score, faq))
+
+        # 점수 순으로 정렬
+        results.sort(key=lambda x: x[0], reverse=True)
+        return results
+
     def _calculate_relevance(self, faq: dict, query: str, keywords: set[str]) -> float:
         """FAQ와 검색어의 관련도를 계산합니다."""
         score = 0.0
@@ -416,6 +418,8 @@ class FAQService:
         limit: int = 5,
         use_cache: bool = True,
         distance_threshold: float = 0.15,
+        on_partial_result: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        category: Optional[str] = None,
     ) -> "FAQCacheResult":
         """의미 기반 FAQ 검색 (캐싱 포함).
 
@@ -427,6 +431,8 @@ class FAQService:
             limit: 최대 결과 수
             use_cache: 캐시 사용 여부
             distance_threshold: 유사도 임계값 (낮을수록 엄격, 기본 0.15)
+            on_partial_result: 캐시 미스 시 결과 캐싱 전에 검색 결과를 받는 콜백
+            category: FAQ 카테고리 (캐시 조회/저장 범위, 키워드 검색 시 우선 카테고리)
 
         Returns:
             FAQCacheResult: 검색 결과
@@ -449,7 +455,7 @@ class FAQService:
 
         # 캐시 사용 안 함
         if not use_cache:
-            faqs = await self.search(query, limit)
+            faqs = await self.search(query, limit, category)
             return FAQCacheResult(
                 query=query,
                 faqs=faqs,
@@ -464,12 +470,14 @@ class FAQService:
 
         async def fallback_search(q: str, cat: Optional[str]) -> List[Dict[str, Any]]:
             """캐시 미스 시 키워드 검색 fallback."""
-            return await self.search(q, limit)
+            return await self.search(q, limit, cat)
 
         result = await cache.search_with_cache(
             query=query,
+            category=category,
             fallback_search_func=fallback_search,
             similarity_threshold=distance_threshold,
+            on_partial_result=on_partial_result,
         )
 
         return result
@@ -6,6 +6,7 @@
 from fastapi import APIRouter
 
 from modules import get_db_manager, get_redis_manager
+from modules.agent import get_cache_stats
 
 router = APIRouter(prefix="/api/health", tags=["health"])
 
@@ -85,3 +86,13 @@ async def redis_health_check():
         return {"status": "ok", "connected": pong}
     except Exception as e:
         return {"status": "error", "message": str(e)}
+
+
+@router.get("/llm-cache")
+async def llm_cache_health_check():
+    """LLM 캐시 상태와 OpenAI 프롬프트 캐시 적중률을 확인합니다.
+
+    Returns:
+        dict: Redis 캐시 설정 및 cached_tokens/hit_ratio 통계
+    """
+    return get_cache_stats()
@@ -14,7 +14,7 @@ from typing import Optional, TYPE_CHECKING
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 
 from modules import CustomerRepository, get_agent_repository
-from modules.agent import get_or_create_agent, room_agents
+from modules.agent import get_agent, get_or_create_agent
 from .deps import verify_ws_token
 
 if TYPE_CHECKING:
@@ -211,7 +211,7 @@ async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = Query(
             return
 
         try:
-            agent = room_agents.get(room_name)
+            agent = get_agent(room_name)
             if not agent:
                 logger.warning(f"방 '{room_name}'의 에이전트를 찾을 수 없음")
                 return
@@ -238,6 +238,21 @@ async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = Query(
                 except Exception as err:
                     logger.error(f"에이전트 업데이트 브로드캐스트 실패: {err}")
 
+            # LLM 토큰 델타 실시간 전송 (노드 결과 완성 전 진행 상황 표시용)
+            async def handle_agent_delta(chunk: dict):
+                try:
+                    await broadcast_to_room(
+                        room_name,
+                        {
+                            "type": "agent_delta",
+                            "turn_id": chunk.get("turn_id"),
+                            "node": chunk.get("node"),
+                            "delta": chunk.get("delta"),
+                        }
+                    )
+                except Exception as err:
+                    logger.error(f"에이전트 델타 브로드캐스트 실패: {err}")
+
             result = await agent.on_new_transcript(
                 peer_id,
                 nickname,
@@ -246,7 +261,8 @@ async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = Query(
                 run_summary=should_run_summary,
                 on_update=handle_agent_update,
                 turn_id=turn_id,
-                is_customer=is_customer
+                is_customer=is_customer,
+                on_delta=handle_agent_delta,
             )
 
             if "error" in result:
@@ -517,8 +533,8 @@ async def _handle_join_room(
     if agent and customer_info:
         agent.set_customer_context(customer_info, consultation_history)
         if agent.session_id and customer_info.get('customer_id'):
-            await agent.update_session_customer(customer_info['customer_id'])
-            logger.info(f"[세션] 고객 연결 완료 - session={agent.session_id}")
+            if await agent.update_session_customer(customer_info['customer_id']):
+                logger.info(f"[세션] 고객 연결 예약 - session={agent.session_id}")
 
     logger.info(f"피어 {nickname} ({peer_id})가 방 '{room_name}'에 입장함")
 
@@ -618,10 +634,9 @@ async def _handle_end_session(websocket: WebSocket, current_room: Optional[str])
 
     logger.info(f"방 '{current_room}'의 세션 종료 처리 중")
     try:
-        agent = room_agents.get(current_room)
+        agent = get_agent(current_room)
         if agent and agent.session_id:
-            conversation_history = agent.state.get("conversation_history", [])
-            transcript_count = len(conversation_history)
+            transcript_count = agent.transcript_count
 
             success = await agent.end_session()
             logger.info(f"방 '{current_room}' 세션 종료: success={success}")
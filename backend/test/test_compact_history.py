@@ -0,0 +1,133 @@
+"""RoomAgent._compact_history 단위 테스트 (대화 이력 압축/강제 압축).
+
+LLM 초기화 없이 RoomAgent 인스턴스를 만들어 state만 검증합니다.
+
+사용법:
+    cd backend
+    uv run --with pytest pytest test/test_compact_history.py -q
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.agent import manager
+from modules.agent.manager import (
+    MAX_HISTORY_TURNS,
+    MAX_HISTORY_TURNS_HARD,
+    RoomAgent,
+    _HISTORY_INDEX_KEYS,
+    _initial_state,
+)
+from modules.agent.utils import Utterance
+
+
+def _agent(turns: int, **indices) -> RoomAgent:
+    """발화 turns개와 인덱스 값을 가진 RoomAgent (기본 인덱스 = 전부 처리 완료)."""
+    agent = RoomAgent.__new__(RoomAgent)
+    agent.room_name = "test-room"
+    agent.state = _initial_state(agent.room_name)
+    agent.state["conversation_history"] = [
+        Utterance(speaker_name="고객" if i % 2 == 0 else "상담사", text=f"발화{i}", is_customer=i % 2 == 0)
+        for i in range(turns)
+    ]
+    for key in _HISTORY_INDEX_KEYS:
+        agent.state[key] = indices.get(key, turns)
+    return agent
+
+
+def test_no_compaction_under_limit():
+    agent = _agent(MAX_HISTORY_TURNS)
+    history = agent.state["conversation_history"]
+    agent._compact_history()
+    assert agent.state["conversation_history"] is history
+    assert agent.state["last_intent_index"] == MAX_HISTORY_TURNS
+
+
+def test_drops_overflow_and_shifts_indices():
+    turns = MAX_HISTORY_TURNS + 10
+    agent = _agent(turns)
+    agent.state["faq_trigger_index"] = turns
+    agent.state["recent_customer_utts"].extend([(5, "발화5"), (turns - 2, "마지막")])
+    original = agent.state["conversation_history"]
+
+    agent._compact_history()
+
+    history = agent.state["conversation_history"]
+    assert len(history) == MAX_HISTORY_TURNS
+    assert history[0].text == "발화10"
+    assert len(original) == turns  # 이전 리스트는 변경하지 않음
+    assert all(agent.state[key] == MAX_HISTORY_TURNS for key in _HISTORY_INDEX_KEYS)
+    # 마커는 현재 대화 수와 계속 일치
+    assert agent.state["faq_trigger_index"] == len(history)
+    # 제거된 발화를 가리키는 최근 고객 발화는 버리고 나머지는 위치 이동
+    assert list(agent.state["recent_customer_utts"]) == [(turns - 12, "마지막")]
+    assert agent.state["pending_summary_text"] == ""
+
+
+def test_drop_is_bounded_by_lagging_index():
+    turns = MAX_HISTORY_TURNS + 10
+    agent = _agent(turns, last_rag_index=4)
+
+    agent._compact_history()
+
+    assert len(agent.state["conversation_history"]) == turns - 4
+    assert agent.state["last_rag_index"] == 0
+    assert agent.state["last_summarized_index"] == turns - 4
+
+
+def test_unprocessed_turns_are_kept_below_hard_cap():
+    turns = MAX_HISTORY_TURNS_HARD
+    agent = _agent(turns, last_summarized_index=0)
+
+    agent._compact_history()
+
+    assert len(agent.state["conversation_history"]) == turns
+    assert agent.state["pending_summary_text"] == ""
+
+
+def test_hard_cap_folds_unsummarized_turns_into_pending_summary():
+    turns = MAX_HISTORY_TURNS_HARD + 1
+    summarized = 20
+    agent = _agent(turns, last_summarized_index=summarized, last_intent_index=3)
+
+    agent._compact_history()
+
+    drop = turns - MAX_HISTORY_TURNS
+    history = agent.state["conversation_history"]
+    assert len(history) == MAX_HISTORY_TURNS
+    assert history[0].text == f"발화{drop}"
+
+    pending = agent.state["pending_summary_text"].split("\n")
+    assert pending[0] == f"고객: 발화{summarized}"
+    assert pending[-1].endswith(f"발화{drop - 1}")
+    assert len(pending) == drop - summarized
+
+    # 처리하지 못한 노드의 인덱스는 0으로, 처리한 노드는 위치 이동
+    assert agent.state["last_summarized_index"] == 0
+    assert agent.state["last_intent_index"] == 0
+    assert agent.state["last_risk_index"] == MAX_HISTORY_TURNS
+
+
+def test_hard_cap_without_unsummarized_turns_adds_no_pending_text():
+    turns = MAX_HISTORY_TURNS_HARD + 1
+    agent = _agent(turns, last_intent_index=0)
+
+    agent._compact_history()
+
+    assert len(agent.state["conversation_history"]) == MAX_HISTORY_TURNS
+    assert agent.state["pending_summary_text"] == ""
+
+
+def test_pending_summary_text_is_appended_and_bounded(monkeypatch):
+    monkeypatch.setattr(manager, "MAX_PENDING_SUMMARY_CHARS", 50)
+    agent = _agent(MAX_HISTORY_TURNS_HARD + 1, last_summarized_index=0)
+    agent.state["pending_summary_text"] = "이전 대기 텍스트"
+
+    agent._compact_history()
+
+    pending = agent.state["pending_summary_text"]
+    assert len(pending) == 50
+    assert pending.endswith(f"발화{MAX_HISTORY_TURNS_HARD + 1 - MAX_HISTORY_TURNS - 1}")
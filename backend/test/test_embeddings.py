@@ -0,0 +1,157 @@
+"""임베딩 마이크로 배처와 쿼리 임베딩 LRU 단위 테스트.
+
+OpenAI 호출 없이 get_embeddings()를 가짜 클라이언트로 바꿔 검증합니다.
+
+사용법:
+    cd backend
+    uv run --with pytest pytest test/test_embeddings.py -q
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from modules.database import embeddings
+
+
+class FakeEmbeddings:
+    """aembed_documents 호출을 기록하는 가짜 임베딩 클라이언트."""
+
+    def __init__(self, drop: int = 0, error: Exception = None, delay: float = 0.0):
+        self.calls = []
+        self.drop = drop
+        self.error = error
+        self.delay = delay
+
+    async def aembed_documents(self, texts):
+        self.calls.append(list(texts))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        vectors = [[float(len(text)), 1.0, -0.5] for text in texts]
+        return vectors[:len(vectors) - self.drop]
+
+
+@pytest.fixture
+def fake_embeddings(monkeypatch):
+    def install(**kwargs) -> FakeEmbeddings:
+        fake = FakeEmbeddings(**kwargs)
+        monkeypatch.setattr(embeddings, "get_embeddings", lambda: fake)
+        return fake
+
+    embeddings.clear_embedding_cache()
+    embeddings._inflight.clear()
+    for key in embeddings._embed_cache_stats:
+        embeddings._embed_cache_stats[key] = 0
+    yield install
+    embeddings.clear_embedding_cache()
+    embeddings._inflight.clear()
+
+
+def test_batcher_groups_concurrent_requests(fake_embeddings):
+    fake = fake_embeddings()
+
+    async def run():
+        batcher = embeddings.EmbeddingBatcher(max_batch=8, linger_ms=5)
+        return await asyncio.gather(*(batcher.submit(text) for text in ("a", "bb", "ccc")))
+
+    vectors = asyncio.run(run())
+    assert fake.calls == [["a", "bb", "ccc"]]
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0]
+    assert all(vector.typecode == "f" for vector in vectors)
+
+
+def test_batcher_flushes_when_full(fake_embeddings):
+    fake = fake_embeddings()
+
+    async def run():
+        batcher = embeddings.EmbeddingBatcher(max_batch=2, linger_ms=1000)
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(text) for text in ("a", "b", "c", "d"))),
+            timeout=1.0,
+        )
+
+    asyncio.run(run())
+    assert fake.calls == [["a", "b"], ["c", "d"]]
+
+
+def test_batcher_propagates_api_error_to_every_caller(fake_embeddings):
+    fake_embeddings(error=RuntimeError("api down"))
+
+    async def run():
+        batcher = embeddings.EmbeddingBatcher(max_batch=8, linger_ms=1)
+        return await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_batcher_fails_requests_missing_from_response(fake_embeddings):
+    fake_embeddings(drop=1)
+
+    async def run():
+        batcher = embeddings.EmbeddingBatcher(max_batch=8, linger_ms=1)
+        return await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True),
+            timeout=1.0,
+        )
+
+    first, second = asyncio.run(run())
+    assert first[0] == 1.0
+    assert isinstance(second, RuntimeError)
+
+
+def test_embed_query_caches_int8_and_restores_vector(fake_embeddings):
+    fake = fake_embeddings()
+
+    async def run():
+        first = await embeddings.embed_query("VIP 혜택")
+        second = await embeddings.embed_query("VIP 혜택")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(fake.calls) == 1
+    assert second.typecode == "f"
+    assert second is not first
+    assert list(second) == pytest.approx(list(first), abs=0.05)
+
+    stats = embeddings.get_embedding_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    codes, _scale = embeddings._embed_cache["VIP 혜택"]
+    assert codes.dtype.name == "int8"
+
+
+def test_embed_query_single_flight(fake_embeddings):
+    fake = fake_embeddings(delay=0.05)
+
+    async def run():
+        return await asyncio.gather(*(embeddings.embed_query("요금제") for _ in range(3)))
+
+    results = asyncio.run(run())
+    assert fake.calls == [["요금제"]]
+    assert results[0] is results[1] is results[2]
+    assert embeddings.get_embedding_cache_stats()["coalesced"] == 2
+
+
+def test_embed_query_does_not_cache_failures(fake_embeddings):
+    fake = fake_embeddings(error=RuntimeError("api down"))
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await embeddings.embed_query("요금제")
+        fake.error = None
+        return await embeddings.embed_query("요금제")
+
+    vector = asyncio.run(run())
+    assert vector[0] == 3.0
+    assert len(fake.calls) == 2
+    assert not embeddings._inflight
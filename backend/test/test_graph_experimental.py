@@ -36,6 +36,7 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / "config" / ".env")
 
 from backend.modules.agent.agents import create_agent_graph, ContextSchema
+from modules.agent.utils.states import Utterance
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 
@@ -333,13 +334,13 @@ class GraphExperimentalTester:
     def add_utterance(self, speaker: str, text: str):
         """대화에 발화 추가"""
         is_customer = speaker in ["고객", "customer", "user"]
-        self.state["conversation_history"].append({
-            "speaker_name": speaker,
-            "speaker_id": "customer" if is_customer else "agent",
-            "text": text,
-            "timestamp": time.time(),
-            "is_customer": is_customer,
-        })
+        self.state["conversation_history"].append(Utterance(
+            speaker_name=speaker,
+            speaker_id="customer" if is_customer else "agent",
+            text=text,
+            timestamp=time.time(),
+            is_customer=is_customer,
+        ))
         if is_customer:
             self.state["has_new_customer_turn"] = True
 
@@ -631,7 +632,7 @@ class GraphExperimentalTester:
                 if user_input == "/history":
                     print("\n현재 대화 히스토리:")
                     for i, entry in enumerate(self.state["conversation_history"]):
-                        print(f"  [{i+1}] {entry['speaker_name']}: {entry['text']}")
+                        print(f"  [{i+1}] {entry.speaker_name}: {entry.text}")
                     continue
 
                 if user_input == "/messages":
@@ -43,6 +43,7 @@ load_dotenv(Path(__file__).parent.parent / "config" / ".env")
 from modules.agent.graph import create_agent_graph, ContextSchema
 from modules.agent.cache import setup_global_llm_cache, get_cache_stats
 from modules.agent.manager import RoomAgent
+from modules.agent.utils.states import Utterance
 from modules.database import get_db_manager
 from modules.database.repository import CustomerRepository
 from modules.database.consultation_repository import AgentRepository, get_agent_repository
@@ -291,11 +292,11 @@ class GraphTester:
 
     def add_utterance(self, speaker: str, text: str):
         """대화에 발화 추가"""
-        self.state["conversation_history"].append({
-            "speaker_name": speaker,
-            "text": text,
-            "timestamp": time.time()
-        })
+        self.state["conversation_history"].append(Utterance(
+            speaker_name=speaker,
+            text=text,
+            timestamp=time.time(),
+        ))
 
     async def run_graph(self, utterance_info: Optional[Dict] = None):
         """그래프 실행 및 결과 스트리밍"""
@@ -576,7 +577,7 @@ class GraphTester:
                 if user_input == "/history":
                     print("\n현재 대화 히스토리:")
                     for i, entry in enumerate(self.state["conversation_history"]):
-                        print(f"  [{i+1}] {entry['speaker_name']}: {entry['text']}")
+                        print(f"  [{i+1}] {entry.speaker_name}: {entry.text}")
                     continue
 
                 if user_input == "/reset":
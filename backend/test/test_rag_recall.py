@@ -0,0 +1,112 @@
+"""RAG 벡터 검색 재현율 확인 스크립트 (HNSW 근사 검색 vs 정확 검색).
+
+collection_id 후필터링으로 HNSW 후보가 줄어드는지 확인하기 위해 컬렉션별로
+저장된 임베딩을 쿼리로 삼아 근사 검색(인덱스)과 정확 검색(순차 스캔)의
+상위 k개를 비교합니다. 연결 풀 설정(HNSW_EF_SEARCH, HNSW_ITERATIVE_SCAN)이 그대로 적용됩니다.
+
+사용법:
+    cd backend
+    uv run python test/test_rag_recall.py [샘플 수] [k]
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv(Path(__file__).parent.parent / "config" / ".env")
+
+# 컬렉션 평균 재현율이 이 값보다 낮으면 실패
+MIN_RECALL = 0.95
+
+# RAG 검색(_RAG_SEARCH_SQL의 ranked CTE)과 같은 필터/정렬, id만 조회
+_KNN_SQL = """
+    SELECT e.id
+    FROM langchain_pg_embedding e
+    WHERE e.collection_id = $2::uuid
+    ORDER BY e.embedding <=> $1::vector
+    LIMIT $3
+"""
+
+
+async def _knn_ids(conn, embedding, collection_id, k: int, exact: bool) -> set:
+    """상위 k개 id를 조회합니다 (exact=True면 인덱스 스캔을 끄고 정확 검색)."""
+    async with conn.transaction():
+        if exact:
+            await conn.execute("SET LOCAL enable_indexscan = off")
+        rows = await conn.fetch(_KNN_SQL, embedding, collection_id, k)
+    return {row["id"] for row in rows}
+
+
+async def test_rag_recall(samples: int = 20, k: int = 5) -> bool:
+    """컬렉션별 recall@k를 출력하고 모두 MIN_RECALL 이상인지 반환합니다."""
+    from modules.database import get_db_manager
+    from modules.agent.utils.nodes import COLLECTIONS
+
+    print("=" * 60)
+    print(f"RAG Recall Test (samples={samples}, k={k})")
+    print("=" * 60)
+
+    db = get_db_manager()
+    if not await db.initialize():
+        print("Database 연결 실패!")
+        return False
+
+    ok = True
+    try:
+        async with db.acquire() as conn:
+            ef_search = await conn.fetchval("SELECT current_setting('hnsw.ef_search', true)")
+            iterative_scan = await conn.fetchval(
+                "SELECT current_setting('hnsw.iterative_scan', true)"
+            )
+            print(f"   - hnsw.ef_search={ef_search}, hnsw.iterative_scan={iterative_scan}")
+
+            for name in COLLECTIONS.values():
+                collection_id = await conn.fetchval(
+                    "SELECT uuid FROM langchain_pg_collection WHERE name = $1", name
+                )
+                if collection_id is None:
+                    print(f"\n[{name}] 컬렉션 없음, 스킵")
+                    continue
+
+                queries = await conn.fetch(
+                    """
+                    SELECT embedding FROM langchain_pg_embedding
+                    WHERE collection_id = $1 ORDER BY random() LIMIT $2
+                    """,
+                    collection_id, samples,
+                )
+                if not queries:
+                    print(f"\n[{name}] 임베딩 없음, 스킵")
+                    continue
+
+                recalls = []
+                short = 0
+                for row in queries:
+                    exact = await _knn_ids(conn, row["embedding"], collection_id, k, exact=True)
+                    approx = await _knn_ids(conn, row["embedding"], collection_id, k, exact=False)
+                    if len(approx) < len(exact):
+                        short += 1
+                    recalls.append(len(exact & approx) / len(exact))
+
+                recall = sum(recalls) / len(recalls)
+                status = "OK" if recall >= MIN_RECALL else "FAIL"
+                print(
+                    f"\n[{name}] recall@{k}={recall:.3f} "
+                    f"(쿼리 {len(recalls)}개, 결과 부족 {short}개) {status}"
+                )
+                ok = ok and recall >= MIN_RECALL
+    finally:
+        await db.close()
+
+    print("\n" + "=" * 60)
+    print("PASS" if ok else f"FAIL (recall < {MIN_RECALL})")
+    return ok
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    sys.exit(0 if asyncio.run(test_rag_recall(*args)) else 1)
@@ -0,0 +1,137 @@
+"""RAG 정책 검색 single-flight / 시맨틱 캐시 단위 테스트.
+
+임베딩과 pgvector 검색을 가짜 함수로 바꿔 동시 요청 병합과 캐시 정책을 검증합니다.
+
+사용법:
+    cd backend
+    uv run --with pytest pytest test/test_rag_single_flight.py -q
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from modules.agent.utils import nodes
+from modules.agent.utils.result_cache import SemanticResultCache
+
+INTENT = "요금제 변경"
+QUERY = "요금제 바꾸고 싶어요"
+
+
+class FakeSearch:
+    """_search_with_collections 대체 (호출 기록, release 전까지 대기)."""
+
+    def __init__(self, results=("rec-1", "rec-2"), error: Exception = None):
+        self.calls = []
+        self.results = list(results)
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return list(self.results)
+
+
+@pytest.fixture
+def rag(monkeypatch):
+    async def fake_embedding(text):
+        return [1.0, 0.0, 0.0]
+
+    monkeypatch.setattr(nodes, "_get_embedding", fake_embedding)
+    monkeypatch.setattr(nodes, "_rag_result_cache", SemanticResultCache(threshold=0.95))
+    nodes._inflight_rag_searches.clear()
+
+    def install(**kwargs) -> FakeSearch:
+        search = FakeSearch(**kwargs)
+        monkeypatch.setattr(nodes, "_search_with_collections", search)
+        return search
+
+    yield install
+    nodes._inflight_rag_searches.clear()
+
+
+async def _concurrent(search: FakeSearch, count: int, **kwargs):
+    tasks = [
+        asyncio.create_task(nodes.rag_policy_search(INTENT, QUERY, **kwargs))
+        for _ in range(count)
+    ]
+    # 모든 요청이 single-flight 대기에 들어간 뒤 검색 완료
+    await asyncio.sleep(0.01)
+    search.release.set()
+    return await asyncio.gather(*tasks)
+
+
+def test_concurrent_identical_searches_share_one_query(rag):
+    search = rag()
+    results = asyncio.run(_concurrent(search, 3))
+
+    assert len(search.calls) == 1
+    assert all(result.recommendations == ["rec-1", "rec-2"] for result in results)
+    assert all(result.error is None for result in results)
+    assert not nodes._inflight_rag_searches
+
+
+def test_different_top_k_is_a_separate_flight(rag):
+    search = rag()
+
+    async def run():
+        tasks = [
+            asyncio.create_task(nodes.rag_policy_search(INTENT, QUERY, top_k=top_k))
+            for top_k in (3, 5)
+        ]
+        await asyncio.sleep(0.01)
+        search.release.set()
+        return await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert len(search.calls) == 2
+
+
+def test_result_is_cached_for_similar_queries(rag):
+    search = rag()
+    search.release.set()
+
+    async def run():
+        first = await nodes.rag_policy_search(INTENT, QUERY)
+        second = await nodes.rag_policy_search(INTENT, "요금제 변경하려구요")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(search.calls) == 1
+    assert second.recommendations == first.recommendations
+    assert second.query == "요금제 변경하려구요"
+
+
+def test_empty_result_is_not_cached(rag):
+    search = rag(results=())
+    search.release.set()
+
+    async def run():
+        await nodes.rag_policy_search(INTENT, QUERY)
+        await nodes.rag_policy_search(INTENT, QUERY)
+
+    asyncio.run(run())
+    assert len(search.calls) == 2
+
+
+def test_search_error_reaches_every_waiter_and_is_not_cached(rag):
+    search = rag(error=RuntimeError("db down"))
+    results = asyncio.run(_concurrent(search, 2))
+
+    assert len(search.calls) == 1
+    assert all(result.error == "db down" for result in results)
+    assert all(result.recommendations == [] for result in results)
+    assert not nodes._inflight_rag_searches
+
+    # 오류 결과는 캐시되지 않아 다음 요청은 다시 검색
+    search.error = None
+    asyncio.run(nodes.rag_policy_search(INTENT, QUERY))
+    assert len(search.calls) == 2
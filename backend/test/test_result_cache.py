@@ -0,0 +1,130 @@
+"""SemanticResultCache 단위 테스트 (임계값, 범위, LRU, TTL, int8 양자화).
+
+사용법:
+    cd backend
+    uv run --with pytest pytest test/test_result_cache.py -q
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from modules.agent.utils import result_cache
+from modules.agent.utils.result_cache import SemanticResultCache
+from modules.database import quantize_int8, dequantize_int8
+
+DIM = 64
+
+
+def _unit(seed: int) -> np.ndarray:
+    vector = np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _near(vector: np.ndarray, noise: float, seed: int = 99) -> np.ndarray:
+    """vector에 작은 잡음을 더한 벡터 (noise가 작을수록 코사인 유사도가 1에 가까움)."""
+    jitter = np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+    return vector + noise * jitter / np.linalg.norm(jitter)
+
+
+def test_quantize_roundtrip_keeps_cosine():
+    vector = _unit(1)
+    codes, scale = quantize_int8(vector)
+    assert codes.dtype == np.int8
+    assert np.abs(codes).max() == 127
+    restored = dequantize_int8(codes, scale)
+    cosine = float(restored @ vector / np.linalg.norm(restored))
+    assert cosine > 0.999
+
+
+def test_quantize_zero_vector():
+    codes, scale = quantize_int8(np.zeros(DIM, dtype=np.float32))
+    assert scale == 1.0
+    assert not codes.any()
+
+
+def test_hit_above_threshold_and_miss_below():
+    cache = SemanticResultCache(max_size=8, ttl=60.0, threshold=0.95)
+    base = _unit(1)
+    cache.put(base, "scope", "result")
+
+    assert cache.get(_near(base, 0.05), "scope") == "result"
+    assert cache.get(_unit(2), "scope") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_scaled_query_vector_still_hits():
+    """저장/조회 모두 정규화하므로 벡터 크기와 무관하게 코사인으로 비교."""
+    cache = SemanticResultCache(threshold=0.95)
+    base = _unit(1)
+    cache.put(base * 3.0, "scope", "result")
+    assert cache.get(base * 0.5, "scope") == "result"
+
+
+def test_scopes_are_isolated():
+    cache = SemanticResultCache(threshold=0.95)
+    base = _unit(1)
+    cache.put(base, ("요금 문의", ("kt_mobile_plans",)), "mobile")
+
+    assert cache.get(base, ("요금 문의", ("kt_tv_plans",))) is None
+    assert cache.get(base, ("요금 문의", ("kt_mobile_plans",))) == "mobile"
+
+
+def test_best_match_wins_within_scope():
+    cache = SemanticResultCache(threshold=0.5)
+    first, second = _unit(1), _unit(2)
+    cache.put(first, "scope", "first")
+    cache.put(second, "scope", "second")
+    assert cache.get(_near(second, 0.05), "scope") == "second"
+
+
+def test_lru_evicts_least_recently_used():
+    cache = SemanticResultCache(max_size=2, threshold=0.95)
+    a, b, c = _unit(1), _unit(2), _unit(3)
+    cache.put(a, "scope", "a")
+    cache.put(b, "scope", "b")
+    assert cache.get(a, "scope") == "a"  # a를 최근 사용으로 갱신
+
+    cache.put(c, "scope", "c")  # 가장 오래 전 사용한 b 제거
+    assert cache.stats()["size"] == 2
+    assert cache.get(b, "scope") is None
+    assert cache.get(a, "scope") == "a"
+    assert cache.get(c, "scope") == "c"
+
+
+def test_eviction_of_last_entry_removes_scope():
+    cache = SemanticResultCache(max_size=1, threshold=0.95)
+    cache.put(_unit(1), "old", "a")
+    cache.put(_unit(2), "new", "b")
+    assert "old" not in cache._scopes
+    assert cache.get(_unit(1), "old") is None
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+
+    cache = SemanticResultCache(ttl=10.0, threshold=0.95)
+    base = _unit(1)
+    cache.put(base, "scope", "result")
+
+    now[0] += 5.0
+    assert cache.get(base, "scope") == "result"
+
+    now[0] += 10.0
+    assert cache.get(base, "scope") is None
+    assert cache.stats()["size"] == 0
+    assert "scope" not in cache._scopes
+
+
+def test_clear():
+    cache = SemanticResultCache()
+    cache.put(_unit(1), "scope", "result")
+    cache.clear()
+    assert cache.stats()["size"] == 0
+    assert cache.get(_unit(1), "scope") is None
@@ -0,0 +1,161 @@
+"""전사 WAL(TranscriptWAL / replay_transcript_wal) 단위 테스트.
+
+DB 대신 가짜 TranscriptRepository를 사용합니다.
+
+사용법:
+    cd backend
+    uv run --with pytest pytest test/test_transcript_wal.py -q
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import modules.database
+from modules.agent import transcript_wal
+from modules.agent.transcript_wal import TranscriptWAL, _load_rows, replay_transcript_wal
+
+
+class FakeTranscriptRepository:
+    """add_transcripts_bulk 호출을 기록하고 저장 건수를 조절하는 가짜 저장소."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail_sessions = set()
+
+    async def add_transcripts_bulk(self, rows, batch_size=32):
+        self.calls.append((rows, batch_size))
+        if rows and rows[0]["session_id"] in self.fail_sessions:
+            return 0
+        return len(rows)
+
+
+@pytest.fixture
+def wal_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcript_wal, "WAL_DIR", str(tmp_path))
+    monkeypatch.setattr(transcript_wal, "WAL_ENABLED", True)
+    return tmp_path
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    fake = FakeTranscriptRepository()
+    monkeypatch.setattr(modules.database, "get_transcript_repository", lambda: fake)
+    return fake
+
+
+def _row(session_id, turn_index, text="안녕하세요"):
+    return {
+        "session_id": session_id,
+        "turn_index": turn_index,
+        "speaker_type": "customer",
+        "speaker_name": "고객",
+        "text": text,
+    }
+
+
+def _write_wal(session_id, count):
+    wal = TranscriptWAL(session_id)
+    for i in range(count):
+        wal.append(_row(session_id, i))
+    asyncio.run(wal.sync())
+    wal.close()
+    return wal.path
+
+
+def test_append_sync_and_load_round_trip(wal_dir):
+    session_id = uuid4()
+    wal = TranscriptWAL(session_id)
+    wal.append(_row(session_id, 0, "요금제 문의"))
+    wal.append(_row(session_id, 1))
+    asyncio.run(wal.sync())
+    asyncio.run(wal.sync())  # 새 기록이 없으면 no-op
+    wal.close()
+
+    assert wal.path == wal_dir / f"{session_id}.jsonl"
+    rows = _load_rows(wal.path)
+    assert [r["turn_index"] for r in rows] == [0, 1]
+    assert rows[0]["session_id"] == session_id
+    assert rows[0]["text"] == "요금제 문의"
+
+
+def test_close_with_remove_deletes_file(wal_dir):
+    wal = TranscriptWAL(uuid4())
+    wal.append(_row(uuid4(), 0))
+    wal.close(remove=True)
+    assert not wal.path.exists()
+
+
+def test_reopen_appends_to_existing_file(wal_dir):
+    session_id = uuid4()
+    _write_wal(session_id, 2)
+    path = _write_wal(session_id, 1)
+    assert len(_load_rows(path)) == 3
+
+
+def test_load_rows_skips_corrupt_lines(wal_dir):
+    session_id = uuid4()
+    path = _write_wal(session_id, 2)
+    with open(path, "ab") as f:
+        f.write(b'{"session_id": "' + str(session_id).encode() + b'", "tu')  # 비정상 종료로 잘린 줄
+
+    rows = _load_rows(path)
+    assert [r["turn_index"] for r in rows] == [0, 1]
+
+
+def test_replay_saves_rows_and_removes_files(wal_dir, repo):
+    first, second = uuid4(), uuid4()
+    first_path = _write_wal(first, 3)
+    second_path = _write_wal(second, 2)
+
+    replayed = asyncio.run(replay_transcript_wal(batch_size=7))
+
+    assert replayed == 5
+    assert not first_path.exists()
+    assert not second_path.exists()
+    assert all(batch_size == 7 for _, batch_size in repo.calls)
+    assert sorted(len(rows) for rows, _ in repo.calls) == [2, 3]
+
+
+def test_replay_keeps_file_when_save_fails(wal_dir, repo):
+    ok, failed = uuid4(), uuid4()
+    ok_path = _write_wal(ok, 2)
+    failed_path = _write_wal(failed, 2)
+    repo.fail_sessions.add(failed)
+
+    replayed = asyncio.run(replay_transcript_wal())
+
+    assert replayed == 2
+    assert not ok_path.exists()
+    assert failed_path.exists()
+    assert len(_load_rows(failed_path)) == 2
+
+
+def test_replay_is_noop_when_disabled(wal_dir, repo, monkeypatch):
+    _write_wal(uuid4(), 1)
+    monkeypatch.setattr(transcript_wal, "WAL_ENABLED", False)
+
+    assert asyncio.run(replay_transcript_wal()) == 0
+    assert repo.calls == []
+
+
+def test_replay_is_noop_when_directory_missing(tmp_path, repo, monkeypatch):
+    monkeypatch.setattr(transcript_wal, "WAL_DIR", str(tmp_path / "missing"))
+    monkeypatch.setattr(transcript_wal, "WAL_ENABLED", True)
+
+    assert asyncio.run(replay_transcript_wal()) == 0
+    assert repo.calls == []
+
+
+def test_wal_lines_are_json(wal_dir):
+    session_id = uuid4()
+    path = _write_wal(session_id, 1)
+    line = path.read_bytes().splitlines()[0]
+    assert json.loads(line)["session_id"] == str(session_id)
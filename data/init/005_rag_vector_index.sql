@@ -0,0 +1,35 @@
+-- RAG 벡터 검색 HNSW 인덱스
+-- langchain_pg_embedding 순차 스캔(O(N·차원)) 대신 근사 최근접 탐색 사용
+
+-- HNSW 인덱스 (코사인 거리, RAG 검색의 <=> 연산자와 일치)
+-- - pgvector는 vector 타입 인덱스에 2000차원 제한이 있어 차원이 그 이하일 때만 생성
+--   (text-embedding-3-small 1536차원 O, text-embedding-3-large 3072차원 X)
+-- - 탐색 범위(hnsw.ef_search)는 애플리케이션 연결 풀에서 설정 (HNSW_EF_SEARCH, 기본값 40)
+-- - RAG 검색은 collection_id로 후필터링하므로 연결 풀에서 hnsw.iterative_scan도 설정
+--   (HNSW_ITERATIVE_SCAN, 기본값 relaxed_order, pgvector 0.8+)
+--   -> 필터 후 결과가 LIMIT보다 적으면 인덱스 탐색을 계속하여 재현율 유지
+-- - 재현율 확인: backend/test/test_rag_recall.py (정확 검색 대비 recall@k)
+-- - 운영 DB에 추가할 때는 쓰기 잠금을 피하도록 CONCURRENTLY로 직접 실행:
+--   CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_langchain_embedding_hnsw
+--   ON langchain_pg_embedding USING hnsw (embedding vector_cosine_ops)
+--   WITH (m = 16, ef_construction = 64);
+DO $$
+DECLARE
+    embedding_dim INTEGER;
+BEGIN
+    SELECT atttypmod INTO embedding_dim
+    FROM pg_attribute
+    WHERE attrelid = 'langchain_pg_embedding'::regclass
+      AND attname = 'embedding';
+
+    IF embedding_dim > 0 AND embedding_dim <= 2000 THEN
+        CREATE INDEX IF NOT EXISTS idx_langchain_embedding_hnsw
+        ON langchain_pg_embedding
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64);
+    ELSE
+        RAISE NOTICE 'langchain_pg_embedding.embedding 차원(%)이 HNSW 제한(2000)을 넘어 인덱스 생성 생략', embedding_dim;
+    END IF;
+END $$;
+
+-- 컬렉션 필터(collection_id)는 002_pgvector_schema.sql의 idx_langchain_embedding_collection 사용
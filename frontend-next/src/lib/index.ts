@@ -18,6 +18,7 @@ export type {
   UserEventData,
   TranscriptData,
   AgentUpdateData,
+  AgentDeltaData,
   AgentStatusData,
   AgentConsultationData,
   SessionEndedData,
@@ -35,6 +36,7 @@ export type {
   OnTranscriptCallback,
   OnAgentReadyCallback,
   OnAgentUpdateCallback,
+  OnAgentDeltaCallback,
   OnAgentStatusCallback,
   OnAgentConsultationCallback,
   OnSessionEndedCallback,
@@ -46,6 +46,7 @@ export interface SignalingMessage {
   data?: Record<string, unknown>;
   node?: string;
   turn_id?: string;
+  delta?: string;
 }
 
 /** 룸 참가 데이터 */
@@ -85,6 +86,13 @@ export interface AgentUpdateData {
   data?: Record<string, unknown>;
 }
 
+/** 에이전트 LLM 토큰 델타 데이터 */
+export interface AgentDeltaData {
+  turnId?: string;
+  node?: string;
+  delta?: string;
+}
+
 /** 에이전트 상태 데이터 */
 export interface AgentStatusData {
   task?: string;
@@ -139,6 +147,7 @@ export type OnErrorCallback = (error: Error) => void;
 export type OnTranscriptCallback = (data: TranscriptData) => void;
 export type OnAgentReadyCallback = (data: Record<string, unknown>) => void;
 export type OnAgentUpdateCallback = (data: AgentUpdateData) => void;
+export type OnAgentDeltaCallback = (data: AgentDeltaData) => void;
 export type OnAgentStatusCallback = (data: AgentStatusData) => void;
 export type OnAgentConsultationCallback = (data: AgentConsultationData) => void;
 export type OnSessionEndedCallback = (data: SessionEndedData) => void;
@@ -180,6 +189,7 @@ export class WebRTCClient {
   public onTranscript: OnTranscriptCallback | null = null;
   public onAgentReady: OnAgentReadyCallback | null = null;
   public onAgentUpdate: OnAgentUpdateCallback | null = null;
+  public onAgentDelta: OnAgentDeltaCallback | null = null;
   public onAgentStatus: OnAgentStatusCallback | null = null;
   public onAgentConsultation: OnAgentConsultationCallback | null = null;
   public onSessionEnded: OnSessionEndedCallback | null = null;
@@ -381,6 +391,17 @@ export class WebRTCClient {
         }
         break;
 
+      case 'agent_delta':
+        // 토큰 단위로 자주 도착하므로 로그 생략
+        if (this.onAgentDelta) {
+          this.onAgentDelta({
+            turnId: message.turn_id,
+            node: message.node,
+            delta: message.delta
+          });
+        }
+        break;
+
       case 'agent_status':
         logger.debug('Agent status:', (data as AgentStatusData).status);
         if (this.onAgentStatus) this.onAgentStatus(data as AgentStatusData);
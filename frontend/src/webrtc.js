@@ -114,6 +114,7 @@ export class WebRTCClient {
     this.onLocalStream = null; // 로컬 스트림 획득 콜백
     this.onAgentConsultation = null; // 상담 가이드 결과
     this.onAgentStatus = null; // 상담 진행 상태
+    this.onAgentDelta = null; // 에이전트 LLM 토큰 델타 콜백
     this.onSessionEnded = null; // 세션 종료 결과 콜백
 
     // Prefetch TURN 자격 증명 on construction
@@ -355,6 +356,17 @@ export class WebRTCClient {
         }
         break;
 
+      case 'agent_delta':
+        // 토큰 단위로 자주 도착하므로 로그 생략
+        if (this.onAgentDelta) {
+          this.onAgentDelta({
+            turnId: message.turn_id,
+            node: message.node,
+            delta: message.delta
+          });
+        }
+        break;
+
       case 'agent_status':
         logger.debug('Agent status:', data.status);
         if (this.onAgentStatus) this.onAgentStatus(data);